@@ -0,0 +1 @@
+"""Offline performance benchmarks (fake model, fake backend). See ``run.py``."""
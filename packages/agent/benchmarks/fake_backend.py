@@ -0,0 +1,300 @@
+"""In-process fake of the backend's /projects and /tickets API.
+
+Served through ``httpx.MockTransport``, so ``APIClient`` runs its real
+request path (retries, caching, coalescing) with no network. Responses
+follow the backend's shapes: ``{"data": ...}`` envelopes, camelCase
+fields, paginated ticket lists, 201/204 statuses and ETag revalidation.
+"""
+
+import asyncio
+import hashlib
+import json
+import random
+import uuid
+from collections import Counter
+from collections.abc import Iterator
+from contextlib import contextmanager
+from contextvars import ContextVar
+from datetime import UTC, datetime, timedelta
+from typing import Any, Optional
+from urllib.parse import parse_qs
+
+import httpx
+
+STATUSES = ("TODO", "IN_PROGRESS", "DONE", "BLOCKED")
+PRIORITIES = ("LOW", "MEDIUM", "HIGH", "CRITICAL")
+PRIORITY_RANK = {p: i for i, p in enumerate(PRIORITIES)}
+MAX_LIMIT = 100
+
+_WORDS = (
+    "login", "checkout", "search", "profile", "export", "billing", "cache", "upload",
+    "report", "dashboard", "email", "session", "invite", "webhook", "import", "audit",
+)
+_KINDS = ("Fix", "Add", "Refactor", "Investigate", "Document", "Speed up")
+
+_requests: ContextVar[Optional[Counter[str]]] = ContextVar("backend_requests", default=None)
+
+
+@contextmanager
+def count_requests() -> Iterator[Counter[str]]:
+    """Count backend requests made by the current task (and tasks it starts)."""
+    counter: Counter[str] = Counter()
+    token = _requests.set(counter)
+    try:
+        yield counter
+    finally:
+        _requests.reset(token)
+
+
+class HTTPError(Exception):
+    """An error response (status and message)."""
+
+    def __init__(self, status: int, message: str):
+        super().__init__(message)
+        self.status = status
+
+
+def _iso(moment: datetime) -> str:
+    return moment.isoformat(timespec="milliseconds").replace("+00:00", "Z")
+
+
+class FakeBackend:
+    """Projects and tickets in memory, with configurable latency."""
+
+    def __init__(self, latency: float = 0.0, jitter: float = 0.0, seed: int = 0):
+        """Initialize the backend.
+
+        Args:
+            latency: Seconds each request takes
+            jitter: Extra random seconds (uniform 0..jitter) added per request
+            seed: Random seed for the dataset and jitter
+        """
+        self.latency = latency
+        self.jitter = jitter
+        self.rng = random.Random(seed)
+        self.projects: dict[str, dict[str, Any]] = {}
+        self.tickets: dict[str, dict[str, Any]] = {}
+        self.requests: Counter[str] = Counter()
+        self._clock = datetime(2025, 1, 1, tzinfo=UTC)
+
+    def _now(self) -> str:
+        # Strictly increasing timestamps keep updatedAt ordering deterministic
+        self._clock += timedelta(milliseconds=1)
+        return _iso(self._clock)
+
+    # ---------- Dataset ----------
+
+    def seed(self, projects: int, tickets_per_project: int) -> None:
+        """Create ``projects`` projects (keys P1, P2, ...) with generated tickets.
+
+        Ticket titles are "<KEY>-<n> <kind> <word> <word>", so scenarios can
+        refer to them by title.
+        """
+        for p in range(1, projects + 1):
+            project = self._add_project(f"Project {p}", f"P{p}", f"Generated project {p}")
+            for n in range(1, tickets_per_project + 1):
+                words = self.rng.sample(_WORDS, 2)
+                self._add_ticket(
+                    {
+                        "title": f"P{p}-{n} {self.rng.choice(_KINDS)} {words[0]} {words[1]}",
+                        "description": f"Tickets about {words[0]} and {words[1]}.",
+                        "status": self.rng.choice(STATUSES),
+                        "priority": self.rng.choice(PRIORITIES),
+                        "projectId": project["id"],
+                    }
+                )
+
+    def _add_project(self, name: str, key: str, description: Optional[str]) -> dict[str, Any]:
+        now = self._now()
+        project = {
+            "id": str(uuid.UUID(int=self.rng.getrandbits(128), version=4)),
+            "name": name,
+            "key": key,
+            "description": description,
+            "createdAt": now,
+            "updatedAt": now,
+        }
+        self.projects[project["id"]] = project
+        return project
+
+    def _add_ticket(self, data: dict[str, Any]) -> dict[str, Any]:
+        if data.get("projectId") not in self.projects:
+            raise HTTPError(404, "Project not found")
+        if not data.get("title"):
+            raise HTTPError(400, "title is required")
+        status = data.get("status", "TODO")
+        now = self._now()
+        ticket = {
+            "id": str(uuid.UUID(int=self.rng.getrandbits(128), version=4)),
+            "title": data["title"],
+            "description": data.get("description"),
+            "status": status,
+            "priority": data.get("priority", "MEDIUM"),
+            "position": self._top_position(data["projectId"], status),
+            "projectId": data["projectId"],
+            "assigneeId": data.get("assigneeId"),
+            "source": "MANUAL",
+            "sourceUrl": None,
+            "createdAt": now,
+            "updatedAt": now,
+        }
+        self.tickets[ticket["id"]] = ticket
+        return ticket
+
+    def _top_position(self, project_id: str, status: str, exclude: str = "") -> float:
+        positions = [
+            t["position"]
+            for t in self.tickets.values()
+            if t["projectId"] == project_id and t["status"] == status and t["id"] != exclude
+        ]
+        return min(positions) / 2 if positions else 1000.0
+
+    # ---------- Transport ----------
+
+    def transport(self) -> httpx.MockTransport:
+        """Transport for ``APIClient(transport=...)``."""
+        return httpx.MockTransport(self.handle)
+
+    async def handle(self, request: httpx.Request) -> httpx.Response:
+        """Serve one request."""
+        delay = self.latency + (self.rng.uniform(0, self.jitter) if self.jitter else 0.0)
+        if delay:
+            await asyncio.sleep(delay)
+
+        segments = [s for s in request.url.path.split("/") if s]
+        route = "/" + "/".join(
+            ":id" if i == 1 and s != "counts" else s for i, s in enumerate(segments)
+        )
+        endpoint = f"{request.method} {route}"
+        self.requests[endpoint] += 1
+        counter = _requests.get()
+        if counter is not None:
+            counter[endpoint] += 1
+
+        query = {k: v[-1] for k, v in parse_qs(request.url.query.decode()).items()}
+        body = json.loads(request.content) if request.content else {}
+        try:
+            status, payload = self._route(request.method, segments, query, body)
+        except HTTPError as e:
+            return httpx.Response(e.status, json={"error": str(e)})
+        if payload is None:
+            return httpx.Response(status)
+
+        content = json.dumps({"data": payload}).encode()
+        headers = {"Content-Type": "application/json"}
+        if request.method == "GET":
+            etag = '"' + hashlib.blake2b(content, digest_size=12).hexdigest() + '"'
+            headers["ETag"] = etag
+            if request.headers.get("If-None-Match") == etag:
+                return httpx.Response(304, headers={"ETag": etag})
+        return httpx.Response(status, content=content, headers=headers)
+
+    def _route(
+        self, method: str, segments: list[str], query: dict[str, str], body: Any
+    ) -> tuple[int, Any]:
+        match (method, segments):
+            case ("GET", ["health"]):
+                return 200, {"status": "ok"}
+            case ("GET", ["projects"]):
+                return 200, sorted(self.projects.values(), key=lambda p: p["createdAt"])
+            case ("POST", ["projects"]):
+                if any(p["key"] == body.get("key") for p in self.projects.values()):
+                    raise HTTPError(409, "Project key already exists")
+                return 201, self._add_project(body["name"], body["key"], body.get("description"))
+            case ("GET", ["projects", project_id]):
+                return 200, self._project(project_id)
+            case ("DELETE", ["projects", project_id]):
+                self._project(project_id)
+                del self.projects[project_id]
+                self.tickets = {
+                    k: t for k, t in self.tickets.items() if t["projectId"] != project_id
+                }
+                return 204, None
+            case ("GET", ["tickets"]):
+                return 200, self._list_tickets(query)
+            case ("GET", ["tickets", "counts"]):
+                return 200, self._counts(query.get("projectId"))
+            case ("POST", ["tickets"]):
+                return 201, self._add_ticket(body)
+            case ("GET", ["tickets", ticket_id]):
+                return 200, self._ticket(ticket_id)
+            case ("PUT", ["tickets", ticket_id]):
+                ticket = self._ticket(ticket_id)
+                ticket.update({k: v for k, v in body.items() if k in ticket and k != "id"})
+                ticket["updatedAt"] = self._now()
+                return 200, ticket
+            case ("PATCH", ["tickets", ticket_id, "reorder"]):
+                ticket = self._ticket(ticket_id)
+                status = body.get("status") or ticket["status"]
+                position = body.get("position")
+                if position is None:
+                    position = self._top_position(ticket["projectId"], status, exclude=ticket_id)
+                ticket.update(status=status, position=position, updatedAt=self._now())
+                return 200, ticket
+            case ("DELETE", ["tickets", ticket_id]):
+                self._ticket(ticket_id)
+                del self.tickets[ticket_id]
+                return 204, None
+        raise HTTPError(404, "Not found")
+
+    def _project(self, project_id: str) -> dict[str, Any]:
+        project = self.projects.get(project_id)
+        if project is None:
+            raise HTTPError(404, "Project not found")
+        return project
+
+    def _ticket(self, ticket_id: str) -> dict[str, Any]:
+        ticket = self.tickets.get(ticket_id)
+        if ticket is None:
+            raise HTTPError(404, "Ticket not found")
+        return ticket
+
+    def _list_tickets(self, query: dict[str, str]) -> dict[str, Any]:
+        items = list(self.tickets.values())
+        for field in ("projectId", "status", "priority", "assigneeId"):
+            if query.get(field):
+                items = [t for t in items if t[field] == query[field]]
+        if query.get("updatedSince"):
+            since = datetime.fromisoformat(query["updatedSince"])
+            items = [t for t in items if datetime.fromisoformat(t["updatedAt"]) >= since]
+        if query.get("search"):
+            needle = query["search"].lower()
+            items = [
+                t
+                for t in items
+                if needle in t["title"].lower() or needle in (t["description"] or "").lower()
+            ]
+
+        # Same order as the backend's getAll: the priority sort is raw SQL
+        # (priority, then newest first); every other sort is secondary to the
+        # board order, status (a plain string column) then position. Python's
+        # sort is stable, so the least significant key is applied first.
+        sort_by = query.get("sortBy", "createdAt")
+        descending = query.get("sortOrder", "desc") == "desc"
+        if sort_by == "priority":
+            items.sort(key=lambda t: t["createdAt"], reverse=True)
+            items.sort(key=lambda t: PRIORITY_RANK[t["priority"]], reverse=descending)
+        else:
+            items.sort(key=lambda t: (t.get(sort_by) or "", t["id"]), reverse=descending)
+            items.sort(key=lambda t: (t["status"], t["position"]))
+
+        limit = min(int(query.get("limit", 20)), MAX_LIMIT)
+        page = int(query.get("page", 1))
+        start = (page - 1) * limit
+        return {
+            "items": items[start : start + limit],
+            "total": len(items),
+            "page": page,
+            "pageSize": limit,
+        }
+
+    def _counts(self, project_id: Optional[str]) -> list[dict[str, Any]]:
+        counts: Counter[tuple[str, str]] = Counter(
+            (t["projectId"], t["status"])
+            for t in self.tickets.values()
+            if not project_id or t["projectId"] == project_id
+        )
+        return [
+            {"projectId": pid, "status": status, "count": count}
+            for (pid, status), count in sorted(counts.items())
+        ]
@@ -0,0 +1,119 @@
+"""Scripted stand-in for Gemini.
+
+``ScriptedLlm`` plugs into the ADK agent like any model, but answers from
+a script keyed by the user's message: a fixed sequence of tool-call steps
+followed by a final reply. Which step comes next is read from the request
+itself (the tool results since the user's message), so concurrent turns
+and sessions don't interfere. Nothing leaves the process.
+"""
+
+import asyncio
+from collections.abc import AsyncGenerator, Iterator
+from contextlib import contextmanager
+from contextvars import ContextVar
+from typing import Any, Optional
+
+from google.adk.models import BaseLlm, LlmRequest, LlmResponse
+from google.genai import types
+
+from .scenarios import Scenario
+
+_calls: ContextVar[Optional[list[int]]] = ContextVar("model_calls", default=None)
+
+UNKNOWN_REPLY = "Sorry, I don't have a script for that."
+
+
+@contextmanager
+def count_calls() -> Iterator[list[int]]:
+    """Count model calls made by the current task (and tasks it starts).
+
+    Yields a one-element list holding the count.
+    """
+    counter = [0]
+    token = _calls.set(counter)
+    try:
+        yield counter
+    finally:
+        _calls.reset(token)
+
+
+def _estimate_tokens(contents: list[types.Content]) -> int:
+    chars = 0
+    for content in contents:
+        for part in content.parts or []:
+            if part.text:
+                chars += len(part.text)
+            elif part.function_call or part.function_response:
+                chars += len(str(part.function_call or part.function_response))
+    return chars // 4
+
+
+class ScriptedLlm(BaseLlm):
+    """A model that replays scenario scripts with configurable latency."""
+
+    model: str = "scripted"
+    scenarios: dict[str, Any] = {}  # user message -> Scenario
+    latency: float = 0.0  # Seconds before each response
+    chunk_words: int = 4  # Words per partial response when streaming
+
+    @classmethod
+    def supported_models(cls) -> list[str]:
+        return [r"scripted.*"]
+
+    @classmethod
+    def for_scenarios(cls, scenarios: list[Scenario], latency: float = 0.0) -> "ScriptedLlm":
+        return cls(scenarios={s.message: s for s in scenarios}, latency=latency)
+
+    def _next_step(self, contents: list[types.Content]) -> tuple[Optional[Scenario], int]:
+        """The scenario of the current turn and how many tool steps it has done."""
+        steps_done = 0
+        for content in reversed(contents):
+            parts = content.parts or []
+            if content.role == "user" and any(p.text for p in parts):
+                message = next(p.text for p in parts if p.text).strip()
+                return self.scenarios.get(message), steps_done
+            if content.role == "model" and any(p.function_call for p in parts):
+                steps_done += 1
+        return None, steps_done
+
+    async def generate_content_async(
+        self, llm_request: LlmRequest, stream: bool = False
+    ) -> AsyncGenerator[LlmResponse, None]:
+        counter = _calls.get()
+        if counter is not None:
+            counter[0] += 1
+        if self.latency:
+            await asyncio.sleep(self.latency)
+
+        scenario, steps_done = self._next_step(llm_request.contents)
+        usage = types.GenerateContentResponseUsageMetadata(
+            prompt_token_count=_estimate_tokens(llm_request.contents)
+        )
+
+        if scenario is not None and steps_done < len(scenario.steps):
+            calls = [
+                types.Part(function_call=types.FunctionCall(name=name, args=dict(args)))
+                for name, args in scenario.steps[steps_done]
+            ]
+            usage.candidates_token_count = 8 * len(calls)
+            yield LlmResponse(
+                content=types.Content(role="model", parts=calls), usage_metadata=usage
+            )
+            return
+
+        reply = scenario.reply if scenario is not None else UNKNOWN_REPLY
+        usage.candidates_token_count = len(reply) // 4
+        if stream:
+            words = reply.split(" ")
+            for i in range(0, len(words), self.chunk_words):
+                chunk = " ".join(words[i : i + self.chunk_words])
+                if i + self.chunk_words < len(words):
+                    chunk += " "
+                yield LlmResponse(
+                    content=types.Content(role="model", parts=[types.Part(text=chunk)]),
+                    partial=True,
+                )
+        yield LlmResponse(
+            content=types.Content(role="model", parts=[types.Part(text=reply)]),
+            usage_metadata=usage,
+        )
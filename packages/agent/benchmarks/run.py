@@ -0,0 +1,434 @@
+"""Offline benchmark for the agent and the backend client.
+
+Drives ``TaskAgentService`` with a scripted model and ``APIClient`` with
+an in-process fake backend, then reports latency percentiles, throughput,
+backend requests and model calls per turn, and memory. No network or API
+key is needed.
+
+Run from packages/agent:
+
+    python -m benchmarks.run
+    python -m benchmarks.run --turns 500 --concurrency 16 --backend-latency-ms 20
+    python -m benchmarks.run --json results.json
+    python -m benchmarks.run --baseline results.json  # Exit 1 on regressions
+"""
+
+import argparse
+import asyncio
+import json
+import logging
+import random
+import sys
+import time
+import tracemalloc
+from collections import Counter
+from collections.abc import Awaitable, Callable
+from dataclasses import dataclass, field
+from typing import Any, Optional
+
+from src.api.client import APIClient
+from src.config import settings
+
+from .fake_backend import FakeBackend, count_requests
+from .scenarios import Scenario, build_scenarios
+
+logger = logging.getLogger("benchmarks")
+
+BASE_URL = "http://fake-backend"
+
+
+@dataclass
+class Samples:
+    """Measurements of one scenario or client operation."""
+
+    latencies: list[float] = field(default_factory=list)
+    first_text: list[float] = field(default_factory=list)
+    requests: list[int] = field(default_factory=list)
+    model_calls: list[int] = field(default_factory=list)
+    endpoints: Counter[str] = field(default_factory=Counter)
+    errors: int = 0
+
+
+def percentile(values: list[float], q: float) -> float:
+    """Nearest-rank percentile of ``values`` (q in 0..100)."""
+    if not values:
+        return 0.0
+    ordered = sorted(values)
+    rank = max(1, round(q / 100 * len(ordered)))
+    return ordered[min(rank, len(ordered)) - 1]
+
+
+def _mean(values: list[float]) -> float:
+    return sum(values) / len(values) if values else 0.0
+
+
+def summarize(samples: Samples) -> dict[str, Any]:
+    """Percentiles (ms) and per-turn counts for one set of samples."""
+    ms = [latency * 1000 for latency in samples.latencies]
+    summary: dict[str, Any] = {
+        "count": len(ms),
+        "errors": samples.errors,
+        "p50_ms": round(percentile(ms, 50), 2),
+        "p95_ms": round(percentile(ms, 95), 2),
+        "p99_ms": round(percentile(ms, 99), 2),
+        "mean_ms": round(_mean(ms), 2),
+        "requests_per_turn": round(_mean(samples.requests), 2),
+        "endpoints": dict(sorted(samples.endpoints.items())),
+    }
+    if samples.model_calls:
+        summary["model_calls_per_turn"] = round(_mean(samples.model_calls), 2)
+    if samples.first_text:
+        summary["first_text_p50_ms"] = round(percentile(samples.first_text, 50) * 1000, 2)
+        summary["first_text_p95_ms"] = round(percentile(samples.first_text, 95) * 1000, 2)
+    return summary
+
+
+def memory_stats() -> dict[str, float]:
+    """Peak traced allocations (with --tracemalloc) and peak RSS, in MB."""
+    stats: dict[str, float] = {}
+    if tracemalloc.is_tracing():
+        stats["traced_peak_mb"] = round(tracemalloc.get_traced_memory()[1] / 2**20, 2)
+    try:
+        import resource
+    except ImportError:  # Windows
+        return stats
+    max_rss = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # Kilobytes on Linux, bytes on macOS
+    stats["max_rss_mb"] = round(max_rss / (2**20 if sys.platform == "darwin" else 2**10), 2)
+    return stats
+
+
+async def _run_workers(
+    work: list[Any], concurrency: int, run: Callable[[int, Any], Awaitable[None]]
+) -> float:
+    """Run ``run(worker, item)`` over ``work`` with ``concurrency`` workers.
+
+    Returns:
+        Wall-clock seconds
+    """
+    queue: asyncio.Queue[Any] = asyncio.Queue()
+    for item in work:
+        queue.put_nowait(item)
+
+    async def worker(index: int) -> None:
+        while not queue.empty():
+            await run(index, queue.get_nowait())
+
+    started = time.perf_counter()
+    await asyncio.gather(*(worker(i) for i in range(concurrency)))
+    return time.perf_counter() - started
+
+
+# ==================== Agent ====================
+
+
+async def _agent_turn(
+    service: Any, scenario: Scenario, user_id: str, session_id: Optional[str], stream: bool
+) -> tuple[float, Optional[float], Counter[str], int, Optional[str]]:
+    """One chat turn: (latency, time to first text, backend requests, model calls, session)."""
+    from .fake_llm import count_calls
+
+    first_text = None
+    with count_requests() as requests, count_calls() as calls:
+        started = time.perf_counter()
+        if stream:
+            async for chunk in service.chat_stream(scenario.message, user_id, session_id):
+                if first_text is None and chunk["type"] == "text":
+                    first_text = time.perf_counter() - started
+                elif chunk["type"] == "done":
+                    session_id = chunk["session_id"]
+        else:
+            result = await service.chat(scenario.message, user_id, session_id)
+            session_id = result["session_id"]
+        latency = time.perf_counter() - started
+    return latency, first_text, requests, calls[0], session_id
+
+
+async def run_agent(args: argparse.Namespace, backend: FakeBackend) -> dict[str, Any]:
+    """Benchmark full chat turns through TaskAgentService."""
+    # Imported here so the client suite runs without google-adk installed
+    from src.agent.task_agent import TaskAgentService
+
+    from .fake_llm import ScriptedLlm
+
+    scenarios = build_scenarios(backend)
+    if args.scenarios:
+        scenarios = [s for s in scenarios if s.name in args.scenarios]
+        if not scenarios:
+            raise SystemExit(f"No scenarios match {args.scenarios}")
+
+    settings.fast_path_enabled = args.fast_path
+    if not args.reply_cache:
+        settings.agent_response_cache_size = 0
+    settings.backend_warm_connections = 0
+
+    client = APIClient.from_settings(settings, base_url=BASE_URL, transport=backend.transport())
+    service = TaskAgentService(
+        model=ScriptedLlm.for_scenarios(scenarios, latency=args.model_latency_ms / 1000),
+        api_client=client,
+    )
+    await service.start()
+
+    samples = {scenario.name: Samples() for scenario in scenarios}
+    sessions: dict[str, Optional[str]] = {}
+
+    async def run(worker: int, scenario: Scenario) -> None:
+        # Each worker is one user with one ongoing session
+        user_id = f"bench-user-{worker}"
+        stats = samples[scenario.name]
+        try:
+            latency, first_text, requests, calls, sid = await _agent_turn(
+                service, scenario, user_id, sessions.get(user_id), args.stream
+            )
+        except Exception:
+            logger.exception(f"Turn failed: {scenario.name}")
+            stats.errors += 1
+            return
+        sessions[user_id] = sid
+        stats.latencies.append(latency)
+        if first_text is not None:
+            stats.first_text.append(first_text)
+        stats.requests.append(sum(requests.values()))
+        stats.endpoints.update(requests)
+        stats.model_calls.append(calls)
+
+    try:
+        for scenario in scenarios:  # Warm-up, not measured
+            await _agent_turn(service, scenario, "bench-warmup", None, args.stream)
+        work = [scenarios[i % len(scenarios)] for i in range(args.turns)]
+        elapsed = await _run_workers(work, args.concurrency, run)
+    finally:
+        await service.close()
+
+    completed = sum(len(s.latencies) for s in samples.values())
+    return {
+        "turns": completed,
+        "elapsed_s": round(elapsed, 3),
+        "throughput_per_s": round(completed / elapsed, 2) if elapsed else 0.0,
+        "overall": summarize(_merge(samples.values())),
+        "scenarios": {name: summarize(stats) for name, stats in samples.items()},
+        "fast_path": service.router.stats(),
+        "reply_cache": service.replies.stats(),
+    }
+
+
+def _merge(all_samples: Any) -> Samples:
+    merged = Samples()
+    for samples in all_samples:
+        merged.latencies += samples.latencies
+        merged.first_text += samples.first_text
+        merged.requests += samples.requests
+        merged.model_calls += samples.model_calls
+        merged.endpoints.update(samples.endpoints)
+        merged.errors += samples.errors
+    return merged
+
+
+# ==================== Client ====================
+
+
+def _client_ops(backend: FakeBackend, rng: random.Random) -> dict[str, Callable[..., Awaitable]]:
+    project_ids = list(backend.projects)
+    ticket_ids = list(backend.tickets)
+
+    async def scan_all(client: APIClient) -> None:
+        async for _ in client.iter_tickets():
+            pass
+
+    return {
+        "list_tickets": lambda c: c.list_tickets(project_id=rng.choice(project_ids)),
+        "get_ticket": lambda c: c.get_ticket(rng.choice(ticket_ids)),
+        "search_tickets": lambda c: c.search_tickets("checkout"),
+        "board_summary": lambda c: c.get_board_summary(),
+        "project_by_key": lambda c: c.get_project_by_name(backend.projects[project_ids[0]]["key"]),
+        "scan_all": scan_all,
+    }
+
+
+async def run_client(args: argparse.Namespace, backend: FakeBackend) -> dict[str, Any]:
+    """Benchmark APIClient operations on their own."""
+    client = APIClient.from_settings(settings, base_url=BASE_URL, transport=backend.transport())
+    ops = _client_ops(backend, random.Random(args.seed))
+    samples = {name: Samples() for name in ops}
+
+    async def run(worker: int, name: str) -> None:
+        stats = samples[name]
+        with count_requests() as requests:
+            started = time.perf_counter()
+            try:
+                await ops[name](client)
+            except Exception:
+                logger.exception(f"Client operation failed: {name}")
+                stats.errors += 1
+                return
+            stats.latencies.append(time.perf_counter() - started)
+        stats.requests.append(sum(requests.values()))
+        stats.endpoints.update(requests)
+
+    try:
+        work = [name for _ in range(args.client_ops) for name in ops]
+        elapsed = await _run_workers(work, args.concurrency, run)
+    finally:
+        await client.close()
+
+    completed = sum(len(s.latencies) for s in samples.values())
+    return {
+        "operations": completed,
+        "elapsed_s": round(elapsed, 3),
+        "throughput_per_s": round(completed / elapsed, 2) if elapsed else 0.0,
+        "ops": {name: summarize(stats) for name, stats in samples.items()},
+        "coalesced_gets": client.coalesced_gets,
+        "caches": client.cache_stats(),
+    }
+
+
+# ==================== Reporting ====================
+
+
+def _print_table(title: str, rows: dict[str, dict[str, Any]]) -> None:
+    print(f"\n{title}")
+    print(
+        f"  {'name':<18}{'n':>6}{'err':>5}{'p50 ms':>10}{'p95 ms':>10}{'p99 ms':>10}"
+        f"{'req/turn':>10}{'model/turn':>12}"
+    )
+    for name, row in rows.items():
+        print(
+            f"  {name:<18}{row['count']:>6}{row['errors']:>5}{row['p50_ms']:>10}"
+            f"{row['p95_ms']:>10}{row['p99_ms']:>10}{row['requests_per_turn']:>10}"
+            f"{row.get('model_calls_per_turn', '-'):>12}"
+        )
+
+
+def report(results: dict[str, Any]) -> None:
+    """Print results as tables."""
+    config = results["config"]
+    print(
+        f"dataset: {config['projects']} projects x {config['tickets']} tickets, "
+        f"backend latency {config['backend_latency_ms']} ms, "
+        f"model latency {config['model_latency_ms']} ms, concurrency {config['concurrency']}"
+    )
+    if "agent" in results:
+        agent = results["agent"]
+        _print_table(
+            f"agent ({'stream' if config['stream'] else 'chat'}): {agent['turns']} turns, "
+            f"{agent['throughput_per_s']} turns/s",
+            {**agent["scenarios"], "ALL": agent["overall"]},
+        )
+        first_text = agent["overall"].get("first_text_p50_ms")
+        if first_text is not None:
+            p95 = agent["overall"]["first_text_p95_ms"]
+            print(f"  first text p50 {first_text} ms, p95 {p95} ms")
+    if "client" in results:
+        client = results["client"]
+        _print_table(
+            f"client: {client['operations']} operations, {client['throughput_per_s']} ops/s, "
+            f"{client['coalesced_gets']} coalesced GETs",
+            client["ops"],
+        )
+    print(f"\nmemory: {results['memory']}")
+
+
+def compare(results: dict[str, Any], baseline: dict[str, Any], tolerance: float) -> list[str]:
+    """Regressions against a baseline run: slower p95 or more requests per turn."""
+    regressions = []
+    for suite, key in (("agent", "scenarios"), ("client", "ops")):
+        current = results.get(suite, {}).get(key, {})
+        previous = baseline.get(suite, {}).get(key, {})
+        for name, row in current.items():
+            base = previous.get(name)
+            if base is None:
+                continue
+            if base["p95_ms"] and row["p95_ms"] > base["p95_ms"] * (1 + tolerance):
+                regressions.append(
+                    f"{suite}/{name}: p95 {row['p95_ms']} ms (baseline {base['p95_ms']} ms)"
+                )
+            if row["requests_per_turn"] > base["requests_per_turn"] * (1 + tolerance):
+                regressions.append(
+                    f"{suite}/{name}: {row['requests_per_turn']} requests per turn "
+                    f"(baseline {base['requests_per_turn']})"
+                )
+    return regressions
+
+
+# ==================== CLI ====================
+
+
+def parse_args(argv: Optional[list[str]] = None) -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument("--suite", choices=["all", "agent", "client"], default="all")
+    parser.add_argument("--turns", type=int, default=200, help="Measured agent turns")
+    parser.add_argument("--client-ops", type=int, default=50, help="Runs of each client operation")
+    parser.add_argument("--concurrency", type=int, default=8, help="Concurrent users / workers")
+    parser.add_argument("--projects", type=int, default=5)
+    parser.add_argument("--tickets", type=int, default=200, help="Tickets per project")
+    parser.add_argument("--backend-latency-ms", type=float, default=5.0)
+    parser.add_argument("--backend-jitter-ms", type=float, default=0.0)
+    parser.add_argument("--model-latency-ms", type=float, default=50.0)
+    parser.add_argument("--stream", action="store_true", help="Use chat_stream instead of chat")
+    parser.add_argument("--scenarios", nargs="*", help="Only run these agent scenarios")
+    parser.add_argument(
+        "--no-fast-path",
+        dest="fast_path",
+        action="store_false",
+        help="Send every turn to the model",
+    )
+    parser.add_argument(
+        "--no-reply-cache", dest="reply_cache", action="store_false", help="Disable reply reuse"
+    )
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--tracemalloc", action="store_true", help="Trace Python allocations")
+    parser.add_argument("--json", metavar="PATH", help="Write results as JSON")
+    parser.add_argument("--baseline", metavar="PATH", help="Compare against a previous --json run")
+    parser.add_argument(
+        "--tolerance", type=float, default=0.2, help="Allowed regression (0.2 = 20%%)"
+    )
+    return parser.parse_args(argv)
+
+
+async def run(args: argparse.Namespace) -> dict[str, Any]:
+    """Run the selected suites, each against a freshly seeded backend."""
+    results: dict[str, Any] = {"config": vars(args).copy()}
+
+    def seeded_backend() -> FakeBackend:
+        backend = FakeBackend(
+            latency=args.backend_latency_ms / 1000,
+            jitter=args.backend_jitter_ms / 1000,
+            seed=args.seed,
+        )
+        backend.seed(args.projects, args.tickets)
+        return backend
+
+    if args.tracemalloc:
+        tracemalloc.start()
+    if args.suite in ("all", "agent"):
+        results["agent"] = await run_agent(args, seeded_backend())
+    if args.suite in ("all", "client"):
+        results["client"] = await run_client(args, seeded_backend())
+    results["memory"] = memory_stats()
+    return results
+
+
+def main(argv: Optional[list[str]] = None) -> int:
+    args = parse_args(argv)
+    logging.basicConfig(level=logging.WARNING, format="%(levelname)s %(name)s: %(message)s")
+    logging.getLogger("src").setLevel(logging.WARNING)
+
+    results = asyncio.run(run(args))
+    report(results)
+    if args.json:
+        with open(args.json, "w", encoding="utf-8") as f:
+            json.dump(results, f, indent=2)
+    if args.baseline:
+        with open(args.baseline, encoding="utf-8") as f:
+            regressions = compare(results, json.load(f), args.tolerance)
+        if regressions:
+            print("\nRegressions:")
+            for regression in regressions:
+                print(f"  {regression}")
+            return 1
+        print("\nNo regressions against baseline")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,120 @@
+"""Benchmark conversations: a user message and the tool calls the model makes for it."""
+
+from dataclasses import dataclass
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    from .fake_backend import FakeBackend
+
+ToolCall = tuple[str, dict[str, Any]]
+
+
+@dataclass(frozen=True)
+class Scenario:
+    """One scripted turn.
+
+    ``steps`` are the model's successive responses before the final reply;
+    each step calls one or more tools at once.
+    """
+
+    name: str
+    message: str
+    steps: tuple[tuple[ToolCall, ...], ...]
+    reply: str
+
+
+def build_scenarios(backend: "FakeBackend") -> list[Scenario]:
+    """Scenarios referring to projects and tickets of a seeded backend."""
+    keys = [p["key"] for p in backend.projects.values()]
+    if not keys:
+        raise ValueError("Seed the backend before building scenarios")
+    first, second, third = (keys * 3)[:3]
+    second_project = next(p["id"] for p in backend.projects.values() if p["key"] == second)
+    # The ticket the model picks from the critical list in the triage scenario
+    critical = [
+        t
+        for t in backend.tickets.values()
+        if t["projectId"] == second_project and t["priority"] == "CRITICAL"
+    ]
+
+    scenarios = [
+        Scenario(
+            name="board",
+            message="How does the board look across all projects?",
+            steps=((("get_board_summary", {}),),),
+            reply="Here is the board: most work is in TODO, a few tickets are blocked.",
+        ),
+        Scenario(
+            name="fast_path_board",
+            message="show the board",  # Answered by the command router when enabled
+            steps=((("get_board_summary", {}),),),
+            reply="Here is the board summary.",
+        ),
+        Scenario(
+            name="list",
+            message=f"What is in progress in {first}?",
+            steps=((("list_tickets", {"project_id": first, "status": "IN_PROGRESS"}),),),
+            reply=f"These tickets are in progress in {first}.",
+        ),
+        Scenario(
+            name="search",
+            message="Find tickets about checkout",
+            steps=((("search_tickets", {"query": "checkout"}),),),
+            reply="I found several tickets mentioning checkout.",
+        ),
+        Scenario(
+            name="compare",
+            message=f"Compare the boards of {first} and {second}",
+            steps=(
+                (
+                    ("get_board_summary", {"project_id": first}),
+                    ("get_board_summary", {"project_id": second}),
+                ),
+            ),
+            reply=f"{first} has more open work than {second}.",
+        ),
+        Scenario(
+            name="create",
+            message=f"File a high priority bug in {first}: exports time out",
+            steps=(
+                (
+                    (
+                        "create_ticket",
+                        {
+                            "title": "Exports time out",
+                            "priority": "HIGH",
+                            "project_id": first,
+                        },
+                    ),
+                ),
+            ),
+            reply=f"Created a HIGH priority ticket in {first}.",
+        ),
+        Scenario(
+            name="bulk_update",
+            message=f"Raise every blocked ticket in {third} to HIGH priority",
+            steps=(
+                (
+                    (
+                        "bulk_update_tickets",
+                        {"project_id": third, "status": "BLOCKED", "new_priority": "HIGH"},
+                    ),
+                ),
+            ),
+            reply=f"Raised the blocked tickets in {third} to HIGH.",
+        ),
+    ]
+    if critical:
+        ticket = critical[0]
+        scenarios.append(
+            Scenario(
+                name="triage",
+                message=f"Show critical tickets in {second} and start the oldest one",
+                steps=(
+                    (("list_tickets", {"project_id": second, "priority": "CRITICAL"}),),
+                    (("move_ticket", {"ticket_id": ticket["id"], "new_status": "IN_PROGRESS"}),),
+                ),
+                reply=f"Listed the critical tickets and moved '{ticket['title']}' to IN_PROGRESS.",
+            )
+        )
+    return scenarios
@@ -1,6 +1,6 @@
 """Agent module."""
 
-from .task_agent import TaskAgentService, APP_NAME
 from .prompts import SYSTEM_PROMPT
+from .task_agent import APP_NAME, TaskAgentService
 
 __all__ = ["TaskAgentService", "APP_NAME", "SYSTEM_PROMPT"]
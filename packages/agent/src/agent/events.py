@@ -0,0 +1,102 @@
+"""Turn event processing shared by the chat and streaming endpoints.
+
+The runner emits function calls and function responses as separate
+events. ``TurnRecorder`` pairs them by call ID in a dict, so each
+response lands on the action that issued it even when the same tool is
+called several times in one turn, and records how long each call took.
+
+With token streaming enabled the runner also emits ``partial`` events
+holding text deltas, followed by one non-partial event with the
+consolidated text. Deltas are forwarded as they arrive and the
+consolidated copy is not sent again.
+"""
+
+import logging
+import time
+from collections import deque
+from typing import Any, Optional
+
+logger = logging.getLogger(__name__)
+
+
+class TurnRecorder:
+    """Collects the actions and text of one agent turn from runner events."""
+
+    def __init__(self) -> None:
+        self.actions: list[dict[str, Any]] = []
+        self.text = ""  # Every text part, as streamed
+        self.final_text = ""  # Text of final-response events only
+        self.invocation_id: Optional[str] = None
+        # call ID -> (action, perf_counter at call time)
+        self._pending: dict[str, tuple[dict[str, Any], float]] = {}
+        # Calls without an ID are matched to responses of the same tool in order
+        self._unnamed: dict[str, deque[str]] = {}
+        # Text already sent as deltas since the last complete event
+        self._streamed = False
+
+    def _call_key(self, call_id: Optional[str], name: str) -> str:
+        if call_id:
+            return call_id
+        key = f"{name}#{len(self.actions)}"
+        self._unnamed.setdefault(name, deque()).append(key)
+        return key
+
+    def _response_key(self, call_id: Optional[str], name: str) -> Optional[str]:
+        if call_id:
+            return call_id
+        queue = self._unnamed.get(name)
+        return queue.popleft() if queue else None
+
+    def process(self, event: Any) -> list[dict[str, Any]]:
+        """Record one runner event.
+
+        Returns:
+            Stream chunks ("tool_call", "tool_result", "text") for the event
+        """
+        logger.debug(f"Event: {event.id}, Author: {event.author}")
+        self.invocation_id = event.invocation_id
+        chunks: list[dict[str, Any]] = []
+        if not (event.content and event.content.parts):
+            return chunks
+
+        if getattr(event, "partial", False):
+            # Token deltas; tool calls are only taken from complete events
+            for part in event.content.parts:
+                if part.text:
+                    self._streamed = True
+                    self.text += part.text
+                    chunks.append({"type": "text", "content": part.text})
+            return chunks
+
+        is_final = event.is_final_response()
+        streamed, self._streamed = self._streamed, False
+        for part in event.content.parts:
+            if part.function_call:
+                call = part.function_call
+                action = {"tool": call.name, "args": dict(call.args) if call.args else {}}
+                self.actions.append(action)
+                self._pending[self._call_key(call.id, call.name)] = (action, time.perf_counter())
+                chunks.append({"type": "tool_call", **action})
+
+            elif part.function_response:
+                resp = part.function_response
+                result = dict(resp.response) if resp.response else {}
+                key = self._response_key(resp.id, resp.name)
+                pending = self._pending.pop(key, None) if key else None
+                chunk: dict[str, Any] = {"type": "tool_result", "tool": resp.name, "result": result}
+                if pending is None:
+                    logger.debug(f"Tool result for {resp.name} without a matching call")
+                else:
+                    action, started = pending
+                    action["result"] = result
+                    action["duration_ms"] = round((time.perf_counter() - started) * 1000, 1)
+                    chunk["duration_ms"] = action["duration_ms"]
+                chunks.append(chunk)
+
+            elif part.text:
+                if is_final:
+                    self.final_text += part.text
+                if not streamed:
+                    self.text += part.text
+                    chunks.append({"type": "text", "content": part.text})
+        return chunks
@@ -0,0 +1,179 @@
+"""Conversation history compaction for model requests.
+
+ADK sends the whole session history to the model on every step. The
+compactor runs as a ``before_model_callback`` and rewrites the request
+contents (the stored session is left untouched):
+
+- The last ``keep_turns`` user turns are sent verbatim.
+- Older turns keep the user's text and the model's reply; their tool
+  calls and results collapse into a one-line summary, dropping the full
+  ticket/project payloads.
+- If the result is still longer than ``max_contents``, the oldest turns
+  are dropped.
+"""
+
+import json
+import logging
+from typing import Any, Optional
+
+from google.adk.agents.callback_context import CallbackContext
+from google.adk.models import LlmRequest, LlmResponse
+from google.genai import types
+
+logger = logging.getLogger(__name__)
+
+# Rough chars-per-token ratio used for savings estimates
+CHARS_PER_TOKEN = 4
+
+
+def _part_chars(part: types.Part) -> int:
+    if part.text:
+        return len(part.text)
+    if part.function_call:
+        args = json.dumps(part.function_call.args or {}, default=str)
+        return len(part.function_call.name or "") + len(args)
+    if part.function_response:
+        return len(json.dumps(part.function_response.response or {}, default=str))
+    return 0
+
+
+def estimate_tokens(contents: list[types.Content]) -> int:
+    """Estimate the prompt tokens used by a list of contents."""
+    chars = sum(_part_chars(p) for c in contents for p in (c.parts or []))
+    return chars // CHARS_PER_TOKEN
+
+
+def _is_user_message(content: types.Content) -> bool:
+    """True for user-typed text (function responses also use the user role)."""
+    parts = content.parts or []
+    return (
+        content.role == "user"
+        and any(p.text for p in parts)
+        and not any(p.function_response for p in parts)
+    )
+
+
+def _split_turns(contents: list[types.Content]) -> list[list[types.Content]]:
+    """Group contents into turns, each starting with a user message."""
+    turns: list[list[types.Content]] = []
+    for content in contents:
+        if not turns or _is_user_message(content):
+            turns.append([])
+        turns[-1].append(content)
+    return turns
+
+
+def _truncate(text: str, limit: int) -> str:
+    text = " ".join(text.split())
+    return text if len(text) <= limit else text[: limit - 1] + "…"
+
+
+def _summarize_result(result: dict[str, Any]) -> str:
+    """One-line summary of a tool result without its payload."""
+    if not result.get("success", True):
+        return f"failed: {result.get('error') or result.get('message') or 'error'}"
+    if result.get("message"):
+        summary = str(result["message"])
+    elif "count" in result:
+        summary = f"{result['count']} item(s)"
+        if "total" in result:
+            summary += f" of {result['total']}"
+    else:
+        summary = "ok"
+    # Keep IDs so the model can still refer back to what it touched
+    for key in ("ticket", "project"):
+        item = result.get(key)
+        if isinstance(item, dict) and item.get("id"):
+            summary += f" [{key} id={item['id']}]"
+    return summary
+
+
+class HistoryCompactor:
+    """Compacts model request history and records the tokens it saved."""
+
+    def __init__(self, keep_turns: int = 6, max_contents: int = 50, summary_chars: int = 200):
+        """Initialize the compactor.
+
+        Args:
+            keep_turns: Most recent user turns sent verbatim
+            max_contents: Hard cap on contents sent to the model
+            summary_chars: Max characters kept from older model replies
+        """
+        self.keep_turns = max(1, keep_turns)
+        self.max_contents = max_contents
+        self.summary_chars = summary_chars
+        # invocation_id -> {"tokens_saved": int, "model_calls": int}
+        self._stats: dict[str, dict[str, int]] = {}
+
+    def _compact_turn(self, turn: list[types.Content]) -> list[types.Content]:
+        user_text = ""
+        model_text = ""
+        calls: dict[str, str] = {}
+        notes: list[str] = []
+
+        for content in turn:
+            for part in content.parts or []:
+                if part.function_call:
+                    call = part.function_call
+                    args = json.dumps(call.args or {}, default=str)
+                    calls[call.id or call.name or ""] = f"{call.name}({_truncate(args, 80)})"
+                elif part.function_response:
+                    resp = part.function_response
+                    label = calls.pop(resp.id or resp.name or "", resp.name or "tool")
+                    notes.append(f"{label} -> {_summarize_result(dict(resp.response or {}))}")
+                elif part.text:
+                    if content.role == "user":
+                        user_text += part.text
+                    else:
+                        model_text += part.text
+
+        compacted = []
+        if user_text:
+            compacted.append(types.Content(role="user", parts=[types.Part(text=user_text)]))
+        reply = []
+        if notes:
+            reply.append("[tools: " + "; ".join(notes) + "]")
+        if model_text:
+            reply.append(_truncate(model_text, self.summary_chars))
+        if reply:
+            text = "\n".join(reply)
+            compacted.append(types.Content(role="model", parts=[types.Part(text=text)]))
+        return compacted
+
+    def compact(self, contents: list[types.Content]) -> list[types.Content]:
+        """Return a compacted copy of the request contents."""
+        turns = _split_turns(contents)
+        if len(turns) <= self.keep_turns and len(contents) <= self.max_contents:
+            return contents
+
+        recent = turns[-self.keep_turns :]
+        older = [self._compact_turn(turn) for turn in turns[: -self.keep_turns]]
+
+        # Drop whole old turns until we fit; recent turns are never cut
+        recent_size = sum(len(turn) for turn in recent)
+        while older and sum(len(turn) for turn in older) + recent_size > self.max_contents:
+            older.pop(0)
+
+        return [c for turn in older for c in turn] + [c for turn in recent for c in turn]
+
+    def before_model(
+        self, callback_context: CallbackContext, llm_request: LlmRequest
+    ) -> Optional[LlmResponse]:
+        """ADK before_model_callback that compacts the request in place."""
+        before = estimate_tokens(llm_request.contents)
+        llm_request.contents = self.compact(llm_request.contents)
+        saved = before - estimate_tokens(llm_request.contents)
+
+        stats = self._stats.setdefault(
+            callback_context.invocation_id, {"tokens_saved": 0, "model_calls": 0}
+        )
+        stats["tokens_saved"] += saved
+        stats["model_calls"] += 1
+        return None
+
+    def pop_stats(self, invocation_id: Optional[str]) -> dict[str, int]:
+        """Take the compaction stats recorded for one invocation (turn)."""
+        empty = {"tokens_saved": 0, "model_calls": 0}
+        if invocation_id is None:
+            return empty
+        return self._stats.pop(invocation_id, empty)
@@ -0,0 +1,106 @@
+"""Compact projections of tickets and projects for tool results.
+
+Tool results go straight into the model context, so by default each tool
+returns only the fields it needs, with long descriptions truncated and
+lists encoded as a column header plus rows. ``get_ticket`` still returns
+the full ticket when the model needs the detail.
+"""
+
+from collections.abc import Iterable, Sequence
+from typing import Any, Optional
+
+from ..api.schemas import Project, Ticket
+
+# Ticket fields returned per tool; None means the full ticket
+DEFAULT_TICKET_FIELDS: dict[str, Optional[tuple[str, ...]]] = {
+    "create_ticket": ("id", "title", "status", "priority", "project_id"),
+    "update_ticket": ("id", "title", "description", "status", "priority"),
+    "move_ticket": ("id", "title", "status"),
+    "list_tickets": ("id", "title", "status", "priority", "project_id"),
+    "search_tickets": ("id", "title", "status", "priority", "project_id", "description"),
+    "get_ticket": None,
+    "bulk_create_tickets": ("id", "title", "status", "priority", "project_id"),
+    "bulk_move_tickets": ("id", "title", "status"),
+    "bulk_update_tickets": ("id", "title", "status", "priority"),
+}
+FALLBACK_TICKET_FIELDS = ("id", "title", "status", "priority", "project_id")
+PROJECT_FIELDS = ("id", "name", "key", "description")
+
+
+class ResultProjector:
+    """Shapes tool results according to the configured mode.
+
+    In ``full`` mode results are the complete ``model_dump()`` as before;
+    in ``compact`` mode fields are whitelisted per tool.
+    """
+
+    def __init__(
+        self,
+        mode: str = "compact",
+        description_chars: int = 160,
+        tabular: bool = True,
+        ticket_fields: Optional[dict[str, Sequence[str]]] = None,
+    ):
+        """Initialize the projector.
+
+        Args:
+            mode: "compact" or "full"
+            description_chars: Max description length in compact mode (0 keeps all)
+            tabular: Encode lists as {"columns": [...], "rows": [[...]]}
+            ticket_fields: Per-tool field whitelist overrides
+        """
+        if mode not in ("compact", "full"):
+            raise ValueError(f"Unknown tool result mode '{mode}'")
+        self.compact = mode == "compact"
+        self.description_chars = description_chars
+        self.tabular = tabular
+        self.ticket_fields: dict[str, Optional[tuple[str, ...]]] = dict(DEFAULT_TICKET_FIELDS)
+        for tool, fields in (ticket_fields or {}).items():
+            self.ticket_fields[tool] = tuple(fields)
+
+    def _fields_for(self, tool: str) -> Optional[tuple[str, ...]]:
+        return self.ticket_fields.get(tool, FALLBACK_TICKET_FIELDS)
+
+    def _shorten(self, data: dict[str, Any]) -> dict[str, Any]:
+        description = data.get("description")
+        limit = self.description_chars
+        if limit and isinstance(description, str) and len(description) > limit:
+            data["description"] = description[: limit - 1] + "…"
+        return data
+
+    def ticket(self, tool: str, ticket: Ticket) -> dict[str, Any]:
+        """Project a single ticket for the given tool."""
+        if not self.compact:
+            return ticket.model_dump()
+        fields = self._fields_for(tool)
+        if fields is None:
+            return ticket.model_dump(mode="json")
+        return self._shorten(ticket.model_dump(mode="json", include=set(fields)))
+
+    def tickets(self, tool: str, tickets: Iterable[Ticket]) -> Any:
+        """Project a list of tickets, as rows under one header when tabular."""
+        if not self.compact:
+            return [t.model_dump() for t in tickets]
+        items = [self.ticket(tool, t) for t in tickets]
+        fields = self._fields_for(tool)
+        if not self.tabular or fields is None:
+            return items
+        return {"columns": list(fields), "rows": [[item.get(f) for f in fields] for item in items]}
+
+    def project(self, project: Project) -> dict[str, Any]:
+        """Project a single project."""
+        if not self.compact:
+            return project.model_dump()
+        return self._shorten(project.model_dump(mode="json", include=set(PROJECT_FIELDS)))
+
+    def projects(self, projects: Iterable[Project]) -> Any:
+        """Project a list of projects, as rows under one header when tabular."""
+        if not self.compact:
+            return [p.model_dump() for p in projects]
+        items = [self.project(p) for p in projects]
+        if not self.tabular:
+            return items
+        return {
+            "columns": list(PROJECT_FIELDS),
+            "rows": [[item.get(f) for f in PROJECT_FIELDS] for item in items],
+        }
@@ -0,0 +1,146 @@
+"""Cache of agent replies to repeated read-only questions.
+
+A turn is cached only when every tool it called is a read tool; any turn
+that touched a mutating tool is never stored. Entries are keyed on the
+session and a normalized form of the message, so a reply that leaned on
+earlier turns (the project being discussed, say) is only reused within
+the conversation it was given in. They carry the API client's
+version stamp of the data their tools read. A mutation made through the
+client bumps that stamp, so the entry stops matching; the TTL bounds how
+stale a reply can get when data is changed elsewhere (e.g. the web UI).
+"""
+
+import re
+from dataclasses import dataclass
+from typing import Any, Optional
+
+from ..api.cache import LRUCache
+
+# Read tools and the backend resources their results depend on
+READ_TOOL_RESOURCES: dict[str, tuple[str, ...]] = {
+    "list_projects": ("projects",),
+    "list_tickets": ("projects", "tickets"),
+    "search_tickets": ("tickets",),
+    "get_board_summary": ("projects", "tickets"),
+}
+RESOURCES = ("projects", "tickets")
+
+# Filler words dropped so "what projects do I have?" and "list my projects" share a key
+_FILLER = frozenset(
+    "please can could would you me my i us our the a an all of do does is are there "
+    "what whats which show list tell give have get see".split()
+)
+# Messages that refer back to the conversation can't be answered out of context
+_REFERENCES = frozenset("it its them they that those this these he she his her".split())
+_WORD = re.compile(r"[\w-]+")
+
+
+def normalize_message(message: str) -> Optional[str]:
+    """Reduce a message to its cache key, or None if it shouldn't be cached."""
+    words = _WORD.findall(message.lower().replace("'", ""))
+    if not words or any(word in _REFERENCES for word in words):
+        return None
+    return " ".join(word for word in words if word not in _FILLER) or None
+
+
+@dataclass
+class CachedReply:
+    """A cached turn and the data version it was computed from."""
+
+    response: str
+    actions_taken: list[dict[str, Any]]
+    resources: tuple[str, ...]
+    version: tuple[int, ...]
+
+
+class AgentResponseCache:
+    """LRU/TTL cache of read-only agent turns per session."""
+
+    def __init__(self, maxsize: int = 256, ttl: float = 120.0):
+        """Initialize the cache.
+
+        Args:
+            maxsize: Max cached replies across all sessions (0 disables)
+            ttl: Seconds a reply is reused even if no mutation was seen
+        """
+        self._entries: LRUCache[tuple[str, str, str], CachedReply] = LRUCache(maxsize, ttl=ttl)
+
+    @staticmethod
+    def resources_for(actions: list[dict[str, Any]]) -> Optional[tuple[str, ...]]:
+        """Resources read by a turn's tool calls, or None if it isn't cacheable.
+
+        Turns without tool calls, with any non-read tool, or with a failed
+        tool call are not cacheable.
+        """
+        if not actions:
+            return None
+        resources: set[str] = set()
+        for action in actions:
+            tool_resources = READ_TOOL_RESOURCES.get(action.get("tool", ""))
+            result = action.get("result")
+            if tool_resources is None or not isinstance(result, dict):
+                return None
+            if not result.get("success", False):
+                return None
+            resources.update(tool_resources)
+        return tuple(r for r in RESOURCES if r in resources)
+
+    def get(
+        self, user_id: str, session_id: str, message: str, versions: dict[str, int]
+    ) -> Optional[CachedReply]:
+        """Get the cached reply if the data it read hasn't changed since.
+
+        Args:
+            user_id: User identifier
+            session_id: Session the message was sent in
+            message: The user's message
+            versions: Current data versions from the API client
+        """
+        text = normalize_message(message)
+        if text is None:
+            return None
+        key = (user_id, session_id, text)
+        stale = self._entries.peek(key)
+        if stale and tuple(versions[r] for r in stale.resources) != stale.version:
+            self._entries.pop(key)
+        return self._entries.get(key)
+
+    def put(
+        self,
+        user_id: str,
+        session_id: str,
+        message: str,
+        result: dict[str, Any],
+        versions: dict[str, int],
+    ) -> bool:
+        """Store a finished turn if it only used read tools.
+
+        Args:
+            user_id: User identifier
+            session_id: Session the turn ran in
+            message: The user's message
+            result: Turn result with "response" and "actions_taken"
+            versions: Data versions captured *before* the turn ran, so a
+                concurrent mutation leaves the entry already stale
+
+        Returns:
+            True if the turn was cached
+        """
+        text = normalize_message(message)
+        resources = self.resources_for(result.get("actions_taken") or [])
+        if text is None or resources is None or not result.get("response"):
+            return False
+        self._entries.set(
+            (user_id, session_id, text),
+            CachedReply(
+                response=result["response"],
+                actions_taken=result["actions_taken"],
+                resources=resources,
+                version=tuple(versions[r] for r in resources),
+            ),
+        )
+        return True
+
+    def stats(self) -> dict[str, Any]:
+        """Hit/miss counters and size of the cache."""
+        return self._entries.stats()
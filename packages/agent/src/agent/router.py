@@ -0,0 +1,225 @@
+"""Deterministic fast path for simple one-shot commands.
+
+Messages like "list projects", "show the board" or "move <title> to done"
+don't need the model to pick a tool or phrase the answer. The router
+matches a small set of anchored patterns, calls the tool function
+directly and renders a templated reply. Anything it doesn't recognise, or
+any tool call that fails, goes to the agent as usual.
+
+A move is only taken when the ticket is unambiguous: its title is quoted,
+or exactly one ticket has that title (ignoring case). "Move it to done"
+and partial titles are left to the agent, which has the conversation
+context to work out what was meant.
+"""
+
+import logging
+import re
+from collections.abc import Awaitable, Callable
+from dataclasses import dataclass
+from typing import TYPE_CHECKING, Any, Optional
+
+from ..api.client import MAX_PAGE_SIZE
+from ..api.schemas import TicketFilter
+from .response_cache import _REFERENCES
+
+if TYPE_CHECKING:
+    from ..api.client import APIClient
+
+logger = logging.getLogger(__name__)
+
+ToolFn = Callable[..., Awaitable[dict[str, Any]]]
+
+STATUSES = ("TODO", "IN_PROGRESS", "DONE", "BLOCKED")
+STATUS_ALIASES = {
+    "todo": "TODO",
+    "to do": "TODO",
+    "in progress": "IN_PROGRESS",
+    "in-progress": "IN_PROGRESS",
+    "in_progress": "IN_PROGRESS",
+    "doing": "IN_PROGRESS",
+    "done": "DONE",
+    "complete": "DONE",
+    "completed": "DONE",
+    "blocked": "BLOCKED",
+}
+_STATUS_PATTERN = "|".join(
+    re.escape(alias) for alias in sorted(STATUS_ALIASES, key=len, reverse=True)
+)
+
+_LIST_PROJECTS = re.compile(
+    r"^(?:(?:list|show)(?: me)?(?: all)?(?: of)?(?: my| the)? projects"
+    r"|what projects (?:do i have|are there))$"
+)
+_BOARD = re.compile(
+    r"^(?:show(?: me)?(?: my| the)? (?:kanban )?board(?: summary)?"
+    r"|what'?s on (?:my|the) board"
+    r"|board summary)"
+    r"(?: for (?P<project>[\w .-]+?))?$"
+)
+_MOVE = re.compile(
+    r"^move (?:the )?(?:ticket )?(?:[\"'](?P<quoted>.+)[\"']|(?P<title>.+?))"
+    r" to (?P<status>" + _STATUS_PATTERN + r")$",
+    re.IGNORECASE,
+)
+
+
+@dataclass
+class RouteMatch:
+    """A recognised command: which tool to call and with what arguments.
+
+    ``title`` is set for an unquoted ticket title that must match exactly
+    one ticket before the tool is called.
+    """
+
+    tool: str
+    args: dict[str, Any]
+    title: Optional[str] = None
+
+
+def _normalize(message: str) -> str:
+    text = " ".join(message.strip().split())
+    text = re.sub(r"^(?:please|can you|could you)\s+", "", text, flags=re.IGNORECASE)
+    return text.rstrip(" .!?").replace("’", "'")
+
+
+def _rows(value: Any) -> list[dict[str, Any]]:
+    """Accept both tabular ({"columns", "rows"}) and list-of-dict tool payloads."""
+    if isinstance(value, dict) and "columns" in value:
+        return [dict(zip(value["columns"], row)) for row in value["rows"]]
+    return list(value or [])
+
+
+def _render_projects(result: dict[str, Any]) -> str:
+    projects = _rows(result.get("projects"))
+    if not projects:
+        return "You don't have any projects yet."
+    lines = [f"You have {len(projects)} project(s):"]
+    lines += [f"- **{p['name']}** ({p['key']})" for p in projects]
+    return "\n".join(lines)
+
+
+def _render_board(result: dict[str, Any]) -> str:
+    projects = result.get("projects") or []
+    if not projects:
+        return "There are no projects on the board yet."
+    lines = ["Here's your board:"]
+    for p in projects:
+        counts = " · ".join(f"{status}: {p.get(status, 0)}" for status in STATUSES)
+        lines.append(f"- **{p['project_name']}** ({p['project_key']}): {counts}")
+    return "\n".join(lines)
+
+
+def _render_move(result: dict[str, Any]) -> str:
+    return f"Done! {result.get('message', 'Ticket moved')}."
+
+
+_RENDERERS: dict[str, Callable[[dict[str, Any]], str]] = {
+    "list_projects": _render_projects,
+    "get_board_summary": _render_board,
+    "move_ticket": _render_move,
+}
+
+
+class FastPathRouter:
+    """Routes high-confidence commands straight to tool functions."""
+
+    def __init__(
+        self,
+        tools: list[ToolFn],
+        api_client: Optional["APIClient"] = None,
+        enabled: bool = True,
+    ):
+        """Initialize the router.
+
+        Args:
+            tools: Tool functions, looked up by name
+            api_client: Client used to check that an unquoted ticket title is unique
+                (without it, only quoted titles are moved on the fast path)
+            enabled: Route messages at all
+        """
+        self.tools = {tool.__name__: tool for tool in tools}
+        self.api_client = api_client
+        self.enabled = enabled
+        self.hits = 0
+        self.misses = 0
+
+    def match(self, message: str) -> Optional[RouteMatch]:
+        """Match a message against the known command patterns."""
+        text = _normalize(message).lower()
+        if _LIST_PROJECTS.match(text):
+            return RouteMatch("list_projects", {})
+        board = _BOARD.match(text)
+        if board:
+            project = board.group("project")
+            return RouteMatch("get_board_summary", {"project_id": project} if project else {})
+        # Match moves on the original casing so the title is passed through as typed
+        move = _MOVE.match(_normalize(message))
+        if move:
+            status = STATUS_ALIASES[move.group("status").lower()]
+            quoted = move.group("quoted")
+            if quoted:
+                return RouteMatch("move_ticket", {"ticket_id": quoted, "new_status": status})
+            title = move.group("title")
+            if any(word in _REFERENCES for word in re.findall(r"[\w-]+", title.lower())):
+                return None  # "move it to done" refers back to the conversation
+            return RouteMatch("move_ticket", {"ticket_id": title, "new_status": status}, title)
+        return None
+
+    async def _unique_title(self, title: str) -> Optional[str]:
+        """ID of the only ticket with exactly this title (ignoring case), else None."""
+        if self.api_client is None:
+            return None
+        page = await self.api_client.list_tickets(
+            TicketFilter(search=title, limit=MAX_PAGE_SIZE)
+        )
+        if page.total > len(page.items):
+            return None  # Can't rule out a duplicate on a later page
+        wanted = title.casefold()
+        matches = [ticket for ticket in page.items if ticket.title.casefold() == wanted]
+        return matches[0].id if len(matches) == 1 else None
+
+    async def handle(self, message: str) -> Optional[dict[str, Any]]:
+        """Try to answer a message without the model.
+
+        Returns:
+            {"response", "actions_taken"} on a hit, or None to fall back to the agent
+        """
+        if not self.enabled:
+            return None
+        route = self.match(message)
+        tool = self.tools.get(route.tool) if route else None
+        if route is not None and tool is not None and route.title is not None:
+            try:
+                ticket_id = await self._unique_title(route.title)
+            except Exception as e:
+                logger.debug(f"Fast path title lookup failed, falling back to agent: {e}")
+                ticket_id = None
+            if ticket_id is None:
+                route = None
+            else:
+                route = RouteMatch(route.tool, {**route.args, "ticket_id": ticket_id})
+        if route is None or tool is None:
+            self.misses += 1
+            return None
+
+        result = await tool(**route.args)
+        if not result.get("success"):
+            # Let the agent explain or ask for clarification
+            logger.debug(f"Fast path {route.tool} failed, falling back to agent: {result}")
+            self.misses += 1
+            return None
+
+        self.hits += 1
+        return {
+            "response": _RENDERERS[route.tool](result),
+            "actions_taken": [{"tool": route.tool, "args": route.args, "result": result}],
+        }
+
+    def stats(self) -> dict[str, Any]:
+        """Hit/miss counters for the fast path."""
+        total = self.hits + self.misses
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "hit_rate": round(self.hits / total, 3) if total else None,
+        }
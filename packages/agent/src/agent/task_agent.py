@@ -1,35 +1,160 @@
 """Main Task Agent implementation using Google ADK.
 
 This version uses the proper ADK patterns with:
-- Agent (LlmAgent) for the AI agent  
+- Agent (LlmAgent) for the AI agent
 - Runner for execution
-- InMemorySessionService for session management
+- A bounded in-memory or SQLite session service (see src/session)
 """
 
+import asyncio
+import functools
 import logging
+import time
+import uuid
+from collections.abc import Awaitable, Callable
 from typing import Any
 
 from google.adk.agents import Agent  # Use Agent instead of LlmAgent
+from google.adk.agents.callback_context import CallbackContext
+from google.adk.agents.run_config import RunConfig, StreamingMode
+from google.adk.events import Event
+from google.adk.models import BaseLlm, LlmRequest, LlmResponse
 from google.adk.runners import Runner
-from google.adk.sessions import InMemorySessionService
 from google.genai import types
 
-from ..config import settings
+from .. import tracing
 from ..api.client import APIClient
+from ..api.concurrency import BatchResult
+from ..api.schemas import Ticket
+from ..config import settings
+from ..metrics import (
+    CACHE_ENTRIES,
+    CACHE_HIT_RATIO,
+    COALESCED_GETS,
+    MODEL_CALLS_PER_TURN,
+    SESSIONS,
+    TOOL_SECONDS,
+)
+from ..session import create_session_service
+from .events import TurnRecorder
+from .history import HistoryCompactor
+from .projection import ResultProjector
 from .prompts import SYSTEM_PROMPT
+from .response_cache import AgentResponseCache
+from .router import FastPathRouter
 
 logger = logging.getLogger(__name__)
 
 # App configuration
 APP_NAME = "task_assistant"
 
+# Max tickets a single bulk tool call touches
+MAX_BULK_ITEMS = 100
+
+
+def _timed(tool: Callable[..., Awaitable[dict]]) -> Callable[..., Awaitable[dict]]:
+    """Wrap a tool so its execution time is recorded per tool and outcome.
 
-def _create_tools(api_client: APIClient) -> list:
+    Calls also open a trace span, so backend requests made by the tool nest
+    under it. ``functools.wraps`` keeps the name, docstring and signature
+    ADK builds the function declaration from.
+    """
+
+    @functools.wraps(tool)
+    async def timed(*args: Any, **kwargs: Any) -> dict:
+        started = time.perf_counter()
+        outcome = "error"
+        with tracing.span(f"tool:{tool.__name__}") as span:
+            try:
+                result = await tool(*args, **kwargs)
+                if not (isinstance(result, dict) and result.get("success") is False):
+                    outcome = "ok"
+                return result
+            finally:
+                TOOL_SECONDS.observe(
+                    time.perf_counter() - started, tool=tool.__name__, outcome=outcome
+                )
+                if span is not None:
+                    span.attributes["outcome"] = outcome
+
+    return timed
+
+
+def _create_tools(api_client: APIClient, projector: ResultProjector | None = None) -> list:
     """Create tool functions that use the API client.
 
     These functions will be called by the agent when it needs to
     interact with the task management system.
+
+    Args:
+        api_client: Client for the backend API
+        projector: Shapes ticket/project payloads in tool results (compact by default)
     """
+    projector = projector or ResultProjector()
+
+    def _looks_like_id(value: str) -> bool:
+        return '-' in value and len(value) >= 30
+
+    async def _resolve_project_id(project_ref: str) -> str:
+        """Resolve a project ID, key or name to its ID (raises LookupError)."""
+        if _looks_like_id(project_ref):
+            return project_ref
+        project = await api_client.get_project_by_name(project_ref)
+        if not project:
+            raise LookupError(
+                f"Project '{project_ref}' not found. Use list_projects to see available projects."
+            )
+        return project.id
+
+    async def _resolve_ticket_id(ticket_ref: str) -> str:
+        """Resolve a ticket ID or title to its ID (raises LookupError)."""
+        if _looks_like_id(ticket_ref):
+            return ticket_ref
+        ticket = await api_client.find_ticket_by_title(ticket_ref)
+        if not ticket:
+            raise LookupError(
+                f"Ticket '{ticket_ref}' not found. Use search_tickets or list_tickets to find it."
+            )
+        return ticket.id
+
+    async def _select_tickets(
+        ticket_ids: list[str] | None, project_id: str, status: str, priority: str
+    ) -> tuple[list[str], int]:
+        """Ticket refs for a bulk call: the given IDs/titles, or those matching a filter.
+
+        Returns:
+            (refs, total matching) - total can exceed MAX_BULK_ITEMS for filters
+        """
+        if ticket_ids:
+            return ticket_ids[:MAX_BULK_ITEMS], len(ticket_ids)
+        if not (project_id or status or priority):
+            raise ValueError("Pass ticket_ids or at least one of project_id, status, priority")
+        page = await api_client.list_tickets(
+            project_id=await _resolve_project_id(project_id) if project_id else None,
+            status=status or None,
+            priority=priority or None,
+            limit=MAX_BULK_ITEMS,
+        )
+        return [t.id for t in page.items], page.total
+
+    def _bulk_report(
+        tool: str, verb: str, refs: list[Any], batch: BatchResult[Ticket], total: int
+    ) -> dict:
+        """Compact per-item report for a bulk tool call."""
+        done = batch.succeeded
+        report: dict[str, Any] = {
+            "success": batch.ok,
+            "message": f"{verb} {len(done)} of {len(refs)} ticket(s)",
+            "tickets": projector.tickets(tool, done),
+        }
+        if batch.errors:
+            report["errors"] = [
+                {"item": refs[i], "error": str(e)} for i, e in sorted(batch.errors.items())
+            ]
+        if total > len(refs):
+            report["remaining"] = total - len(refs)
+            report["message"] += f"; {report['remaining']} more matched, call again for the rest"
+        return report
 
     async def create_ticket(
         title: str,
@@ -45,38 +170,24 @@ def _create_tools(api_client: APIClient) -> list:
             description: Detailed description of the ticket
             priority: Priority level - LOW, MEDIUM, HIGH, or CRITICAL
             status: Initial status - TODO, IN_PROGRESS, DONE, or BLOCKED
-            project_id: Project ID (UUID) or project key/name. Will attempt to resolve by name if not a valid UUID.
+            project_id: Project ID (UUID) or project key/name. Will attempt to resolve by name
+                if not a valid UUID.
 
         Returns:
             The created ticket details or error message
         """
         try:
-            # Try to resolve project name/key to ID if provided
-            resolved_project_id = project_id
-            if project_id:
-                # Check if it's not a UUID (contains no hyphens or too short)
-                if '-' not in project_id or len(project_id) < 30:
-                    # Try to find project by name or key
-                    project = await api_client.get_project_by_name(project_id)
-                    if project:
-                        resolved_project_id = project.id
-                    else:
-                        return {
-                            "success": False,
-                            "error": f"Project '{project_id}' not found. Use list_projects to see available projects.",
-                        }
-            
             ticket = await api_client.create_ticket(
                 title=title,
                 description=description or None,
                 priority=priority,
                 status=status,
-                project_id=resolved_project_id or None,
+                project_id=await _resolve_project_id(project_id) if project_id else None,
             )
             return {
                 "success": True,
                 "message": f"Created ticket '{ticket.title}'",
-                "ticket": ticket.model_dump(),
+                "ticket": projector.ticket("create_ticket", ticket),
             }
         except Exception as e:
             return {"success": False, "error": str(e)}
@@ -90,7 +201,8 @@ def _create_tools(api_client: APIClient) -> list:
         """Update an existing ticket's details.
 
         Args:
-            ticket_id: The ID or title of the ticket to update. Will search by title if not a valid UUID.
+            ticket_id: The ID or title of the ticket to update. Will search by title if not
+                a valid UUID.
             title: New title (leave empty to keep current)
             description: New description (leave empty to keep current)
             priority: New priority - LOW, MEDIUM, HIGH, or CRITICAL (leave empty to keep current)
@@ -99,19 +211,7 @@ def _create_tools(api_client: APIClient) -> list:
             The updated ticket details or error message
         """
         try:
-            # Try to resolve ticket title to ID if needed
-            resolved_ticket_id = ticket_id
-            if '-' not in ticket_id or len(ticket_id) < 30:
-                # Looks like a title, search for it
-                ticket = await api_client.find_ticket_by_title(ticket_id)
-                if ticket:
-                    resolved_ticket_id = ticket.id
-                else:
-                    return {
-                        "success": False,
-                        "error": f"Ticket '{ticket_id}' not found. Use search_tickets or list_tickets to find it.",
-                    }
-            
+            resolved_ticket_id = await _resolve_ticket_id(ticket_id)
             updates = {}
             if title:
                 updates["title"] = title
@@ -124,7 +224,7 @@ def _create_tools(api_client: APIClient) -> list:
             return {
                 "success": True,
                 "message": f"Updated ticket '{ticket.title}'",
-                "ticket": ticket.model_dump(),
+                "ticket": projector.ticket("update_ticket", ticket),
             }
         except Exception as e:
             return {"success": False, "error": str(e)}
@@ -133,31 +233,20 @@ def _create_tools(api_client: APIClient) -> list:
         """Move a ticket to a different status column.
 
         Args:
-            ticket_id: The ID or title of the ticket to move. Will search by title if not a valid UUID.
+            ticket_id: The ID or title of the ticket to move. Will search by title if not
+                a valid UUID.
             new_status: New status - TODO, IN_PROGRESS, DONE, or BLOCKED
 
         Returns:
             The updated ticket details or error message
         """
         try:
-            # Try to resolve ticket title to ID if needed
-            resolved_ticket_id = ticket_id
-            if '-' not in ticket_id or len(ticket_id) < 30:
-                # Looks like a title, search for it
-                ticket = await api_client.find_ticket_by_title(ticket_id)
-                if ticket:
-                    resolved_ticket_id = ticket.id
-                else:
-                    return {
-                        "success": False,
-                        "error": f"Ticket '{ticket_id}' not found. Use search_tickets or list_tickets to find it.",
-                    }
-            
+            resolved_ticket_id = await _resolve_ticket_id(ticket_id)
             ticket = await api_client.move_ticket(resolved_ticket_id, new_status)
             return {
                 "success": True,
                 "message": f"Moved '{ticket.title}' to {new_status}",
-                "ticket": ticket.model_dump(),
+                "ticket": projector.ticket("move_ticket", ticket),
             }
         except Exception as e:
             return {"success": False, "error": str(e)}
@@ -175,7 +264,10 @@ def _create_tools(api_client: APIClient) -> list:
         if not confirmed:
             return {
                 "success": False,
-                "message": "Please confirm you want to delete this ticket. This action cannot be undone.",
+                "message": (
+                    "Please confirm you want to delete this ticket. "
+                    "This action cannot be undone."
+                ),
                 "requires_confirmation": True,
             }
 
@@ -202,32 +294,19 @@ def _create_tools(api_client: APIClient) -> list:
             limit: Maximum number of tickets to return (default 20)
 
         Returns:
-            List of matching tickets
+            Matching tickets (id, title, status, priority). Use get_ticket for full details.
         """
         try:
-            # Try to resolve project name/key to ID if provided
-            resolved_project_id = None
-            if project_id:
-                # Check if it's not a UUID (contains no hyphens or too short)
-                if '-' not in project_id or len(project_id) < 30:
-                    # Try to find project by name or key
-                    project = await api_client.get_project_by_name(project_id)
-                    if project:
-                        resolved_project_id = project.id
-                else:
-                    resolved_project_id = project_id
-            
             result = await api_client.list_tickets(
-                project_id=resolved_project_id,
+                project_id=await _resolve_project_id(project_id) if project_id else None,
                 status=status or None,
                 priority=priority or None,
                 limit=limit,
             )
-            tickets = [t.model_dump() for t in result.items]  # Changed from result.tickets
             return {
                 "success": True,
-                "tickets": tickets,
-                "count": len(tickets),
+                "tickets": projector.tickets("list_tickets", result.items),
+                "count": len(result.items),
                 "total": result.total,
             }
         except Exception as e:
@@ -249,7 +328,7 @@ def _create_tools(api_client: APIClient) -> list:
             )
             return {
                 "success": True,
-                "tickets": [t.model_dump() for t in tickets],
+                "tickets": projector.tickets("search_tickets", tickets),
                 "count": len(tickets),
             }
         except Exception as e:
@@ -262,12 +341,12 @@ def _create_tools(api_client: APIClient) -> list:
             ticket_id: The ID of the ticket to retrieve
 
         Returns:
-            Full ticket details
+            Full ticket details, including the complete description
         """
         try:
             ticket = await api_client.get_ticket(ticket_id)
             if ticket:
-                return {"success": True, "ticket": ticket.model_dump()}
+                return {"success": True, "ticket": projector.ticket("get_ticket", ticket)}
             return {"success": False, "error": "Ticket not found"}
         except Exception as e:
             return {"success": False, "error": str(e)}
@@ -282,7 +361,7 @@ def _create_tools(api_client: APIClient) -> list:
             projects = await api_client.list_projects()
             return {
                 "success": True,
-                "projects": [p.model_dump() for p in projects],
+                "projects": projector.projects(projects),
                 "count": len(projects),
             }
         except Exception as e:
@@ -300,7 +379,7 @@ def _create_tools(api_client: APIClient) -> list:
         try:
             project = await api_client.get_project(project_id)
             if project:
-                return {"success": True, "project": project.model_dump()}
+                return {"success": True, "project": projector.project(project)}
             return {"success": False, "error": "Project not found"}
         except Exception as e:
             return {"success": False, "error": str(e)}
@@ -309,13 +388,15 @@ def _create_tools(api_client: APIClient) -> list:
         """Get Kanban board summary with ticket counts by status.
 
         Args:
-            project_id: Project ID to summarize (uses first project if not specified)
+            project_id: Project ID, key or name to summarize (all projects if not specified)
 
         Returns:
             Board summary with counts for each status column
         """
         try:
-            summary = await api_client.get_board_summary(project_id or None)
+            summary = await api_client.get_board_summary(
+                await _resolve_project_id(project_id) if project_id else None
+            )
             return {
                 "success": True,
                 **summary,  # Spread the entire summary dict
@@ -342,7 +423,7 @@ def _create_tools(api_client: APIClient) -> list:
                     "success": False,
                     "error": "Project key must be at least 2 characters",
                 }
-            
+
             project = await api_client.create_project(
                 name=name,
                 key=key,
@@ -351,7 +432,7 @@ def _create_tools(api_client: APIClient) -> list:
             return {
                 "success": True,
                 "message": f"Created project '{project.name}' ({project.key})",
-                "project": project.model_dump(),
+                "project": projector.project(project),
             }
         except Exception as e:
             return {"success": False, "error": str(e)}
@@ -362,34 +443,20 @@ def _create_tools(api_client: APIClient) -> list:
         """Delete a project from the task management system.
 
         Args:
-            project_id: Project ID (UUID) or project key/name. Will attempt to resolve by name/key if not a valid UUID.
+            project_id: Project ID (UUID) or project key/name. Will attempt to resolve by
+                name/key if not a valid UUID.
 
         Returns:
             Success confirmation or error message
         """
         try:
-            # Try to resolve project name/key to ID if provided
-            resolved_project_id = project_id
-            if project_id:
-                # Check if it's not a UUID (contains no hyphens or too short)
-                if '-' not in project_id or len(project_id) < 30:
-                    # Try to find project by name or key
-                    project = await api_client.get_project_by_name(project_id)
-                    if project:
-                        resolved_project_id = project.id
-                    else:
-                        return {
-                            "success": False,
-                            "error": f"Project '{project_id}' not found. Use list_projects to see available projects.",
-                        }
-            
-            if not resolved_project_id:
+            if not project_id:
                 return {
                     "success": False,
                     "error": "Project ID or name is required",
                 }
-            
-            await api_client.delete_project(resolved_project_id)
+
+            await api_client.delete_project(await _resolve_project_id(project_id))
             return {
                 "success": True,
                 "message": f"Successfully deleted project '{project_id}'",
@@ -397,11 +464,126 @@ def _create_tools(api_client: APIClient) -> list:
         except Exception as e:
             return {"success": False, "error": str(e)}
 
-    return [
+    async def bulk_create_tickets(tickets: list[dict], project_id: str = "") -> dict:
+        """Create many tickets in one step.
+
+        Args:
+            tickets: Tickets to create, each with "title" and optionally
+                "description", "priority", "status" and "project_id"
+            project_id: Default project ID, key or name for tickets that don't set one
+
+        Returns:
+            Per-item report: created tickets and any errors
+        """
+        try:
+            items = tickets[:MAX_BULK_ITEMS]
+
+            async def create(item: dict) -> Ticket:
+                if not item.get("title"):
+                    raise ValueError("title is required")
+                # Resolved per item so an unknown project only fails its own tickets
+                project_ref = item.get("project_id") or project_id
+                return await api_client.create_ticket(
+                    title=item["title"],
+                    description=item.get("description") or None,
+                    priority=item.get("priority") or "MEDIUM",
+                    status=item.get("status") or "TODO",
+                    project_id=await _resolve_project_id(project_ref) if project_ref else None,
+                )
+
+            batch = await api_client.batch(create(item) for item in items)
+            refs = [item.get("title", "") for item in items]
+            return _bulk_report("bulk_create_tickets", "Created", refs, batch, len(tickets))
+        except Exception as e:
+            return {"success": False, "error": str(e)}
+
+    async def bulk_move_tickets(
+        new_status: str,
+        ticket_ids: list[str] | None = None,
+        project_id: str = "",
+        status: str = "",
+        priority: str = "",
+    ) -> dict:
+        """Move many tickets to a status column in one step.
+
+        Pass either ticket_ids, or a filter (project_id, status, priority)
+        to move every matching ticket, e.g. all BLOCKED tickets in a project.
+
+        Args:
+            new_status: New status - TODO, IN_PROGRESS, DONE, or BLOCKED
+            ticket_ids: IDs or titles of the tickets to move
+            project_id: Filter by project ID, key, or name
+            status: Filter by current status
+            priority: Filter by priority
+
+        Returns:
+            Per-item report: moved tickets and any errors
+        """
+        try:
+            refs, total = await _select_tickets(ticket_ids, project_id, status, priority)
+
+            async def move(ref: str) -> Ticket:
+                return await api_client.move_ticket(await _resolve_ticket_id(ref), new_status)
+
+            batch = await api_client.batch(move(ref) for ref in refs)
+            return _bulk_report(
+                "bulk_move_tickets", f"Moved to {new_status}", refs, batch, total
+            )
+        except Exception as e:
+            return {"success": False, "error": str(e)}
+
+    async def bulk_update_tickets(
+        ticket_ids: list[str] | None = None,
+        project_id: str = "",
+        status: str = "",
+        priority: str = "",
+        new_priority: str = "",
+        new_title_prefix: str = "",
+    ) -> dict:
+        """Update many tickets in one step.
+
+        Pass either ticket_ids, or a filter (project_id, status, priority)
+        to update every matching ticket.
+
+        Args:
+            ticket_ids: IDs or titles of the tickets to update
+            project_id: Filter by project ID, key, or name
+            status: Filter by status
+            priority: Filter by current priority
+            new_priority: New priority - LOW, MEDIUM, HIGH, or CRITICAL
+            new_title_prefix: Text to prepend to each title, e.g. "[v2] "
+
+        Returns:
+            Per-item report: updated tickets and any errors
+        """
+        try:
+            if not (new_priority or new_title_prefix):
+                return {"success": False, "error": "Nothing to update"}
+            refs, total = await _select_tickets(ticket_ids, project_id, status, priority)
+
+            async def update(ref: str) -> Ticket:
+                ticket_id = await _resolve_ticket_id(ref)
+                updates: dict[str, Any] = {}
+                if new_priority:
+                    updates["priority"] = new_priority
+                if new_title_prefix:
+                    current = await api_client.get_ticket(ticket_id)
+                    updates["title"] = new_title_prefix + current.title
+                return await api_client.update_ticket(ticket_id, **updates)
+
+            batch = await api_client.batch(update(ref) for ref in refs)
+            return _bulk_report("bulk_update_tickets", "Updated", refs, batch, total)
+        except Exception as e:
+            return {"success": False, "error": str(e)}
+
+    tools = [
         create_ticket,
         update_ticket,
         move_ticket,
         delete_ticket,
+        bulk_create_tickets,
+        bulk_move_tickets,
+        bulk_update_tickets,
         list_tickets,
         search_tickets,
         get_ticket,
@@ -411,30 +593,84 @@ def _create_tools(api_client: APIClient) -> list:
         create_project,
         delete_project,
     ]
+    return [_timed(tool) for tool in tools]
 
 
 class TaskAgentService:
     """Service class that manages the ADK agent, runner, and sessions."""
 
-    def __init__(self, api_base_url: str | None = None):
+    def __init__(
+        self,
+        api_base_url: str | None = None,
+        model: str | BaseLlm | None = None,
+        api_client: APIClient | None = None,
+    ):
         """Initialize the agent service.
 
         Args:
             api_base_url: Base URL for the backend API
+            model: Model name or ADK model instance (defaults to settings.gemini_model)
+            api_client: Preconfigured backend client (defaults to one built from settings)
         """
         self.api_base_url = api_base_url or settings.backend_api_url
-        self.api_client = APIClient(self.api_base_url)
+        self.api_client = api_client or APIClient.from_settings(
+            settings, base_url=self.api_base_url
+        )
+        self.model = model or settings.gemini_model
+        self.model_name = self.model if isinstance(self.model, str) else self.model.model
+        self._sync_task: asyncio.Task | None = None
+
+        # Create the session service (bounded in-memory or SQLite, see settings)
+        self.session_service = create_session_service(settings)
+
+        # Compacts older turns before each model call
+        self.history = HistoryCompactor(
+            keep_turns=settings.history_keep_turns,
+            max_contents=settings.max_conversation_length,
+            summary_chars=settings.history_summary_chars,
+        )
 
-        # Create the session service (in-memory for dev, can swap for DB later)
-        self.session_service = InMemorySessionService()
+        # Shapes tool results before they enter the model context
+        self.projector = ResultProjector(
+            mode=settings.tool_result_mode,
+            description_chars=settings.tool_description_max_chars,
+            tabular=settings.tool_result_tabular,
+            ticket_fields=settings.tool_result_fields,
+        )
+
+        self.tools = _create_tools(self.api_client, self.projector)
 
         # Create the agent with tools (Agent is an alias for LlmAgent)
         self.agent = Agent(
-            model=settings.gemini_model,
+            model=self.model,
             name="task_agent",
-            description="An AI assistant that helps manage tickets and projects in a task management system.",
+            description=(
+                "An AI assistant that helps manage tickets and projects "
+                "in a task management system."
+            ),
             instruction=SYSTEM_PROMPT,
-            tools=_create_tools(self.api_client),
+            tools=self.tools,
+            before_model_callback=self._before_model,
+            after_model_callback=self._after_model,
+        )
+
+        # Token-level streaming for chat_stream (text deltas as they are generated)
+        self.stream_config = RunConfig(
+            streaming_mode=StreamingMode.SSE if settings.stream_tokens else StreamingMode.NONE
+        )
+
+        # Append every turn's trace spans to this JSONL file ("" disables)
+        self.trace_export = settings.trace_export_path
+
+        # Answers simple commands without calling the model
+        self.router = FastPathRouter(
+            self.tools, self.api_client, enabled=settings.fast_path_enabled
+        )
+
+        # Reuses replies to repeated read-only questions
+        self.replies = AgentResponseCache(
+            maxsize=settings.agent_response_cache_size,
+            ttl=settings.agent_response_cache_ttl_seconds,
         )
 
         # Create the runner
@@ -444,7 +680,26 @@ class TaskAgentService:
             session_service=self.session_service,
         )
 
-        logger.info(f"TaskAgentService initialized with model: {settings.gemini_model}")
+        logger.info(f"TaskAgentService initialized with model: {self.model_name}")
+
+    async def start(self) -> None:
+        """Warm up backend connections and start background ticket sync."""
+        await self.api_client.warm_up(settings.backend_warm_connections)
+        if settings.ticket_sync_enabled:
+            self._sync_task = asyncio.create_task(
+                self.api_client.run_ticket_sync(
+                    interval=settings.ticket_sync_interval_seconds,
+                    reconcile_interval=settings.ticket_sync_reconcile_seconds,
+                )
+            )
+
+    async def close(self) -> None:
+        """Stop background sync and release backend connections."""
+        if self._sync_task is not None:
+            self._sync_task.cancel()
+            await asyncio.gather(self._sync_task, return_exceptions=True)
+            self._sync_task = None
+        await self.api_client.close()
 
     async def get_or_create_session(
         self, user_id: str, session_id: str | None = None
@@ -473,7 +728,11 @@ class TaskAgentService:
         return session.id
 
     async def chat(
-        self, message: str, user_id: str, session_id: str | None = None
+        self,
+        message: str,
+        user_id: str,
+        session_id: str | None = None,
+        debug_timing: bool = False,
     ) -> dict[str, Any]:
         """Process a chat message and return the response.
 
@@ -481,56 +740,149 @@ class TaskAgentService:
             message: User's message
             user_id: User identifier
             session_id: Optional session ID to continue conversation
+            debug_timing: Include the turn's trace spans under "trace"
 
         Returns:
             Response with text, session_id, and any actions taken
         """
+        with tracing.trace("chat", enabled=debug_timing or self.trace_export) as trace:
+            result = await self._chat(message, user_id, session_id)
+        if trace is None:
+            return result
+        await self._export_trace(trace)
+        return {**result, "trace": trace.waterfall()} if debug_timing else result
+
+    async def _chat(self, message: str, user_id: str, session_id: str | None) -> dict[str, Any]:
+        """Run one turn for ``chat`` (inside its trace, if any)."""
         # Ensure we have a session
-        sid = await self.get_or_create_session(user_id, session_id)
+        with tracing.span("session.load"):
+            sid = await self.get_or_create_session(user_id, session_id)
+
+        cached = self.replies.get(user_id, sid, message, self.api_client.data_versions)
+        if cached is not None:
+            await self._record_exchange(user_id, sid, message, cached.response)
+            return {
+                "response": cached.response,
+                "session_id": sid,
+                "actions_taken": cached.actions_taken,
+                "tokens_saved": 0,
+            }
+        # Taken before any tool runs so a concurrent mutation makes the entry stale
+        versions = dict(self.api_client.data_versions)
+
+        with tracing.span("fast_path"):
+            fast = await self.router.handle(message)
+        if fast is not None:
+            await self._record_exchange(user_id, sid, message, fast["response"])
+            self.replies.put(user_id, sid, message, fast, versions)
+            return {
+                "response": fast["response"],
+                "session_id": sid,
+                "actions_taken": fast["actions_taken"],
+                "tokens_saved": 0,
+            }
 
         # Create the user message
         content = types.Content(role="user", parts=[types.Part(text=message)])
 
         # Run the agent
-        response_text = ""
-        actions_taken = []
-
-        async for event in self.runner.run_async(
-            user_id=user_id, session_id=sid, new_message=content
-        ):
-            logger.debug(f"Event: {event.id}, Author: {event.author}")
-
-            # Check for tool calls in the event
-            if event.content and event.content.parts:
-                for part in event.content.parts:
-                    if part.function_call:
-                        actions_taken.append({
-                            "tool": part.function_call.name,
-                            "args": dict(part.function_call.args)
-                            if part.function_call.args
-                            else {},
-                        })
-                    if part.function_response:
-                        # Find matching action and add result
-                        for action in actions_taken:
-                            if action["tool"] == part.function_response.name:
-                                action["result"] = dict(part.function_response.response)
-
-            # Capture final response text
-            if event.is_final_response():
-                if event.content and event.content.parts:
-                    for part in event.content.parts:
-                        if part.text:
-                            response_text += part.text
-
-        return {
-            "response": response_text.strip(),
+        turn = TurnRecorder()
+        try:
+            async for event in self.runner.run_async(
+                user_id=user_id, session_id=sid, new_message=content
+            ):
+                turn.process(event)
+        finally:
+            compaction = self._pop_compaction_stats(turn.invocation_id)
+
+        result = {
+            "response": turn.final_text.strip(),
             "session_id": sid,
-            "actions_taken": actions_taken,
+            "actions_taken": turn.actions,
+            "tokens_saved": compaction["tokens_saved"],
         }
+        self.replies.put(user_id, sid, message, result, versions)
+        return result
+
+    def _before_model(
+        self, callback_context: CallbackContext, llm_request: LlmRequest
+    ) -> LlmResponse | None:
+        """Open the trace span of a model step, then compact its history."""
+        tracing.begin("model", "model", model=self.model_name)
+        return self.history.before_model(callback_context, llm_request)
+
+    def _after_model(
+        self, callback_context: CallbackContext, llm_response: LlmResponse
+    ) -> LlmResponse | None:
+        """Close the model step's span once its complete response arrives."""
+        if llm_response.partial:
+            return None
+        usage = llm_response.usage_metadata
+        if usage is not None:
+            tracing.end(
+                "model",
+                prompt_tokens=usage.prompt_token_count,
+                output_tokens=usage.candidates_token_count,
+            )
+        else:
+            tracing.end("model")
+        return None
+
+    async def _export_trace(self, trace: tracing.Trace) -> None:
+        """Append a finished turn's spans to the configured JSONL file."""
+        if not self.trace_export:
+            return
+        try:
+            await asyncio.to_thread(trace.export, self.trace_export)
+        except OSError as e:
+            logger.warning(f"Could not export trace to {self.trace_export}: {e}")
+
+    async def _record_exchange(
+        self, user_id: str, session_id: str, message: str, response: str
+    ) -> None:
+        """Append a turn answered without the runner to the session history.
+
+        Keeps follow-up questions that do go through the model in context.
+        """
+        MODEL_CALLS_PER_TURN.observe(0)
+        session = await self.session_service.get_session(
+            app_name=APP_NAME, user_id=user_id, session_id=session_id
+        )
+        if session is None:
+            return
+        invocation_id = f"fast-{uuid.uuid4().hex}"
+        with tracing.span("session.save"):
+            for author, role, text in (
+                ("user", "user", message),
+                (self.agent.name, "model", response),
+            ):
+                await self.session_service.append_event(
+                    session,
+                    Event(
+                        invocation_id=invocation_id,
+                        author=author,
+                        content=types.Content(role=role, parts=[types.Part(text=text)]),
+                    ),
+                )
+
+    def _pop_compaction_stats(self, invocation_id: str | None) -> dict[str, int]:
+        """Collect and log history compaction savings for a finished turn."""
+        stats = self.history.pop_stats(invocation_id)
+        if invocation_id is not None:
+            MODEL_CALLS_PER_TURN.observe(stats["model_calls"])
+        if stats["tokens_saved"]:
+            logger.info(
+                f"History compaction saved ~{stats['tokens_saved']} tokens "
+                f"over {stats['model_calls']} model call(s)"
+            )
+        return stats
 
     async def chat_stream(
-        self, message: str, user_id: str, session_id: str | None = None
+        self,
+        message: str,
+        user_id: str,
+        session_id: str | None = None,
+        debug_timing: bool = False,
     ):
         """Process a chat message and stream the response.
 
@@ -538,56 +890,121 @@ class TaskAgentService:
             message: User's message
             user_id: User identifier
             session_id: Optional session ID
+            debug_timing: Send the turn's trace spans as a "trace" event before "done"
 
         Yields:
             Dictionaries with event type and data
         """
+        with tracing.trace("chat_stream", enabled=debug_timing or self.trace_export) as trace:
+            async for chunk in self._chat_stream(message, user_id, session_id):
+                if trace is not None and chunk["type"] == "done":
+                    trace.finish()
+                    if debug_timing:
+                        yield {"type": "trace", **trace.waterfall()}
+                yield chunk
+        if trace is not None:
+            await self._export_trace(trace)
+
+    async def _chat_stream(self, message: str, user_id: str, session_id: str | None):
+        """Stream one turn for ``chat_stream`` (inside its trace, if any)."""
         # Ensure we have a session
-        sid = await self.get_or_create_session(user_id, session_id)
+        with tracing.span("session.load"):
+            sid = await self.get_or_create_session(user_id, session_id)
+
+        cached = self.replies.get(user_id, sid, message, self.api_client.data_versions)
+        if cached is not None:
+            async for chunk in self._replay(
+                user_id, sid, message, cached.response, cached.actions_taken
+            ):
+                yield chunk
+            return
+        versions = dict(self.api_client.data_versions)
+
+        with tracing.span("fast_path"):
+            fast = await self.router.handle(message)
+        if fast is not None:
+            self.replies.put(user_id, sid, message, fast, versions)
+            async for chunk in self._replay(
+                user_id, sid, message, fast["response"], fast["actions_taken"]
+            ):
+                yield chunk
+            return
 
         # Create the user message
         content = types.Content(role="user", parts=[types.Part(text=message)])
 
-        full_response = ""
-        actions_taken = []
-
-        async for event in self.runner.run_async(
-            user_id=user_id, session_id=sid, new_message=content
-        ):
-            if event.content and event.content.parts:
-                for part in event.content.parts:
-                    # Handle function calls
-                    if part.function_call:
-                        action = {
-                            "tool": part.function_call.name,
-                            "args": dict(part.function_call.args)
-                            if part.function_call.args
-                            else {},
-                        }
-                        actions_taken.append(action)
-                        yield {"type": "tool_call", **action}
-
-                    # Handle function responses
-                    elif part.function_response:
-                        yield {
-                            "type": "tool_result",
-                            "tool": part.function_response.name,
-                            "result": dict(part.function_response.response),
-                        }
-
-                    # Handle text chunks
-                    elif part.text:
-                        full_response += part.text
-                        yield {"type": "text", "content": part.text}
-
-            # Check if this is the final response
-            if event.is_final_response():
-                yield {
-                    "type": "done",
-                    "session_id": sid,
-                    "full_response": full_response.strip(),
-                    "actions_taken": actions_taken,
-                }
+        turn = TurnRecorder()
+        compaction: dict[str, int] | None = None
+        try:
+            async for event in self.runner.run_async(
+                user_id=user_id,
+                session_id=sid,
+                new_message=content,
+                run_config=self.stream_config,
+            ):
+                for chunk in turn.process(event):
+                    yield chunk
+
+                # Check if this is the final response
+                if event.is_final_response():
+                    compaction = self._pop_compaction_stats(turn.invocation_id)
+                    full_response = turn.text.strip()
+                    self.replies.put(
+                        user_id,
+                        sid,
+                        message,
+                        {"response": full_response, "actions_taken": turn.actions},
+                        versions,
+                    )
+                    yield {
+                        "type": "done",
+                        "session_id": sid,
+                        "full_response": full_response,
+                        "actions_taken": turn.actions,
+                        "tokens_saved": compaction["tokens_saved"],
+                    }
+        finally:
+            # The turn failed or the client went away before the final response
+            if compaction is None:
+                self._pop_compaction_stats(turn.invocation_id)
+
+    async def _replay(
+        self,
+        user_id: str,
+        session_id: str,
+        message: str,
+        response: str,
+        actions_taken: list[dict[str, Any]],
+    ):
+        """Stream a turn answered without the runner as the usual events."""
+        for action in actions_taken:
+            yield {"type": "tool_call", "tool": action["tool"], "args": action["args"]}
+            yield {"type": "tool_result", "tool": action["tool"], "result": action["result"]}
+        yield {"type": "text", "content": response}
+        await self._record_exchange(user_id, session_id, message, response)
+        yield {
+            "type": "done",
+            "session_id": session_id,
+            "full_response": response,
+            "actions_taken": actions_taken,
+            "tokens_saved": 0,
+        }
+
+    async def update_metrics(self) -> None:
+        """Set the point-in-time gauges (sessions, cache hit ratios) before a scrape."""
+        SESSIONS.set(await self.session_service.session_count())
+
+        caches = {
+            **{f"backend_{name}": stats for name, stats in self.api_client.cache_stats().items()},
+            "agent_replies": self.replies.stats(),
+            "fast_path": self.router.stats(),
+        }
+        for name, stats in caches.items():
+            lookups = stats["hits"] + stats["misses"]
+            CACHE_HIT_RATIO.set(stats["hits"] / lookups if lookups else 0.0, cache=name)
+            if "size" in stats:
+                CACHE_ENTRIES.set(stats["size"], cache=name)
+        COALESCED_GETS.set(self.api_client.coalesced_gets)
 
     async def delete_session(self, user_id: str, session_id: str) -> bool:
         """Delete a session.
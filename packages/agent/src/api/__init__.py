@@ -1,17 +1,33 @@
 """API client module for backend communication."""
 
+from .cache import LRUCache
 from .client import APIClient
+from .concurrency import BatchResult, gather_bounded, run_batch
+from .project_index import AmbiguousProjectError, ProjectIndex
+from .resilience import CircuitBreaker, CircuitOpenError, RetryPolicy
 from .schemas import (
-    Ticket,
-    Project,
     CreateTicketRequest,
-    UpdateTicketRequest,
-    TicketFilter,
     PaginatedTickets,
+    Project,
+    Ticket,
+    TicketFilter,
+    UpdateTicketRequest,
 )
+from .search_index import AmbiguousTicketError, TicketSearchIndex
 
 __all__ = [
     "APIClient",
+    "LRUCache",
+    "BatchResult",
+    "gather_bounded",
+    "run_batch",
+    "AmbiguousProjectError",
+    "ProjectIndex",
+    "CircuitBreaker",
+    "CircuitOpenError",
+    "RetryPolicy",
+    "AmbiguousTicketError",
+    "TicketSearchIndex",
     "Ticket",
     "Project",
     "CreateTicketRequest",
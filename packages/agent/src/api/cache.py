@@ -0,0 +1,122 @@
+"""Small in-process caches used by the API client."""
+
+import time
+from collections import OrderedDict
+from collections.abc import Callable, Hashable, Iterator
+from dataclasses import dataclass
+from typing import Any, Generic, Optional, TypeVar
+
+K = TypeVar("K", bound=Hashable)
+V = TypeVar("V")
+
+
+class LRUCache(Generic[K, V]):
+    """Size-bounded mapping that evicts the least recently used entry.
+
+    Entries optionally expire ``ttl`` seconds after they were last written.
+    A ``maxsize`` of 0 disables the cache (every lookup misses).
+    """
+
+    def __init__(self, maxsize: int, ttl: Optional[float] = None):
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self._data: OrderedDict[K, tuple[float, V]] = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+
+    def __len__(self) -> int:
+        return len(self._data)
+
+    def __contains__(self, key: object) -> bool:
+        return self.peek(key) is not None  # type: ignore[arg-type]
+
+    def __iter__(self) -> Iterator[K]:
+        return iter(list(self._data))
+
+    def _expired(self, written_at: float) -> bool:
+        return self.ttl is not None and time.monotonic() - written_at >= self.ttl
+
+    def peek(self, key: K) -> Optional[V]:
+        """Get a value without counting the lookup or refreshing its recency."""
+        entry = self._data.get(key)
+        if entry is None or self._expired(entry[0]):
+            return None
+        return entry[1]
+
+    def get(self, key: K) -> Optional[V]:
+        """Get a value and mark it as recently used."""
+        entry = self._data.get(key)
+        if entry is None:
+            self.misses += 1
+            return None
+        if self._expired(entry[0]):
+            del self._data[key]
+            self.misses += 1
+            return None
+        self._data.move_to_end(key)
+        self.hits += 1
+        return entry[1]
+
+    def set(self, key: K, value: V) -> None:
+        """Store a value, evicting the least recently used entry if full."""
+        if self.maxsize <= 0:
+            return
+        self._data[key] = (time.monotonic(), value)
+        self._data.move_to_end(key)
+        while len(self._data) > self.maxsize:
+            self._data.popitem(last=False)
+
+    def pop(self, key: K) -> Optional[V]:
+        """Remove a key, returning its value if it was cached."""
+        entry = self._data.pop(key, None)
+        return entry[1] if entry else None
+
+    def discard_where(self, predicate: Callable[[K], bool]) -> int:
+        """Remove every key matching the predicate and return how many were removed."""
+        doomed = [key for key in self._data if predicate(key)]
+        for key in doomed:
+            del self._data[key]
+        return len(doomed)
+
+    def clear(self) -> None:
+        """Remove all entries."""
+        self._data.clear()
+
+    def stats(self) -> dict[str, Any]:
+        """Size and hit/miss counters."""
+        lookups = self.hits + self.misses
+        return {
+            "size": len(self._data),
+            "maxsize": self.maxsize,
+            "hits": self.hits,
+            "misses": self.misses,
+            "hit_ratio": round(self.hits / lookups, 3) if lookups else None,
+        }
+
+
+@dataclass
+class CachedResponse:
+    """A parsed response body together with its HTTP cache validators."""
+
+    value: Any
+    etag: Optional[str] = None
+    last_modified: Optional[str] = None
+
+    def conditional_headers(self) -> dict[str, str]:
+        """Headers that ask the server to answer 304 if nothing changed."""
+        headers = {}
+        if self.etag:
+            headers["If-None-Match"] = self.etag
+        if self.last_modified:
+            headers["If-Modified-Since"] = self.last_modified
+        return headers
+
+
+# Response cache keys are (path, sorted query params)
+ResponseKey = tuple[str, tuple[tuple[str, str], ...]]
+
+
+def response_key(path: str, params: Optional[dict[str, Any]] = None) -> ResponseKey:
+    """Build a cache key that ignores query parameter order."""
+    items = sorted((k, str(v)) for k, v in (params or {}).items() if v is not None)
+    return path, tuple(items)
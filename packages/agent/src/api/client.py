@@ -1,42 +1,217 @@
 """HTTP client for communicating with the backend API."""
 
+import asyncio
+import importlib.util
 import logging
-from typing import Any, Optional
+import time
+from collections.abc import AsyncIterator, Awaitable, Callable, Iterable
+from dataclasses import dataclass
+from typing import TYPE_CHECKING, Any, Optional, TypeVar
 
 import httpx
 
+from .. import tracing
+from ..metrics import BACKEND_SECONDS, endpoint_label
+from .cache import CachedResponse, LRUCache, ResponseKey, response_key
+from .concurrency import BatchResult, gather_bounded, run_batch
+from .project_index import ProjectIndex
+from .resilience import (
+    IDEMPOTENT_METHODS,
+    RETRYABLE_STATUS_CODES,
+    CircuitBreaker,
+    RetryPolicy,
+    parse_retry_after,
+)
 from .schemas import (
     CreateProjectRequest,
     CreateTicketRequest,
-    DeleteProjectRequest,
     PaginatedTickets,
     Project,
     ReorderTicketRequest,
     Ticket,
     TicketFilter,
+    TicketStatus,
+    TicketStatusCount,
     UpdateTicketRequest,
 )
+from .search_index import AmbiguousTicketError, TicketSearchIndex
+from .sync import SyncResult, TicketReplica
+
+if TYPE_CHECKING:
+    from ..config.settings import Settings
 
 logger = logging.getLogger(__name__)
 
+T = TypeVar("T")
+
+DEFAULT_LIMITS = httpx.Limits(
+    max_connections=20, max_keepalive_connections=10, keepalive_expiry=30.0
+)
+DEFAULT_TIMEOUT = httpx.Timeout(30.0, connect=5.0)
+
+# Largest page the backend serves for GET /tickets
+MAX_PAGE_SIZE = 100
+
+
+def _unwrap(body: Any) -> Any:
+    """Payload of a backend response (the backend wraps them in { "data": ... })."""
+    return body.get("data", body) if isinstance(body, dict) and "data" in body else body
+
+
+@dataclass
+class _SharedGet:
+    """A GET in flight and how many callers are waiting for it."""
+
+    future: "asyncio.Future[Any]"
+    waiters: int = 0
+
 
 class APIClient:
     """HTTP client for the Task Assistant backend API."""
 
-    def __init__(self, base_url: str, auth_token: Optional[str] = None):
+    def __init__(
+        self,
+        base_url: str,
+        auth_token: Optional[str] = None,
+        project_cache_ttl: float = 60.0,
+        max_concurrency: int = 8,
+        limits: Optional[httpx.Limits] = None,
+        timeout: Optional[httpx.Timeout] = None,
+        http2: bool = False,
+        retry_policy: Optional[RetryPolicy] = None,
+        circuit_breaker: Optional[CircuitBreaker] = None,
+        response_cache_size: int = 256,
+        ticket_cache_size: int = 1000,
+        ticket_cache_ttl: float = 30.0,
+        search_index: bool = False,
+        search_index_refresh: float = 300.0,
+        transport: Optional[httpx.AsyncBaseTransport] = None,
+    ):
         """Initialize the API client.
 
         Args:
             base_url: Backend API base URL (e.g., http://backend:3001)
             auth_token: Optional JWT token for authentication
+            project_cache_ttl: Seconds to reuse the cached project list (0 disables caching)
+            max_concurrency: Max requests this client keeps in flight at once
+            limits: Connection pool limits for the shared HTTP client
+            timeout: Connect/read timeouts for backend requests
+            http2: Negotiate HTTP/2 with the backend (needs the h2 package)
+            retry_policy: Retry/backoff policy for transient failures
+            circuit_breaker: Breaker that fails fast while the backend is down
+            response_cache_size: Max GET responses kept for conditional requests (0 disables)
+            ticket_cache_size: Max tickets kept by ID for local reads (0 disables)
+            ticket_cache_ttl: Seconds a cached ticket is served without asking the backend
+            search_index: Search tickets with a local full-text index instead of the backend
+            search_index_refresh: Seconds before the local index is rebuilt from the backend
+            transport: Custom httpx transport (e.g. httpx.MockTransport for an in-process backend)
         """
         self.base_url = base_url.rstrip("/")
         self.auth_token = auth_token
         self._client: Optional[httpx.AsyncClient] = None
+        self.limits = limits or DEFAULT_LIMITS
+        self.timeout = timeout or DEFAULT_TIMEOUT
+        self.http2 = http2
+        self.transport = transport
+        if http2 and importlib.util.find_spec("h2") is None:
+            logger.warning("HTTP/2 requested but the h2 package is not installed, using HTTP/1.1")
+            self.http2 = False
+        self.retry_policy = retry_policy or RetryPolicy()
+        self.circuit_breaker = circuit_breaker or CircuitBreaker()
+
+        # Project catalog cache used for name/key resolution
+        self.project_cache_ttl = project_cache_ttl
+        self._projects: Optional[list[Project]] = None
+        self._projects_fetched_at = 0.0
+        self._projects_generation = 0
+        self._projects_lock = asyncio.Lock()
+        self._project_index: Optional[ProjectIndex] = None
+
+        self.max_concurrency = max_concurrency
+        self._inflight = asyncio.Semaphore(max_concurrency)
+        # Parsed GET responses revalidated with ETag/Last-Modified
+        self._response_cache: LRUCache[ResponseKey, CachedResponse] = LRUCache(
+            response_cache_size
+        )
+
+        # Identical GETs in flight share one request (single-flight)
+        self._inflight_gets: dict[ResponseKey, _SharedGet] = {}
+        self._responses_generation = 0
+        self.coalesced_gets = 0
+
+        # Tickets by ID, filled from every response that returns tickets
+        self._tickets: LRUCache[str, Ticket] = LRUCache(ticket_cache_size, ttl=ticket_cache_ttl)
+
+        # Local full-text index, built on first search and updated from responses
+        self.search_index_enabled = search_index
+        self.search_index_refresh = search_index_refresh
+        self.search_index: Optional[TicketSearchIndex] = None
+        self._search_index_built_at = 0.0
+        self._search_index_lock = asyncio.Lock()
+        # Changes seen while a rebuild is running, replayed onto the new index
+        self._search_index_backlog: Optional[list[Callable[[TicketSearchIndex], None]]] = None
+
+        # Local copy of all tickets, filled by sync_tickets when sync is enabled
+        self.replica = TicketReplica()
+        self._sync_lock = asyncio.Lock()
+
+        # Reorders into the same (project, status) column, sent one at a time (see move_ticket)
+        self._column_locks: dict[tuple[str, str], asyncio.Lock] = {}
+
+        # None until we know whether the backend serves /tickets/counts
+        self._grouped_counts_supported: Optional[bool] = None
+
+        # Bumped on every mutation made through this client, per resource
+        self.data_versions: dict[str, int] = {"projects": 0, "tickets": 0}
+
+    @classmethod
+    def from_settings(
+        cls,
+        settings: "Settings",
+        base_url: Optional[str] = None,
+        transport: Optional[httpx.AsyncBaseTransport] = None,
+    ) -> "APIClient":
+        """Create a client configured from application settings.
+
+        Args:
+            settings: Application settings
+            base_url: Override for settings.backend_api_url
+            transport: Custom httpx transport (see ``__init__``)
+        """
+        return cls(
+            base_url or settings.backend_api_url,
+            project_cache_ttl=settings.project_cache_ttl_seconds,
+            max_concurrency=settings.backend_max_concurrency,
+            limits=httpx.Limits(
+                max_connections=settings.backend_max_connections,
+                max_keepalive_connections=settings.backend_max_keepalive_connections,
+                keepalive_expiry=settings.backend_keepalive_expiry_seconds,
+            ),
+            timeout=httpx.Timeout(
+                settings.backend_read_timeout_seconds,
+                connect=settings.backend_connect_timeout_seconds,
+            ),
+            http2=settings.backend_http2,
+            retry_policy=RetryPolicy(
+                max_attempts=settings.backend_retry_attempts,
+                base_delay=settings.backend_retry_base_delay_seconds,
+                max_delay=settings.backend_retry_max_delay_seconds,
+            ),
+            circuit_breaker=CircuitBreaker(
+                failure_threshold=settings.backend_circuit_failure_threshold,
+                reset_timeout=settings.backend_circuit_reset_seconds,
+            ),
+            response_cache_size=settings.response_cache_size,
+            ticket_cache_size=settings.ticket_cache_size,
+            ticket_cache_ttl=settings.ticket_cache_ttl_seconds,
+            search_index=settings.ticket_search_index,
+            search_index_refresh=settings.ticket_search_index_refresh_seconds,
+            transport=transport,
+        )
 
     @property
     def client(self) -> httpx.AsyncClient:
-        """Get or create the HTTP client."""
+        """Get or create the shared HTTP client (one connection pool per APIClient)."""
         if self._client is None:
             headers = {"Content-Type": "application/json"}
             if self.auth_token:
@@ -44,52 +219,344 @@ class APIClient:
             self._client = httpx.AsyncClient(
                 base_url=self.base_url,
                 headers=headers,
-                timeout=30.0,
+                timeout=self.timeout,
+                limits=self.limits,
+                http2=self.http2,
+                transport=self.transport,
             )
         return self._client
 
+    async def warm_up(self, connections: int = 1) -> None:
+        """Open pooled connections ahead of the first real request.
+
+        Failures are logged rather than raised so startup doesn't depend on
+        the backend being up.
+        """
+        connections = min(connections, self.limits.max_keepalive_connections or connections)
+        if connections <= 0:
+            return
+        results = await gather_bounded(
+            (self.client.get("/health") for _ in range(connections)),
+            connections,
+            return_exceptions=True,
+        )
+        failures = [r for r in results if isinstance(r, Exception)]
+        if failures:
+            logger.warning(f"Backend connection warm-up failed: {failures[0]}")
+        else:
+            logger.info(f"Warmed {connections} backend connection(s)")
+
     async def close(self) -> None:
         """Close the HTTP client."""
         if self._client:
             await self._client.aclose()
             self._client = None
 
+    async def _send(self, method: str, url: str, **kwargs: Any) -> httpx.Response:
+        """Send a single request through the circuit breaker and concurrency limit."""
+        breaker = self.circuit_breaker
+        breaker.before_request()
+        endpoint = endpoint_label(url)
+        with tracing.span("http", method=method, endpoint=endpoint) as span:
+            try:
+                async with self._inflight:
+                    started = time.perf_counter()
+                    response = await self.client.request(method, url, **kwargs)
+            except httpx.TransportError:
+                breaker.record_failure()
+                BACKEND_SECONDS.observe(
+                    time.perf_counter() - started, method=method, endpoint=endpoint, status="error"
+                )
+                raise
+            except BaseException:
+                breaker.release_probe()
+                raise
+            if span is not None:
+                span.attributes["status"] = response.status_code
+        BACKEND_SECONDS.observe(
+            time.perf_counter() - started,
+            method=method,
+            endpoint=endpoint,
+            status=str(response.status_code),
+        )
+        if response.status_code >= 500:
+            breaker.record_failure()
+        else:
+            breaker.record_success()
+        return response
+
+    async def _request(self, method: str, url: str, **kwargs: Any) -> httpx.Response:
+        """Send a request, retrying transient failures with jittered backoff.
+
+        Idempotent methods are retried on transport errors and 429/502/503/504
+        responses. Other methods are only retried when the connection could not
+        be established, since the backend never saw the request. A Retry-After
+        header on the response sets the minimum wait before the next attempt.
+
+        Raises:
+            CircuitOpenError: If the backend has been failing and the circuit is open
+        """
+        policy = self.retry_policy
+        idempotent = method.upper() in IDEMPOTENT_METHODS
+        attempt = 1
+        while True:
+            retry_after = None
+            try:
+                response = await self._send(method, url, **kwargs)
+            except httpx.TransportError as e:
+                retryable = idempotent or isinstance(e, (httpx.ConnectError, httpx.ConnectTimeout))
+                if not retryable or attempt >= policy.max_attempts:
+                    raise
+                logger.warning(f"{method} {url} failed ({e!r}), retrying (attempt {attempt})")
+            else:
+                if (
+                    not idempotent
+                    or response.status_code not in RETRYABLE_STATUS_CODES
+                    or attempt >= policy.max_attempts
+                ):
+                    return response
+                retry_after = parse_retry_after(response.headers.get("Retry-After"))
+                if retry_after is not None and retry_after > policy.max_retry_after:
+                    return response  # Not worth holding the caller that long
+                logger.warning(
+                    f"{method} {url} returned {response.status_code}, retrying (attempt {attempt})"
+                )
+            await asyncio.sleep(policy.backoff(attempt, retry_after))
+            attempt += 1
+
+    async def _get_parsed(
+        self,
+        path: str,
+        parse: Callable[[Any], T],
+        params: Optional[dict[str, Any]] = None,
+        cache: bool = True,
+    ) -> T:
+        """GET a resource and parse its payload, reusing the cached parse on 304.
+
+        Responses carrying an ETag or Last-Modified header are kept in an LRU
+        cache; the next GET for the same path and params is sent as a
+        conditional request and a 304 returns the previously parsed object.
+        Pass ``cache=False`` for one-off reads (e.g. bulk pagination) that
+        would only push useful entries out.
+
+        Concurrent calls for the same path and params share one request and
+        one parsed result (callers of a path always use the same parser).
+        """
+        key = response_key(path, params)
+        shared = self._inflight_gets.get(key)
+        if shared is None:
+            fetch = asyncio.ensure_future(self._fetch_parsed(key, path, parse, params, cache))
+            shared = _SharedGet(fetch)
+            self._inflight_gets[key] = shared
+            fetch.add_done_callback(lambda _: self._finish_get(key, shared))
+        else:
+            self.coalesced_gets += 1
+
+        shared.waiters += 1
+        try:
+            # Shielded so one caller giving up doesn't cancel the request for the others
+            return await asyncio.shield(shared.future)
+        finally:
+            shared.waiters -= 1
+            if not shared.waiters and not shared.future.done():
+                # Nobody is waiting for it any more. Detach it first so a caller
+                # arriving before the cancellation completes starts a new request
+                if self._inflight_gets.get(key) is shared:
+                    del self._inflight_gets[key]
+                shared.future.cancel()
+
+    def _finish_get(self, key: ResponseKey, shared: "_SharedGet") -> None:
+        if self._inflight_gets.get(key) is shared:
+            del self._inflight_gets[key]
+        if not shared.future.cancelled():
+            shared.future.exception()  # Mark retrieved even if every waiter was cancelled
+
+    async def _fetch_parsed(
+        self,
+        key: ResponseKey,
+        path: str,
+        parse: Callable[[Any], T],
+        params: Optional[dict[str, Any]],
+        cache: bool,
+    ) -> T:
+        generation = self._responses_generation
+        cached = self._response_cache.get(key) if cache else None
+        headers = cached.conditional_headers() if cached else {}
+        response = await self._request("GET", path, params=params, headers=headers)
+        if response.status_code == 304 and cached is not None:
+            return cached.value
+        response.raise_for_status()
+        value = parse(_unwrap(response.json()))
+
+        etag = response.headers.get("ETag")
+        last_modified = response.headers.get("Last-Modified")
+        # Don't store a response that raced with a mutation
+        if cache and (etag or last_modified) and generation == self._responses_generation:
+            self._response_cache.set(key, CachedResponse(value, etag, last_modified))
+        return value
+
+    def _invalidate_responses(self, *paths: str, prefix: Optional[str] = None) -> None:
+        """Drop cached GET responses for the given paths (any params) or path prefix.
+
+        In-flight GETs for those paths are detached too, so reads issued after
+        the mutation send a fresh request instead of joining an older one.
+        """
+
+        def matches(key: ResponseKey) -> bool:
+            return key[0] in paths or (prefix is not None and key[0].startswith(prefix))
+
+        self._responses_generation += 1
+        self._response_cache.discard_where(matches)
+        for key in [key for key in self._inflight_gets if matches(key)]:
+            del self._inflight_gets[key]
+
+    def _bump_version(self, *resources: str) -> None:
+        for resource in resources:
+            self.data_versions[resource] += 1
+
+    def data_version(self, resources: Iterable[str]) -> tuple[int, ...]:
+        """Version stamp of the given resources ("projects", "tickets").
+
+        Changes whenever data of those resources is mutated through this client.
+        """
+        return tuple(self.data_versions[resource] for resource in resources)
+
+    def cache_stats(self) -> dict[str, dict[str, Any]]:
+        """Size and hit/miss counters of the response and ticket caches."""
+        return {"responses": self._response_cache.stats(), "tickets": self._tickets.stats()}
+
+    def _invalidate_ticket_responses(self, ticket_id: Optional[str] = None) -> None:
+        """Drop cached ticket lists, counts and (optionally) one ticket."""
+        self._bump_version("tickets")
+        paths = ["/tickets", "/tickets/counts"]
+        if ticket_id:
+            paths.append(f"/tickets/{ticket_id}")
+        self._invalidate_responses(*paths)
+
+    def _remember_tickets(self, tickets: Iterable[Ticket], changed: bool = False) -> None:
+        """Store (or refresh) tickets in the ID cache and the search index.
+
+        Args:
+            tickets: Tickets from a backend response
+            changed: The tickets come from a mutation (kept across index rebuilds)
+        """
+        tickets = list(tickets)
+        for ticket in tickets:
+            self._tickets.set(ticket.id, ticket)
+        if changed:
+            self._update_search_index(lambda index: index.add_many(tickets))
+            if self.replica.ready:
+                self.replica.upsert(tickets)
+        elif self.search_index is not None:
+            self.search_index.add_many(tickets)
+
+    def _update_search_index(self, apply: Callable[[TicketSearchIndex], None]) -> None:
+        """Apply a mutation to the search index, including one being rebuilt."""
+        if self.search_index is not None:
+            apply(self.search_index)
+        if self._search_index_backlog is not None:
+            self._search_index_backlog.append(apply)
+
+    def _forget_project_tickets(self, project_id: str) -> None:
+        """Drop cached tickets belonging to a project."""
+        doomed = [
+            ticket_id
+            for ticket_id in self._tickets
+            if (ticket := self._tickets.peek(ticket_id)) and ticket.project_id == project_id
+        ]
+        for ticket_id in doomed:
+            self._tickets.pop(ticket_id)
+
+    # ==================== Concurrency ====================
+
+    async def gather(self, *aws: Awaitable[T]) -> list[T]:
+        """Run independent calls concurrently, failing fast on the first error.
+
+        Remaining calls are cancelled when one fails or the caller is cancelled.
+        """
+        return await gather_bounded(aws, self.max_concurrency)
+
+    async def batch(self, aws: Iterable[Awaitable[T]]) -> BatchResult[T]:
+        """Run independent calls concurrently and report per-item failures."""
+        return await run_batch(aws, self.max_concurrency)
+
     # ==================== Projects ====================
 
     async def list_projects(self) -> list[Project]:
         """Get all projects."""
-        response = await self.client.get("/projects")
-        response.raise_for_status()
-        data = response.json()
-        # Backend wraps responses in { "data": [...] }
-        projects_data = data.get("data", data) if isinstance(data, dict) else data
-        return [Project.model_validate(p) for p in projects_data]
+        return await self._get_parsed(
+            "/projects", lambda data: [Project.model_validate(p) for p in data]
+        )
 
     async def get_project(self, project_id: str) -> Project:
         """Get a project by ID."""
-        response = await self.client.get(f"/projects/{project_id}")
-        response.raise_for_status()
-        data = response.json()
-        # Backend wraps responses in { "data": {...} }
-        project_data = data.get("data", data) if isinstance(data, dict) and "data" in data else data
-        return Project.model_validate(project_data)
+        return await self._get_parsed(f"/projects/{project_id}", Project.model_validate)
+
+    def _projects_fresh(self) -> bool:
+        """Check whether the cached project list is still within its TTL."""
+        return (
+            self._projects is not None
+            and time.monotonic() - self._projects_fetched_at < self.project_cache_ttl
+        )
+
+    async def get_cached_projects(self, force_refresh: bool = False) -> list[Project]:
+        """Get all projects, served from the in-process cache while fresh.
+
+        Concurrent callers that find the cache stale share a single refresh.
+
+        Args:
+            force_refresh: Bypass the cache and re-fetch the project list
+
+        Returns:
+            The cached or freshly fetched project list
+        """
+        if self.project_cache_ttl <= 0:
+            return await self.list_projects()
+        if not force_refresh and self._projects_fresh():
+            return self._projects  # type: ignore[return-value]
+
+        fetched_at = self._projects_fetched_at
+        async with self._projects_lock:
+            # Another caller may have refreshed while we waited for the lock
+            if self._projects_fresh() and (
+                not force_refresh or self._projects_fetched_at != fetched_at
+            ):
+                return self._projects  # type: ignore[return-value]
+
+            generation = self._projects_generation
+            projects = await self.list_projects()
+            # Don't store a list that was fetched before an invalidation
+            if generation == self._projects_generation:
+                self._projects = projects
+                self._projects_fetched_at = time.monotonic()
+            return projects
+
+    def invalidate_project_cache(self) -> None:
+        """Drop the cached project list so the next lookup re-fetches it."""
+        self._projects = None
+        self._projects_generation += 1
+        self._bump_version("projects")
+
+    async def get_project_index(self) -> ProjectIndex:
+        """Get the resolution index for the current (cached) project list."""
+        projects = await self.get_cached_projects()
+        if self._project_index is None or self._project_index.projects is not projects:
+            self._project_index = ProjectIndex(projects)
+        return self._project_index
 
     async def get_project_by_key(self, key: str) -> Optional[Project]:
         """Get a project by its key."""
-        projects = await self.list_projects()
-        for project in projects:
-            if project.key.upper() == key.upper():
-                return project
-        return None
+        index = await self.get_project_index()
+        return index.get_by_key(key)
 
     async def get_project_by_name(self, name: str) -> Optional[Project]:
-        """Get a project by name (case-insensitive partial match)."""
-        projects = await self.list_projects()
-        name_lower = name.lower()
-        for project in projects:
-            if name_lower in project.name.lower() or name_lower == project.key.lower():
-                return project
-        return None
+        """Get a project by key or name (case-insensitive, exact > prefix > partial match).
+
+        Raises:
+            AmbiguousProjectError: If the name matches several projects equally well
+        """
+        index = await self.get_project_index()
+        return index.resolve(name)
 
     async def create_project(
         self,
@@ -99,7 +566,7 @@ class APIClient:
         data: Optional[CreateProjectRequest] = None,
     ) -> Project:
         """Create a new project.
-        
+
         Can be called with either a CreateProjectRequest object or individual kwargs.
         """
         if data is None:
@@ -110,32 +577,39 @@ class APIClient:
                 description=description,
                 key=key,
             )
-        
+
         payload = data.model_dump(by_alias=True, exclude_none=True)
-        response = await self.client.post("/projects", json=payload)
+        response = await self._request("POST", "/projects", json=payload)
         response.raise_for_status()
-        response_data = response.json()
-        # Backend wraps responses in { "data": {...} }
-        project_data = response_data.get("data", response_data) if isinstance(response_data, dict) and "data" in response_data else response_data
+        self.invalidate_project_cache()
+        self._invalidate_responses("/projects")
+        project_data = _unwrap(response.json())
         return Project.model_validate(project_data)
 
     async def delete_project(self, project_id: str) -> bool:
         """Delete a project by ID.
-        
+
         Args:
             project_id: The UUID of the project to delete
-            
+
         Returns:
             True if deletion was successful
         """
-        response = await self.client.delete(f"/projects/{project_id}")
+        response = await self._request("DELETE", f"/projects/{project_id}")
         response.raise_for_status()
+        self.invalidate_project_cache()
+        # Deleting a project deletes its tickets too
+        self._invalidate_responses("/projects", f"/projects/{project_id}", prefix="/tickets")
+        self._forget_project_tickets(project_id)
+        self._update_search_index(lambda index: index.remove_project(project_id))
+        self.replica.remove_project(project_id)
+        self._bump_version("tickets")
         return True
 
     # ==================== Tickets ====================
 
     async def list_tickets(
-        self, 
+        self,
         filters: Optional[TicketFilter] = None,
         project_id: Optional[str] = None,
         status: Optional[str] = None,
@@ -144,10 +618,12 @@ class APIClient:
         page: Optional[int] = None,
     ) -> PaginatedTickets:
         """List tickets with optional filters.
-        
+
         Can be called with either a TicketFilter object or individual kwargs.
         """
-        if filters is None and any([project_id, status, priority, limit is not None, page is not None]):
+        if filters is None and any(
+            [project_id, status, priority, limit is not None, page is not None]
+        ):
             filters = TicketFilter(
                 project_id=project_id,
                 status=status,  # type: ignore
@@ -155,32 +631,216 @@ class APIClient:
                 limit=limit or 20,  # Use default if None
                 page=page or 1,  # Use default if None
             )
-        
+
         params: dict[str, Any] = {}
         if filters:
             filter_dict = filters.model_dump(by_alias=True, exclude_none=True, mode='json')
             params = filter_dict
 
-        response = await self.client.get("/tickets", params=params)
-        response.raise_for_status()
-        data = response.json()
-        # Backend wraps responses in { "data": {...} }
-        tickets_data = data.get("data", data) if isinstance(data, dict) and "data" in data else data
-        return PaginatedTickets.model_validate(tickets_data)
-
-    async def get_ticket(self, ticket_id: str) -> Ticket:
-        """Get a ticket by ID."""
-        response = await self.client.get(f"/tickets/{ticket_id}")
-        response.raise_for_status()
-        data = response.json()
-        # Backend wraps responses in { "data": {...} }
-        ticket_data = data.get("data", data) if isinstance(data, dict) and "data" in data else data
-        return Ticket.model_validate(ticket_data)
+        result = await self._get_parsed("/tickets", PaginatedTickets.model_validate, params)
+        self._remember_tickets(result.items)
+        return result
+
+    async def iter_tickets(
+        self,
+        filters: Optional[TicketFilter] = None,
+        page_size: int = MAX_PAGE_SIZE,
+        max_items: Optional[int] = None,
+        prefetch: bool = True,
+    ) -> AsyncIterator[Ticket]:
+        """Iterate over every ticket matching a filter, page by page.
+
+        The next page is requested while the current one is being consumed,
+        and only one page is held at a time. Breaking out of the loop (or
+        hitting ``max_items``) cancels the outstanding prefetch.
+
+        Tickets created, deleted or moved while iterating shift the page
+        offsets; duplicates across a page boundary are skipped, but a ticket
+        can be missed.
+
+        Args:
+            filters: Filter and sort order (``page``/``limit`` are ignored)
+            page_size: Tickets per request (the backend allows up to 100)
+            max_items: Stop after this many tickets
+            prefetch: Request the next page early; turn off when the caller
+                usually stops within the first page
+
+        Yields:
+            Tickets in the backend's list order: by status and position, then
+            the filter's sort (except ``sort_by="priority"``, which comes first)
+        """
+        base = (filters or TicketFilter()).model_copy(
+            update={"page": 1, "limit": max(1, min(page_size, MAX_PAGE_SIZE))}
+        )
+
+        def fetch(page: int) -> "asyncio.Task[PaginatedTickets]":
+            params = base.model_copy(update={"page": page}).model_dump(
+                by_alias=True, exclude_none=True, mode="json"
+            )
+            return asyncio.ensure_future(
+                self._get_parsed("/tickets", PaginatedTickets.model_validate, params, cache=False)
+            )
+
+        pending: Optional[asyncio.Task[PaginatedTickets]] = fetch(1)
+        previous_ids: set[str] = set()
+        yielded = 0
+        try:
+            while pending is not None:
+                result = await pending
+                pending = None
+                self._remember_tickets(result.items)
+                more = bool(result.items) and result.page * base.limit < result.total
+                if more and prefetch:
+                    pending = fetch(result.page + 1)
+
+                page_ids = set()
+                for ticket in result.items:
+                    page_ids.add(ticket.id)
+                    if ticket.id in previous_ids:
+                        continue
+                    yield ticket
+                    yielded += 1
+                    if max_items is not None and yielded >= max_items:
+                        return
+                previous_ids = page_ids
+                if more and pending is None:
+                    pending = fetch(result.page + 1)
+        finally:
+            if pending is not None:
+                # Stopped early: drop the prefetch and retrieve its outcome
+                pending.cancel()
+                await asyncio.gather(pending, return_exceptions=True)
+
+    async def sync_tickets(
+        self, full: bool = False, reconcile_interval: float = 600.0
+    ) -> SyncResult:
+        """Bring the local ticket replica up to date.
+
+        Normally reads only tickets updated since the last pass
+        (``updatedSince`` the watermark). The first pass, ``full=True`` and
+        every ``reconcile_interval`` seconds re-read all tickets instead,
+        which is how deletions made elsewhere are found.
+
+        The backend lists tickets in board order (status, then position)
+        whatever ``sortBy`` says, so a pass always reads to the last page.
+        Tickets older than the watermark are dropped here too, for backends
+        that ignore ``updatedSince``.
+
+        Changes found here also refresh the ticket cache and search index.
+
+        Returns:
+            The tickets changed and deleted by this pass
+        """
+        async with self._sync_lock:
+            now = time.monotonic()
+            watermark = self.replica.watermark
+            if (
+                full
+                or not self.replica.ready
+                or now - self.replica.reconciled_at >= reconcile_interval
+            ):
+                tickets = [ticket async for ticket in self.iter_tickets()]
+                result = self.replica.reconcile(tickets, reconciled_at=now, since=watermark)
+            else:
+                since = TicketFilter(updated_since=watermark)
+                # Equal timestamps are re-read; applying them again is harmless
+                updated = [
+                    ticket
+                    async for ticket in self.iter_tickets(since)
+                    if watermark is None or ticket.updated_at >= watermark
+                ]
+                result = self.replica.apply_incremental(updated)
+
+        if result.changed or result.deleted:
+            self._bump_version("tickets")
+        self._remember_tickets(result.changed)
+        for ticket_id in result.deleted:
+            self._tickets.pop(ticket_id)
+        if result.deleted:
+            self._update_search_index(lambda index: index.remove_many(result.deleted))
+        return result
+
+    async def run_ticket_sync(self, interval: float, reconcile_interval: float) -> None:
+        """Sync the ticket replica every ``interval`` seconds until cancelled."""
+        while True:
+            try:
+                result = await self.sync_tickets(reconcile_interval=reconcile_interval)
+                if result.changed or result.deleted:
+                    logger.debug(
+                        f"Ticket sync ({'full' if result.full else 'incremental'}): "
+                        f"{len(result.changed)} changed, {len(result.deleted)} deleted"
+                    )
+            except Exception as e:
+                logger.warning(f"Ticket sync failed: {e}")
+            await asyncio.sleep(interval)
+
+    async def get_ticket(self, ticket_id: str, use_cache: bool = True) -> Ticket:
+        """Get a ticket by ID.
+
+        Args:
+            ticket_id: The UUID of the ticket
+            use_cache: Serve a recently seen copy without asking the backend
+        """
+        if use_cache:
+            cached = self._tickets.get(ticket_id)
+            if cached is not None:
+                return cached
+        ticket = await self._get_parsed(f"/tickets/{ticket_id}", Ticket.model_validate)
+        self._remember_tickets([ticket])
+        return ticket
+
+    def _search_index_fresh(self) -> bool:
+        return (
+            self.search_index is not None
+            and time.monotonic() - self._search_index_built_at < self.search_index_refresh
+        )
+
+    async def get_search_index(self) -> Optional[TicketSearchIndex]:
+        """Get the local ticket search index, (re)building it when stale.
+
+        Returns:
+            The index, or None if it is disabled or can't be built right now
+        """
+        if not self.search_index_enabled:
+            return None
+        if self._search_index_fresh():
+            return self.search_index
+        async with self._search_index_lock:
+            if self._search_index_fresh():
+                return self.search_index
+            self._search_index_backlog = []
+            try:
+                index = TicketSearchIndex()
+                if self.replica.ready:
+                    # Sync keeps a full copy; no need to page through the backend
+                    index.add_many(self.replica.tickets.values())
+                else:
+                    async for ticket in self.iter_tickets():
+                        index.add(ticket)
+                for apply in self._search_index_backlog:
+                    apply(index)
+            except Exception as e:
+                logger.warning(f"Could not build the ticket search index: {e}")
+                # Keep serving the previous index, if any, until the next attempt
+                return self.search_index
+            finally:
+                self._search_index_backlog = None
+            self.search_index = index
+            self._search_index_built_at = time.monotonic()
+            logger.info(f"Built ticket search index with {len(index)} tickets")
+            return index
 
     async def search_tickets(
         self, query: str, project_id: Optional[str] = None, limit: int = 10
     ) -> list[Ticket]:
-        """Search tickets by title/description."""
+        """Search tickets by title/description.
+
+        Uses the local index (ranked, typo-tolerant) when enabled, otherwise
+        the backend's substring search.
+        """
+        index = await self.get_search_index()
+        if index is not None:
+            return [ticket for ticket, _ in index.search(query, project_id, limit)]
         filters = TicketFilter(search=query, project_id=project_id, limit=limit)
         result = await self.list_tickets(filters)
         return result.items
@@ -188,16 +848,39 @@ class APIClient:
     async def find_ticket_by_title(
         self, title: str, project_id: Optional[str] = None
     ) -> Optional[Ticket]:
-        """Find a ticket by title (partial match)."""
-        tickets = await self.search_tickets(title, project_id, limit=5)
-        title_lower = title.lower()
-        for ticket in tickets:
-            if title_lower in ticket.title.lower():
+        """Find a ticket by title: an exact match, or the only ticket containing it.
+
+        Returns None rather than guessing when no ticket matches confidently.
+
+        Raises:
+            AmbiguousTicketError: If the title matches several tickets equally well
+        """
+        index = await self.get_search_index()
+        if index is not None:
+            ticket = index.find_by_title(title, project_id)
+            if ticket is not None:
                 return ticket
-        return tickets[0] if tickets else None
+            # No confident match: possibly created elsewhere since the last
+            # rebuild, or only a substring of the title; ask the backend
+
+        filters = TicketFilter(search=title, project_id=project_id, limit=20)
+        page = await self.list_tickets(filters)
+        title_lower = title.strip().lower()
+        exact = [t for t in page.items if t.title.lower() == title_lower]
+        if exact:
+            if len(exact) > 1:
+                raise AmbiguousTicketError(title, exact)
+            return exact[0]
+        partial = [t for t in page.items if title_lower in t.title.lower()]
+        if len(partial) > 1:
+            raise AmbiguousTicketError(title, partial)
+        # A sole partial match only counts if no other page could hold another
+        if partial and page.total <= len(page.items):
+            return partial[0]
+        return None
 
     async def create_ticket(
-        self, 
+        self,
         title: Optional[str] = None,
         description: Optional[str] = None,
         priority: Optional[str] = None,
@@ -206,7 +889,7 @@ class APIClient:
         data: Optional[CreateTicketRequest] = None,
     ) -> Ticket:
         """Create a new ticket.
-        
+
         Can be called with either a CreateTicketRequest object or individual kwargs.
         """
         if data is None:
@@ -219,18 +902,19 @@ class APIClient:
                 status=status,  # type: ignore
                 project_id=project_id,
             )
-        
+
         payload = data.model_dump(by_alias=True, exclude_none=True)
-        response = await self.client.post("/tickets", json=payload)
+        response = await self._request("POST", "/tickets", json=payload)
         response.raise_for_status()
-        response_data = response.json()
-        # Backend wraps responses in { "data": {...} }
-        ticket_data = response_data.get("data", response_data) if isinstance(response_data, dict) and "data" in response_data else response_data
-        return Ticket.model_validate(ticket_data)
+        self._invalidate_ticket_responses()
+        ticket_data = _unwrap(response.json())
+        ticket = Ticket.model_validate(ticket_data)
+        self._remember_tickets([ticket], changed=True)
+        return ticket
 
     async def update_ticket(
-        self, 
-        ticket_id: str, 
+        self,
+        ticket_id: str,
         title: Optional[str] = None,
         description: Optional[str] = None,
         priority: Optional[str] = None,
@@ -239,7 +923,7 @@ class APIClient:
         data: Optional[UpdateTicketRequest] = None,
     ) -> Ticket:
         """Update an existing ticket.
-        
+
         Can be called with either an UpdateTicketRequest object or individual kwargs.
         """
         if data is None:
@@ -250,73 +934,141 @@ class APIClient:
                 status=status,  # type: ignore
                 project_id=project_id,
             )
-        
+
         payload = data.model_dump(by_alias=True, exclude_none=True)
-        response = await self.client.put(f"/tickets/{ticket_id}", json=payload)
+        response = await self._request("PUT", f"/tickets/{ticket_id}", json=payload)
         response.raise_for_status()
-        response_data = response.json()
-        # Backend wraps responses in { "data": {...} }
-        ticket_data = response_data.get("data", response_data) if isinstance(response_data, dict) and "data" in response_data else response_data
-        return Ticket.model_validate(ticket_data)
+        self._invalidate_ticket_responses(ticket_id)
+        ticket_data = _unwrap(response.json())
+        ticket = Ticket.model_validate(ticket_data)
+        self._remember_tickets([ticket], changed=True)
+        return ticket
 
     async def move_ticket(
-        self, 
-        ticket_id: str, 
+        self,
+        ticket_id: str,
         new_status: Optional[str] = None,
         after_ticket_id: Optional[str] = None,
         data: Optional[ReorderTicketRequest] = None,
     ) -> Ticket:
         """Move/reorder a ticket (change status and/or position).
-        
+
         Can be called with either a ReorderTicketRequest object or individual kwargs.
+
+        Moves into the same column (project and status) are sent one at a
+        time: the backend places a moved ticket above the current top of the
+        column, so concurrent moves would all be given the same position.
+        The ticket's project comes from the ticket cache, or one GET.
         """
         if data is None:
             data = ReorderTicketRequest(
-                new_status=new_status,  # type: ignore
+                status=new_status,  # type: ignore
                 after_ticket_id=after_ticket_id,
             )
-        
+
         payload = data.model_dump(by_alias=True, exclude_none=True)
-        response = await self.client.patch(f"/tickets/{ticket_id}/reorder", json=payload)
+        current = await self.get_ticket(ticket_id)
+        column_key = (current.project_id, TicketStatus(data.status or current.status).value)
+        column = self._column_locks.setdefault(column_key, asyncio.Lock())
+        async with column:
+            response = await self._request(
+                "PATCH", f"/tickets/{ticket_id}/reorder", json=payload
+            )
         response.raise_for_status()
-        response_data = response.json()
-        # Backend wraps responses in { "data": {...} }
-        ticket_data = response_data.get("data", response_data) if isinstance(response_data, dict) and "data" in response_data else response_data
-        return Ticket.model_validate(ticket_data)
+        self._invalidate_ticket_responses(ticket_id)
+        ticket_data = _unwrap(response.json())
+        ticket = Ticket.model_validate(ticket_data)
+        self._remember_tickets([ticket], changed=True)
+        return ticket
 
     async def delete_ticket(self, ticket_id: str) -> bool:
         """Delete a ticket."""
-        response = await self.client.delete(f"/tickets/{ticket_id}")
+        response = await self._request("DELETE", f"/tickets/{ticket_id}")
         response.raise_for_status()
+        self._invalidate_ticket_responses(ticket_id)
+        self._tickets.pop(ticket_id)
+        self._update_search_index(lambda index: index.remove(ticket_id))
+        self.replica.remove([ticket_id])
         return True
 
     # ==================== Board Summary ====================
 
+    async def get_ticket_counts(
+        self, project_id: Optional[str] = None
+    ) -> Optional[list[TicketStatusCount]]:
+        """Get ticket counts grouped by project and status in a single request.
+
+        Returns:
+            The grouped counts, or None if the backend has no /tickets/counts endpoint
+        """
+        if self._grouped_counts_supported is False:
+            return None
+
+        params = {"projectId": project_id} if project_id else {}
+        try:
+            counts = await self._get_parsed(
+                "/tickets/counts",
+                lambda data: [TicketStatusCount.model_validate(c) for c in data],
+                params,
+            )
+        except httpx.HTTPStatusError as e:
+            status = e.response.status_code
+            if self._grouped_counts_supported is not None or status not in (400, 404, 405):
+                raise
+            # Older backends route "counts" to /tickets/{id} and reject it as a
+            # bad UUID. A filtered request can also get a 400 for a malformed
+            # projectId, so only an unfiltered one settles that the endpoint is missing.
+            if status == 400 and project_id:
+                return None
+            logger.info("Backend has no grouped ticket counts, falling back to per-status queries")
+            self._grouped_counts_supported = False
+            return None
+        self._grouped_counts_supported = True
+        return counts
+
+    async def _count_tickets_per_status(
+        self, projects: list[Project]
+    ) -> dict[tuple[str, str], int]:
+        """Count tickets per (project, status) with concurrent limit=1 list queries."""
+        keys = [(project.id, status.value) for project in projects for status in TicketStatus]
+        results = await self.gather(
+            *(
+                self.list_tickets(TicketFilter(project_id=pid, status=status, limit=1))  # type: ignore
+                for pid, status in keys
+            )
+        )
+        return {key: result.total for key, result in zip(keys, results)}
+
     async def get_board_summary(self, project_id: Optional[str] = None) -> dict[str, Any]:
-        """Get a summary of tickets grouped by status."""
-        summaries = []
+        """Get a summary of tickets grouped by status.
 
+        Uses the backend's grouped count endpoint when available, otherwise
+        fans out one count query per (project, status) with bounded concurrency.
+        """
         if project_id:
-            projects = [await self.get_project(project_id)]
+            project, counts = await self.gather(
+                self.get_project(project_id), self.get_ticket_counts(project_id)
+            )
+            projects = [project]
         else:
-            projects = await self.list_projects()
+            projects, counts = await self.gather(
+                self.list_projects(), self.get_ticket_counts()
+            )
 
+        if counts is not None:
+            totals = {(c.project_id, c.status.value): c.count for c in counts}
+        else:
+            totals = await self._count_tickets_per_status(projects)
+
+        summaries = []
         for project in projects:
-            summary = {
+            summary: dict[str, Any] = {
                 "project_id": project.id,
                 "project_name": project.name,
                 "project_key": project.key,
-                "TODO": 0,
-                "IN_PROGRESS": 0,
-                "DONE": 0,
-                "BLOCKED": 0,
             }
-
-            for status in ["TODO", "IN_PROGRESS", "DONE", "BLOCKED"]:
-                filters = TicketFilter(project_id=project.id, status=status, limit=1)  # type: ignore
-                result = await self.list_tickets(filters)
-                summary[status] = result.total
-
+            for status in TicketStatus:
+                summary[status.value] = totals.get((project.id, status.value), 0)
             summaries.append(summary)
 
         return {"projects": summaries, "total_projects": len(summaries)}
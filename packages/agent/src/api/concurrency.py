@@ -0,0 +1,99 @@
+"""Helpers for running independent backend requests concurrently."""
+
+import asyncio
+import inspect
+from collections.abc import Awaitable, Iterable
+from dataclasses import dataclass, field
+from typing import Any, Generic, Optional, TypeVar
+
+T = TypeVar("T")
+
+
+@dataclass
+class BatchResult(Generic[T]):
+    """Outcome of a batch where individual items may fail.
+
+    ``results`` keeps the input order; failed items are None there and
+    their exceptions are stored in ``errors`` under the same index.
+    """
+
+    results: list[Optional[T]] = field(default_factory=list)
+    errors: dict[int, BaseException] = field(default_factory=dict)
+
+    @property
+    def ok(self) -> bool:
+        """True if every item succeeded."""
+        return not self.errors
+
+    @property
+    def succeeded(self) -> list[T]:
+        """Results of the items that succeeded, in input order."""
+        return [r for i, r in enumerate(self.results) if i not in self.errors]  # type: ignore[misc]
+
+    def raise_first(self) -> None:
+        """Re-raise the error of the first failed item, if any."""
+        if self.errors:
+            raise self.errors[min(self.errors)]
+
+
+async def _run_limited(aw: Awaitable[T], semaphore: asyncio.Semaphore) -> T:
+    try:
+        async with semaphore:
+            return await aw
+    finally:
+        # Close coroutines that were cancelled before they got a slot
+        if inspect.iscoroutine(aw) and inspect.getcoroutinestate(aw) == inspect.CORO_CREATED:
+            aw.close()
+
+
+async def gather_bounded(
+    aws: Iterable[Awaitable[T]],
+    limit: int,
+    *,
+    return_exceptions: bool = False,
+) -> list[Any]:
+    """Await many awaitables with at most ``limit`` of them running at once.
+
+    Unlike ``asyncio.gather``, the remaining work is cancelled as soon as one
+    item fails (unless ``return_exceptions`` is set) and when the caller is
+    cancelled, so no orphaned requests keep running in the background.
+
+    Args:
+        aws: Awaitables (usually coroutines) to run
+        limit: Maximum number running concurrently
+        return_exceptions: Return exceptions in place of results instead of raising
+
+    Returns:
+        Results in input order
+    """
+    semaphore = asyncio.Semaphore(max(1, limit))
+    tasks = [asyncio.ensure_future(_run_limited(aw, semaphore)) for aw in aws]
+    if not tasks:
+        return []
+    try:
+        return await asyncio.gather(*tasks, return_exceptions=return_exceptions)
+    finally:
+        pending = [task for task in tasks if not task.done()]
+        for task in pending:
+            task.cancel()
+        if pending:
+            await asyncio.wait(pending)
+
+
+async def run_batch(aws: Iterable[Awaitable[T]], limit: int) -> BatchResult[T]:
+    """Run a batch with bounded concurrency, collecting per-item failures.
+
+    Cancellation of the caller still cancels the whole batch; ordinary
+    exceptions are recorded in the result instead of aborting the others.
+    """
+    outcomes = await gather_bounded(aws, limit, return_exceptions=True)
+    batch: BatchResult[T] = BatchResult()
+    for index, outcome in enumerate(outcomes):
+        if isinstance(outcome, BaseException):
+            if isinstance(outcome, asyncio.CancelledError):
+                raise outcome
+            batch.errors[index] = outcome
+            batch.results.append(None)
+        else:
+            batch.results.append(outcome)
+    return batch
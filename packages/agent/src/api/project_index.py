@@ -0,0 +1,121 @@
+"""In-memory index for resolving project names and keys."""
+
+import bisect
+from collections.abc import Iterable
+from typing import Optional
+
+from .schemas import Project
+
+# Substring lookups use trigrams; shorter queries fall back to a scan
+_NGRAM = 3
+
+
+class AmbiguousProjectError(LookupError):
+    """Raised when a project lookup matches more than one project."""
+
+    def __init__(self, query: str, candidates: list[Project]):
+        self.query = query
+        self.candidates = candidates
+        names = ", ".join(f"'{p.name}' ({p.key})" for p in candidates[:5])
+        more = f" and {len(candidates) - 5} more" if len(candidates) > 5 else ""
+        super().__init__(
+            f"Project '{query}' is ambiguous, it matches {names}{more}. "
+            "Use the project key to pick one."
+        )
+
+
+def _normalize(text: str) -> str:
+    """Lowercase and collapse whitespace for name comparisons."""
+    return " ".join(text.lower().split())
+
+
+def _ngrams(text: str) -> set[str]:
+    return {text[i : i + _NGRAM] for i in range(len(text) - _NGRAM + 1)}
+
+
+class ProjectIndex:
+    """Lookup structures built once per project list.
+
+    Resolution tries, in order: exact key, exact name, name prefix and
+    name substring. The first tier with any match wins; if that tier has
+    more than one match the lookup is reported as ambiguous.
+    """
+
+    def __init__(self, projects: Iterable[Project]):
+        # Keep the caller's list so the client can tell when it needs a rebuild
+        self.projects = projects if isinstance(projects, list) else list(projects)
+        self._by_key: dict[str, Project] = {}
+        self._by_name: dict[str, list[Project]] = {}
+        self._ngram_postings: dict[str, set[str]] = {}
+
+        for project in self.projects:
+            self._by_key[project.key.upper()] = project
+            name = _normalize(project.name)
+            self._by_name.setdefault(name, []).append(project)
+            for gram in _ngrams(name):
+                self._ngram_postings.setdefault(gram, set()).add(name)
+
+        # Sorted names let prefix lookups bisect instead of scanning
+        self._sorted_names = sorted(self._by_name)
+
+    def __len__(self) -> int:
+        return len(self.projects)
+
+    def get_by_key(self, key: str) -> Optional[Project]:
+        """Get a project by its exact key (case-insensitive)."""
+        return self._by_key.get(key.strip().upper())
+
+    def find_by_prefix(self, prefix: str) -> list[Project]:
+        """Get all projects whose normalized name starts with the prefix."""
+        prefix = _normalize(prefix)
+        matches: list[Project] = []
+        start = bisect.bisect_left(self._sorted_names, prefix)
+        for name in self._sorted_names[start:]:
+            if not name.startswith(prefix):
+                break
+            matches.extend(self._by_name[name])
+        return matches
+
+    def find_by_substring(self, text: str) -> list[Project]:
+        """Get all projects whose normalized name contains the text."""
+        text = _normalize(text)
+        if len(text) < _NGRAM:
+            names: Iterable[str] = self._sorted_names
+        else:
+            postings = [self._ngram_postings.get(gram, set()) for gram in _ngrams(text)]
+            postings.sort(key=len)
+            names = set.intersection(*postings) if postings else set()
+        return [p for name in sorted(names) if text in name for p in self._by_name[name]]
+
+    def resolve(self, query: str) -> Optional[Project]:
+        """Resolve a project key or (partial) name to a single project.
+
+        Args:
+            query: Project key, full name, or part of a name
+
+        Returns:
+            The matching project, or None if nothing matches
+
+        Raises:
+            AmbiguousProjectError: If the best matching tier has several projects
+        """
+        query = query.strip()
+        if not query:
+            return None
+
+        project = self.get_by_key(query)
+        if project:
+            return project
+
+        normalized = _normalize(query)
+        for lookup in (
+            lambda q: self._by_name.get(q, []),
+            self.find_by_prefix,
+            self.find_by_substring,
+        ):
+            matches = lookup(normalized)
+            if len(matches) == 1:
+                return matches[0]
+            if matches:
+                raise AmbiguousProjectError(query, matches)
+        return None
@@ -108,6 +108,7 @@ class TicketFilter(BaseModel):
     status: Optional[TicketStatus] = None
     priority: Optional[TicketPriority] = None
     search: Optional[str] = None
+    updated_since: Optional[datetime] = Field(default=None, serialization_alias="updatedSince")
     sort_by: str = Field(default="createdAt", serialization_alias="sortBy")
     sort_order: str = Field(default="desc", serialization_alias="sortOrder")
     page: int = 1
@@ -126,6 +127,17 @@ class PaginatedTickets(BaseModel):
         populate_by_name = True
 
 
+class TicketStatusCount(BaseModel):
+    """Ticket count for one project/status pair."""
+
+    project_id: str = Field(alias="projectId")
+    status: TicketStatus
+    count: int
+
+    class Config:
+        populate_by_name = True
+
+
 class BoardSummary(BaseModel):
     """Summary of tickets grouped by status."""
 
@@ -0,0 +1,292 @@
+"""In-memory full-text index over ticket titles and descriptions."""
+
+import math
+import re
+from collections.abc import Iterable
+from dataclasses import dataclass, field
+from typing import Optional
+
+from .schemas import Ticket
+
+_WORD = re.compile(r"\w+")
+_NGRAM = 3
+# Title terms count this many times towards term frequency and length
+TITLE_WEIGHT = 3
+# Score multipliers for query terms that were expanded rather than matched exactly
+PREFIX_WEIGHT = 0.8
+FUZZY_WEIGHT = 0.6
+# A title lookup only trusts a ranked hit this good (about one query term
+# matched in a title)...
+TITLE_MIN_SCORE = 2.0
+# ...that also beats the runner-up by this factor
+TITLE_MIN_MARGIN = 1.5
+
+
+class AmbiguousTicketError(LookupError):
+    """Raised when a ticket title lookup matches more than one ticket."""
+
+    def __init__(self, query: str, candidates: list[Ticket]):
+        self.query = query
+        self.candidates = candidates
+        titles = ", ".join(f"'{t.title}' ({t.id})" for t in candidates[:5])
+        more = f" and {len(candidates) - 5} more" if len(candidates) > 5 else ""
+        super().__init__(
+            f"Ticket '{query}' is ambiguous, it matches {titles}{more}. "
+            "Use the ticket ID to pick one."
+        )
+
+
+def tokenize(text: Optional[str]) -> list[str]:
+    """Lowercase word tokens of a text."""
+    return _WORD.findall(text.lower()) if text else []
+
+
+def _ngrams(term: str) -> set[str]:
+    padded = f"^{term}$"
+    return {padded[i : i + _NGRAM] for i in range(len(padded) - _NGRAM + 1)}
+
+
+def _max_edits(term: str) -> int:
+    """Typos tolerated for a query term of this length."""
+    if len(term) <= 3:
+        return 0
+    return 1 if len(term) <= 7 else 2
+
+
+def _within_distance(a: str, b: str, limit: int) -> bool:
+    """True if the Levenshtein distance between a and b is at most limit."""
+    if abs(len(a) - len(b)) > limit:
+        return False
+    previous = list(range(len(b) + 1))
+    for i, ca in enumerate(a, 1):
+        current = [i]
+        for j, cb in enumerate(b, 1):
+            current.append(
+                min(previous[j] + 1, current[j - 1] + 1, previous[j - 1] + (ca != cb))
+            )
+        if min(current) > limit:
+            return False
+        previous = current
+    return previous[-1] <= limit
+
+
+@dataclass
+class _Partition:
+    """Postings and length statistics for the tickets of one project."""
+
+    postings: dict[str, dict[str, int]] = field(default_factory=dict)
+    lengths: dict[str, int] = field(default_factory=dict)
+    total_length: int = 0
+
+
+class TicketSearchIndex:
+    """Inverted index ranking tickets with BM25, partitioned by project.
+
+    Query terms that aren't in the vocabulary are expanded to indexed terms
+    they prefix or that are within one or two edits (typos), with a lower
+    weight than exact matches. Tickets are added or replaced with ``add``
+    whenever a fresh copy is seen, so the index follows mutations.
+    """
+
+    def __init__(self, k1: float = 1.2, b: float = 0.75):
+        self.k1 = k1
+        self.b = b
+        self._tickets: dict[str, Ticket] = {}
+        self._partitions: dict[str, _Partition] = {}
+        # term -> number of indexed tickets containing it, and trigram -> terms
+        self._vocabulary: dict[str, int] = {}
+        self._term_grams: dict[str, set[str]] = {}
+
+    def __len__(self) -> int:
+        return len(self._tickets)
+
+    def __contains__(self, ticket_id: object) -> bool:
+        return ticket_id in self._tickets
+
+    # ==================== Maintenance ====================
+
+    def add(self, ticket: Ticket) -> None:
+        """Index a ticket, replacing any previous version of it."""
+        previous = self._tickets.get(ticket.id)
+        if previous is not None:
+            if (previous.title, previous.description, previous.project_id) == (
+                ticket.title,
+                ticket.description,
+                ticket.project_id,
+            ):
+                self._tickets[ticket.id] = ticket  # Only status/priority etc. changed
+                return
+            self.remove(ticket.id)
+
+        frequencies: dict[str, int] = {}
+        for term in tokenize(ticket.title):
+            frequencies[term] = frequencies.get(term, 0) + TITLE_WEIGHT
+        for term in tokenize(ticket.description):
+            frequencies[term] = frequencies.get(term, 0) + 1
+
+        partition = self._partitions.setdefault(ticket.project_id, _Partition())
+        for term, tf in frequencies.items():
+            partition.postings.setdefault(term, {})[ticket.id] = tf
+            self._add_term(term)
+        length = sum(frequencies.values())
+        partition.lengths[ticket.id] = length
+        partition.total_length += length
+        self._tickets[ticket.id] = ticket
+
+    def add_many(self, tickets: Iterable[Ticket]) -> None:
+        """Index several tickets."""
+        for ticket in tickets:
+            self.add(ticket)
+
+    def remove(self, ticket_id: str) -> None:
+        """Drop a ticket from the index (no-op if it isn't indexed)."""
+        ticket = self._tickets.pop(ticket_id, None)
+        if ticket is None:
+            return
+        partition = self._partitions[ticket.project_id]
+        for term in set(tokenize(ticket.title)) | set(tokenize(ticket.description)):
+            postings = partition.postings.get(term)
+            if postings is None or postings.pop(ticket_id, None) is None:
+                continue
+            if not postings:
+                del partition.postings[term]
+            self._remove_term(term)
+        partition.total_length -= partition.lengths.pop(ticket_id, 0)
+        if not partition.lengths:
+            del self._partitions[ticket.project_id]
+
+    def remove_many(self, ticket_ids: Iterable[str]) -> None:
+        """Drop several tickets."""
+        for ticket_id in ticket_ids:
+            self.remove(ticket_id)
+
+    def remove_project(self, project_id: str) -> None:
+        """Drop every ticket of a project."""
+        partition = self._partitions.get(project_id)
+        if partition is not None:
+            for ticket_id in list(partition.lengths):
+                self.remove(ticket_id)
+
+    def clear(self) -> None:
+        """Drop everything."""
+        self._tickets.clear()
+        self._partitions.clear()
+        self._vocabulary.clear()
+        self._term_grams.clear()
+
+    def _add_term(self, term: str) -> None:
+        count = self._vocabulary.get(term, 0)
+        if count == 0:
+            for gram in _ngrams(term):
+                self._term_grams.setdefault(gram, set()).add(term)
+        self._vocabulary[term] = count + 1
+
+    def _remove_term(self, term: str) -> None:
+        count = self._vocabulary.get(term, 0) - 1
+        if count > 0:
+            self._vocabulary[term] = count
+            return
+        self._vocabulary.pop(term, None)
+        for gram in _ngrams(term):
+            terms = self._term_grams.get(gram)
+            if terms is not None:
+                terms.discard(term)
+                if not terms:
+                    del self._term_grams[gram]
+
+    # ==================== Queries ====================
+
+    def _expand(self, term: str) -> list[tuple[str, float]]:
+        """Indexed terms to score for a query term, with their weights."""
+        if term in self._vocabulary:
+            return [(term, 1.0)]
+        grams = _ngrams(term)
+        candidates: set[str] = set()
+        for gram in grams:
+            candidates |= self._term_grams.get(gram, set())
+        limit = _max_edits(term)
+        expanded = []
+        for candidate in candidates:
+            if len(term) >= 3 and candidate.startswith(term):
+                expanded.append((candidate, PREFIX_WEIGHT))
+            elif limit and _within_distance(term, candidate, limit):
+                expanded.append((candidate, FUZZY_WEIGHT))
+        return expanded
+
+    def search(
+        self, query: str, project_id: Optional[str] = None, limit: int = 10
+    ) -> list[tuple[Ticket, float]]:
+        """Rank tickets against a free-text query.
+
+        Args:
+            query: Search text (typos and word prefixes are tolerated)
+            project_id: Only search this project's tickets
+            limit: Max results
+
+        Returns:
+            (ticket, score) pairs, best first
+        """
+        if project_id is not None:
+            partition = self._partitions.get(project_id)
+            partitions = [partition] if partition else []
+        else:
+            partitions = list(self._partitions.values())
+        docs = sum(len(p.lengths) for p in partitions)
+        if not docs:
+            return []
+        avg_length = sum(p.total_length for p in partitions) / docs
+
+        scores: dict[str, float] = {}
+        for query_term in dict.fromkeys(tokenize(query)):
+            # Best match per ticket, so several expansions of one typo don't add up
+            term_scores: dict[str, float] = {}
+            for term, weight in self._expand(query_term):
+                matching = [p for p in partitions if term in p.postings]
+                df = sum(len(p.postings[term]) for p in matching)
+                if not df:
+                    continue
+                idf = math.log(1 + (docs - df + 0.5) / (df + 0.5))
+                for partition in matching:
+                    for ticket_id, tf in partition.postings[term].items():
+                        norm = 1 - self.b + self.b * partition.lengths[ticket_id] / avg_length
+                        score = weight * idf * tf * (self.k1 + 1) / (tf + self.k1 * norm)
+                        if score > term_scores.get(ticket_id, 0.0):
+                            term_scores[ticket_id] = score
+            for ticket_id, score in term_scores.items():
+                scores[ticket_id] = scores.get(ticket_id, 0.0) + score
+
+        ranked = sorted(scores.items(), key=lambda item: item[1], reverse=True)[:limit]
+        return [(self._tickets[ticket_id], score) for ticket_id, score in ranked]
+
+    def find_by_title(
+        self,
+        title: str,
+        project_id: Optional[str] = None,
+        min_score: float = TITLE_MIN_SCORE,
+        min_margin: float = TITLE_MIN_MARGIN,
+    ) -> Optional[Ticket]:
+        """Best ticket for a (possibly partial or misspelled) title.
+
+        An exact title match (ignoring case and spacing) wins. Otherwise the
+        top-ranked result is only returned if it scores at least
+        ``min_score`` and ``min_margin`` times the runner-up; a weaker or
+        closely contested hit returns None.
+
+        Raises:
+            AmbiguousTicketError: If several tickets have exactly this title
+        """
+        wanted = " ".join(tokenize(title))
+        if not wanted:
+            return None
+        results = self.search(title, project_id, limit=20)
+        exact = [ticket for ticket, _ in results if " ".join(tokenize(ticket.title)) == wanted]
+        if len(exact) > 1:
+            raise AmbiguousTicketError(title, exact)
+        if exact:
+            return exact[0]
+        if not results or results[0][1] < min_score:
+            return None
+        if len(results) > 1 and results[0][1] < results[1][1] * min_margin:
+            return None
+        return results[0][0]
+
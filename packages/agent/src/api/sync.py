@@ -0,0 +1,95 @@
+"""Local replica of the backend's tickets, kept current by incremental sync."""
+
+from collections.abc import Iterable
+from dataclasses import dataclass, field
+from datetime import datetime
+from typing import Optional
+
+from .schemas import Ticket
+
+
+@dataclass
+class SyncResult:
+    """What one sync pass changed in the replica."""
+
+    full: bool
+    changed: list[Ticket] = field(default_factory=list)
+    deleted: list[str] = field(default_factory=list)
+
+
+class TicketReplica:
+    """Tickets by ID plus the ``updatedAt`` watermark they were synced up to.
+
+    The replica only holds data; ``APIClient.sync_tickets`` fills it. An
+    incremental pass reads the tickets updated since the watermark, so it
+    costs one request when little has changed. Deletes don't show up that
+    way, so a periodic full pass (reconciliation) merges a full listing and
+    reports the IDs that disappeared.
+    """
+
+    def __init__(self) -> None:
+        self.tickets: dict[str, Ticket] = {}
+        self.watermark: Optional[datetime] = None
+        self.reconciled_at = 0.0  # time.monotonic() of the last full pass
+
+    def __len__(self) -> int:
+        return len(self.tickets)
+
+    @property
+    def ready(self) -> bool:
+        """True once a full pass has completed."""
+        return self.reconciled_at > 0
+
+    def _advance(self, ticket: Ticket) -> None:
+        if self.watermark is None or ticket.updated_at > self.watermark:
+            self.watermark = ticket.updated_at
+
+    def upsert(self, tickets: Iterable[Ticket]) -> list[Ticket]:
+        """Apply fresh copies of tickets; returns the ones that actually changed."""
+        changed = []
+        for ticket in tickets:
+            current = self.tickets.get(ticket.id)
+            if current is not None and current.updated_at >= ticket.updated_at:
+                continue
+            self.tickets[ticket.id] = ticket
+            changed.append(ticket)
+        return changed
+
+    def remove(self, ticket_ids: Iterable[str]) -> None:
+        """Drop tickets known to be deleted."""
+        for ticket_id in ticket_ids:
+            self.tickets.pop(ticket_id, None)
+
+    def remove_project(self, project_id: str) -> None:
+        """Drop every ticket of a deleted project."""
+        self.remove([t.id for t in self.tickets.values() if t.project_id == project_id])
+
+    def reconcile(
+        self, tickets: list[Ticket], reconciled_at: float, since: Optional[datetime]
+    ) -> SyncResult:
+        """Merge a full listing and drop the tickets missing from it.
+
+        A listing is read page by page, so a ticket created or moved while
+        it was read can be missing from it. Tickets updated at or after
+        ``since`` (the watermark when the listing started) are kept; a later
+        pass settles them.
+        """
+        seen = {ticket.id for ticket in tickets}
+        deleted = [
+            ticket_id
+            for ticket_id, ticket in self.tickets.items()
+            if ticket_id not in seen and (since is None or ticket.updated_at < since)
+        ]
+        changed = self.upsert(tickets)
+        self.remove(deleted)
+        for ticket in tickets:
+            self._advance(ticket)
+        self.reconciled_at = reconciled_at
+        return SyncResult(full=True, changed=changed, deleted=deleted)
+
+    def apply_incremental(self, tickets: list[Ticket]) -> SyncResult:
+        """Apply tickets updated at or after the watermark."""
+        changed = self.upsert(tickets)
+        for ticket in tickets:
+            self._advance(ticket)
+        return SyncResult(full=False, changed=changed)
@@ -1,6 +1,7 @@
 """Application settings and configuration."""
 
 import os
+
 from pydantic_settings import BaseSettings
 
 
@@ -13,18 +14,77 @@ class Settings(BaseSettings):
 
     # Backend API
     backend_api_url: str = "http://backend:3001"
+    project_cache_ttl_seconds: float = 60.0  # 0 disables the project cache
+    backend_max_concurrency: int = 8  # Max requests in flight per API client
+    response_cache_size: int = 256  # GET responses kept for ETag revalidation, 0 disables
+    ticket_cache_size: int = 1000  # Tickets kept by ID for local reads, 0 disables
+    ticket_cache_ttl_seconds: float = 30.0
+    ticket_search_index: bool = False  # Rank searches with a local full-text index
+    ticket_search_index_refresh_seconds: float = 300.0  # Full rebuild interval
+
+    # Background ticket sync (local replica kept current via updatedAt watermarks)
+    ticket_sync_enabled: bool = False
+    ticket_sync_interval_seconds: float = 30.0  # Incremental poll interval
+    ticket_sync_reconcile_seconds: float = 600.0  # Full re-read to detect deletions
+
+    # Backend HTTP connection pool
+    backend_max_connections: int = 20
+    backend_max_keepalive_connections: int = 10
+    backend_keepalive_expiry_seconds: float = 30.0
+    backend_connect_timeout_seconds: float = 5.0
+    backend_read_timeout_seconds: float = 30.0
+    backend_http2: bool = False  # Requires the "http2" extra (h2 package)
+    backend_warm_connections: int = 2  # Connections opened at startup
+
+    # Backend retries and circuit breaker
+    backend_retry_attempts: int = 3  # Total attempts for idempotent requests
+    backend_retry_base_delay_seconds: float = 0.1
+    backend_retry_max_delay_seconds: float = 2.0
+    backend_circuit_failure_threshold: int = 5
+    backend_circuit_reset_seconds: float = 30.0
+
+    # Answer simple commands ("list projects", "move X to done") without the model
+    fast_path_enabled: bool = True
+
+    # Reuse replies to repeated read-only questions until the data they read changes
+    agent_response_cache_size: int = 256  # 0 disables
+    agent_response_cache_ttl_seconds: float = 120.0
+
+    # Tool results sent to the model
+    tool_result_mode: str = "compact"  # "compact" or "full"
+    tool_description_max_chars: int = 160  # 0 keeps full descriptions
+    tool_result_tabular: bool = True  # Encode lists as columns + rows
+    tool_result_fields: dict[str, list[str]] = {}  # Per-tool ticket field overrides
+
+    # Stream model output token by token on /chat/stream
+    stream_tokens: bool = True
+
+    # Per-turn trace spans (requested per turn with debug_timing on /chat and /chat/stream)
+    trace_export_path: str = ""  # Trace every turn and append its spans to this JSONL file
 
     # Server
     agent_port: int = 8000
     log_level: str = "INFO"
 
     # Session
+    session_backend: str = "memory"  # "memory" or "sqlite"
+    session_db_path: str = "sessions.db"  # Used by the sqlite backend
+    session_max_sessions: int = 1000  # Least recently used sessions are evicted beyond this
     session_ttl_hours: int = 24
-    max_conversation_length: int = 50
+    max_conversation_length: int = 50  # Max history contents sent to the model per step
+    history_keep_turns: int = 6  # Most recent user turns sent verbatim
+    history_summary_chars: int = 200  # Max chars kept from older model replies
 
-    # Rate limiting
-    requests_per_minute: int = 20
-    requests_per_day: int = 500
+    # Rate limiting and admission control for /chat and /chat/stream
+    requests_per_minute: int = 20  # Per user, 0 disables
+    requests_per_day: int = 500  # Per user, 0 disables
+    # Requests with the frontend's placeholder user_id are limited per client
+    # address; take it from X-Forwarded-For only behind a trusted proxy
+    rate_limit_trust_forwarded_for: bool = False
+    rate_limit_backend: str = "memory"  # "memory" or "sqlite" (shared by workers)
+    rate_limit_db_path: str = "ratelimit.db"  # Used by the sqlite backend
+    max_concurrent_chats: int = 16  # Agent runs in flight per process, 0 disables
+    admission_max_wait_seconds: float = 10.0  # Queue wait for a free slot before 429
 
     class Config:
         env_file = ".env"
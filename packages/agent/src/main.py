@@ -1,29 +1,33 @@
 """FastAPI application for the Task Assistant Agent.
 
-Uses Google ADK with LlmAgent, Runner, and InMemorySessionService.
+Uses Google ADK with LlmAgent, Runner, and a pluggable session service.
 """
 
-import json
 import logging
+import math
+import time
+from collections.abc import Callable
 from contextlib import asynccontextmanager
-from datetime import datetime
 from typing import Any
 
-from fastapi import FastAPI, HTTPException
+from fastapi import FastAPI, HTTPException, Request
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.responses import PlainTextResponse
 from pydantic import BaseModel, Field
 from sse_starlette.sse import EventSourceResponse
+from starlette.background import BackgroundTask
 
 from .agent import TaskAgentService
 from .config import settings
-
-
-def json_serializer(obj: Any) -> str:
-    """Custom JSON serializer for objects not serializable by default."""
-    if isinstance(obj, datetime):
-        return obj.isoformat()
-    raise TypeError(f"Object of type {type(obj).__name__} is not JSON serializable")
-
+from .metrics import CHAT_SECONDS, REGISTRY, TIME_TO_FIRST_TOKEN_SECONDS
+from .ratelimit import (
+    ANONYMOUS_USER_ID,
+    AdmissionController,
+    RateLimitExceededError,
+    create_admission_controller,
+    rate_limit_key,
+)
+from .sse import SSEEncoder
 
 # Configure logging
 logging.basicConfig(
@@ -35,25 +39,32 @@ logger = logging.getLogger(__name__)
 # Global agent service instance
 agent_service: TaskAgentService | None = None
 
+# Per-user rate limits and the cap on concurrent agent runs
+admission: AdmissionController | None = None
+
 
 @asynccontextmanager
 async def lifespan(app: FastAPI):
     """Application lifespan handler."""
-    global agent_service
+    global agent_service, admission
 
     # Startup
     logger.info("Starting Task Assistant Agent...")
+    admission = create_admission_controller(settings)
 
     if not settings.gemini_api_key:
         logger.warning("GEMINI_API_KEY not set - agent will not function")
     else:
         agent_service = TaskAgentService()
+        await agent_service.start()
         logger.info(f"Agent initialized with model: {settings.gemini_model}")
 
     yield
 
     # Shutdown
     logger.info("Shutting down Task Assistant Agent...")
+    if agent_service is not None:
+        await agent_service.close()
 
 
 app = FastAPI(
@@ -82,8 +93,11 @@ class ChatRequest(BaseModel):
     """Request to chat with the agent."""
 
     message: str = Field(..., description="The user's message")
-    user_id: str = Field(default="default_user", description="User identifier")
+    user_id: str = Field(default=ANONYMOUS_USER_ID, description="User identifier")
     session_id: str | None = Field(default=None, description="Session ID to continue")
+    debug_timing: bool = Field(
+        default=False, description="Return the turn's trace spans (waterfall)"
+    )
 
 
 class ChatResponse(BaseModel):
@@ -94,6 +108,12 @@ class ChatResponse(BaseModel):
     actions_taken: list[dict[str, Any]] = Field(
         default_factory=list, description="Tools that were called"
     )
+    tokens_saved: int = Field(
+        default=0, description="Estimated prompt tokens saved by history compaction"
+    )
+    trace: dict[str, Any] | None = Field(
+        default=None, description="Trace spans of the turn, when debug_timing was set"
+    )
 
 
 class HealthResponse(BaseModel):
@@ -102,6 +122,10 @@ class HealthResponse(BaseModel):
     status: str
     agent_ready: bool
     model: str
+    backend_circuit: dict[str, Any] | None = None
+    fast_path: dict[str, Any] | None = None
+    response_cache: dict[str, Any] | None = None
+    admission: dict[str, int] | None = None
 
 
 class SessionInfo(BaseModel):
@@ -118,18 +142,68 @@ class SessionInfo(BaseModel):
 # ============================================================================
 
 
+async def admit(user_id: str, http_request: Request) -> Callable[[], None]:
+    """Admit a chat request, or answer 429 with Retry-After.
+
+    Returns:
+        Function that releases the admission when the request is done
+    """
+    if admission is None:
+        return lambda: None
+    key = rate_limit_key(
+        user_id,
+        http_request.client.host if http_request.client else None,
+        http_request.headers.get("X-Forwarded-For"),
+        settings.rate_limit_trust_forwarded_for,
+    )
+    try:
+        return await admission.acquire(key)
+    except RateLimitExceededError as e:
+        raise HTTPException(
+            status_code=429,
+            detail=str(e),
+            headers={"Retry-After": str(max(1, math.ceil(e.retry_after)))},
+        )
+
+
 @app.get("/health", response_model=HealthResponse)
 async def health_check() -> HealthResponse:
-    """Health check endpoint."""
+    """Health check endpoint.
+
+    Reports "degraded" while the backend circuit breaker is open.
+    """
+    circuit = None
+    fast_path = None
+    response_cache = None
+    status = "healthy"
+    if agent_service is not None:
+        circuit = agent_service.api_client.circuit_breaker.snapshot()
+        if circuit["state"] != "closed":
+            status = "degraded"
+        fast_path = agent_service.router.stats()
+        response_cache = agent_service.replies.stats()
+
     return HealthResponse(
-        status="healthy",
+        status=status,
         agent_ready=agent_service is not None,
         model=settings.gemini_model,
+        backend_circuit=circuit,
+        fast_path=fast_path,
+        response_cache=response_cache,
+        admission=admission.stats() if admission is not None else None,
     )
 
 
+@app.get("/metrics", response_class=PlainTextResponse)
+async def metrics() -> PlainTextResponse:
+    """Metrics in the Prometheus text exposition format."""
+    if agent_service is not None:
+        await agent_service.update_metrics()
+    return PlainTextResponse(REGISTRY.render(), media_type="text/plain; version=0.0.4")
+
+
 @app.post("/chat", response_model=ChatResponse)
-async def chat(request: ChatRequest) -> ChatResponse:
+async def chat(request: ChatRequest, http_request: Request) -> ChatResponse:
     """Process a chat message and return a response.
 
     This endpoint processes the message and returns the complete response.
@@ -141,26 +215,34 @@ async def chat(request: ChatRequest) -> ChatResponse:
             detail="Agent not initialized. Check GEMINI_API_KEY configuration.",
         )
 
+    release = await admit(request.user_id, http_request)
+    started = time.perf_counter()
     try:
         result = await agent_service.chat(
             message=request.message,
             user_id=request.user_id,
             session_id=request.session_id,
+            debug_timing=request.debug_timing,
         )
 
         return ChatResponse(
             response=result["response"],
             session_id=result["session_id"],
             actions_taken=result["actions_taken"],
+            tokens_saved=result.get("tokens_saved", 0),
+            trace=result.get("trace"),
         )
 
     except Exception as e:
         logger.exception("Error processing chat message")
         raise HTTPException(status_code=500, detail=str(e))
+    finally:
+        CHAT_SECONDS.observe(time.perf_counter() - started, endpoint="chat")
+        release()
 
 
 @app.post("/chat/stream")
-async def chat_stream(request: ChatRequest):
+async def chat_stream(request: ChatRequest, http_request: Request):
     """Process a chat message and stream the response.
 
     Uses Server-Sent Events (SSE) to stream the response in real-time.
@@ -169,8 +251,13 @@ async def chat_stream(request: ChatRequest):
     - text: Text chunk of the response
     - tool_call: Agent is calling a tool
     - tool_result: Result from tool execution
-    - done: Stream complete with full response
+    - trace: Trace spans of the turn, sent before done when debug_timing is set
+    - done: Stream complete with full response; its actions_taken refer to
+      the tool_call/tool_result events by id instead of repeating them
     - error: An error occurred
+
+    Answers 429 with Retry-After when the user is over their rate limit or
+    the server is at capacity.
     """
     if agent_service is None:
         raise HTTPException(
@@ -178,28 +265,40 @@ async def chat_stream(request: ChatRequest):
             detail="Agent not initialized. Check GEMINI_API_KEY configuration.",
         )
 
+    # Admit before the stream starts so a rejection is a plain 429 response
+    release = await admit(request.user_id, http_request)
+
     async def event_generator():
-        """Generate SSE events from agent stream."""
+        """Generate pre-encoded SSE frames from the agent stream."""
+        encoder = SSEEncoder()
+        started = time.perf_counter()
+        first_token = True
         try:
             async for chunk in agent_service.chat_stream(
                 message=request.message,
                 user_id=request.user_id,
                 session_id=request.session_id,
+                debug_timing=request.debug_timing,
             ):
-                event_type = chunk.get("type", "text")
-                yield {
-                    "event": event_type,
-                    "data": json.dumps(chunk, default=json_serializer),
-                }
+                if first_token and chunk.get("type") == "text":
+                    first_token = False
+                    TIME_TO_FIRST_TOKEN_SECONDS.observe(time.perf_counter() - started)
+                yield encoder.encode(chunk)
 
         except Exception as e:
             logger.exception("Error in stream")
-            yield {
-                "event": "error",
-                "data": json.dumps({"error": str(e)}),
-            }
+            yield encoder.error(str(e))
+        finally:
+            CHAT_SECONDS.observe(time.perf_counter() - started, endpoint="chat_stream")
+            release()
 
-    return EventSourceResponse(event_generator())
+    # The generator's finally only runs if the stream starts; the background
+    # task covers a client that disconnects before it does
+    try:
+        return EventSourceResponse(event_generator(), background=BackgroundTask(release))
+    except BaseException:
+        release()
+        raise
 
 
 @app.get("/sessions/{user_id}/{session_id}", response_model=SessionInfo)
@@ -0,0 +1,216 @@
+"""In-process metrics exposed in the Prometheus text format.
+
+A deliberately small registry (counters, gauges, histograms with labels)
+so ``/metrics`` works without extra dependencies. Metrics are updated
+from the request path; snapshot values such as session count and cache
+hit ratios are set right before each scrape.
+"""
+
+import math
+from collections.abc import Iterable, Sequence
+from typing import Optional
+
+LabelValues = tuple[str, ...]
+
+# Latency buckets in seconds, from cache hits to slow model turns
+DEFAULT_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0, 60.0)
+
+
+def _escape(value: str) -> str:
+    return value.replace("\\", "\\\\").replace("\n", "\\n").replace('"', '\\"')
+
+
+def _format_value(value: float) -> str:
+    if math.isinf(value):
+        return "+Inf" if value > 0 else "-Inf"
+    if value == int(value) and abs(value) < 1e15:
+        return str(int(value))
+    return repr(value)
+
+
+class Metric:
+    """Base class: a named metric with a fixed set of label names."""
+
+    type = "untyped"
+
+    def __init__(self, name: str, documentation: str, labels: Sequence[str] = ()):
+        self.name = name
+        self.documentation = documentation
+        self.label_names = tuple(labels)
+
+    def _key(self, labels: dict[str, str]) -> LabelValues:
+        if set(labels) != set(self.label_names):
+            raise ValueError(f"{self.name} expects labels {self.label_names}, got {tuple(labels)}")
+        return tuple(str(labels[name]) for name in self.label_names)
+
+    def _labels(self, values: LabelValues, extra: Optional[tuple[str, str]] = None) -> str:
+        pairs = list(zip(self.label_names, values))
+        if extra:
+            pairs.append(extra)
+        if not pairs:
+            return ""
+        return "{" + ",".join(f'{k}="{_escape(v)}"' for k, v in pairs) + "}"
+
+    def samples(self) -> Iterable[str]:
+        """Exposition lines for this metric's samples."""
+        raise NotImplementedError
+
+    def render(self) -> str:
+        header = [f"# HELP {self.name} {self.documentation}", f"# TYPE {self.name} {self.type}"]
+        return "\n".join(header + list(self.samples()))
+
+
+class Counter(Metric):
+    """A value that only goes up."""
+
+    type = "counter"
+
+    def __init__(self, name: str, documentation: str, labels: Sequence[str] = ()):
+        super().__init__(name, documentation, labels)
+        self._values: dict[LabelValues, float] = {}
+
+    def inc(self, amount: float = 1.0, **labels: str) -> None:
+        key = self._key(labels)
+        self._values[key] = self._values.get(key, 0.0) + amount
+
+    def samples(self) -> Iterable[str]:
+        for values, value in sorted(self._values.items()):
+            yield f"{self.name}{self._labels(values)} {_format_value(value)}"
+
+
+class Gauge(Metric):
+    """A value that is set to the current reading."""
+
+    type = "gauge"
+
+    def __init__(self, name: str, documentation: str, labels: Sequence[str] = ()):
+        super().__init__(name, documentation, labels)
+        self._values: dict[LabelValues, float] = {}
+
+    def set(self, value: float, **labels: str) -> None:
+        self._values[self._key(labels)] = float(value)
+
+    def samples(self) -> Iterable[str]:
+        for values, value in sorted(self._values.items()):
+            yield f"{self.name}{self._labels(values)} {_format_value(value)}"
+
+
+class Histogram(Metric):
+    """Observations counted into cumulative buckets, plus their sum and count."""
+
+    type = "histogram"
+
+    def __init__(
+        self,
+        name: str,
+        documentation: str,
+        labels: Sequence[str] = (),
+        buckets: Sequence[float] = DEFAULT_BUCKETS,
+    ):
+        super().__init__(name, documentation, labels)
+        self.buckets = tuple(sorted(buckets))
+        # label values -> (per-bucket counts (non-cumulative, last is +Inf), sum)
+        self._series: dict[LabelValues, tuple[list[int], list[float]]] = {}
+
+    def observe(self, value: float, **labels: str) -> None:
+        key = self._key(labels)
+        series = self._series.get(key)
+        if series is None:
+            series = self._series[key] = ([0] * (len(self.buckets) + 1), [0.0])
+        counts, total = series
+        for index, bound in enumerate(self.buckets):
+            if value <= bound:
+                counts[index] += 1
+                break
+        else:
+            counts[-1] += 1
+        total[0] += value
+
+    def samples(self) -> Iterable[str]:
+        for values, (counts, total) in sorted(self._series.items()):
+            cumulative = 0
+            for bound, count in zip((*self.buckets, math.inf), counts):
+                cumulative += count
+                le = ("le", _format_value(bound))
+                yield f"{self.name}_bucket{self._labels(values, le)} {cumulative}"
+            yield f"{self.name}_sum{self._labels(values)} {_format_value(total[0])}"
+            yield f"{self.name}_count{self._labels(values)} {cumulative}"
+
+
+class Registry:
+    """A set of metrics rendered together."""
+
+    def __init__(self) -> None:
+        self._metrics: dict[str, Metric] = {}
+
+    def register(self, metric: Metric) -> Metric:
+        if metric.name in self._metrics:
+            raise ValueError(f"Metric {metric.name} is already registered")
+        self._metrics[metric.name] = metric
+        return metric
+
+    def counter(self, name: str, documentation: str, labels: Sequence[str] = ()) -> Counter:
+        return self.register(Counter(name, documentation, labels))  # type: ignore[return-value]
+
+    def gauge(self, name: str, documentation: str, labels: Sequence[str] = ()) -> Gauge:
+        return self.register(Gauge(name, documentation, labels))  # type: ignore[return-value]
+
+    def histogram(
+        self,
+        name: str,
+        documentation: str,
+        labels: Sequence[str] = (),
+        buckets: Sequence[float] = DEFAULT_BUCKETS,
+    ) -> Histogram:
+        return self.register(  # type: ignore[return-value]
+            Histogram(name, documentation, labels, buckets)
+        )
+
+    def render(self) -> str:
+        """All metrics in the Prometheus text exposition format."""
+        return "\n".join(metric.render() for metric in self._metrics.values()) + "\n"
+
+
+REGISTRY = Registry()
+
+CHAT_SECONDS = REGISTRY.histogram(
+    "agent_chat_duration_seconds", "End-to-end chat turn latency", ["endpoint"]
+)
+TIME_TO_FIRST_TOKEN_SECONDS = REGISTRY.histogram(
+    "agent_chat_time_to_first_token_seconds",
+    "Time from request to the first text event on /chat/stream",
+)
+TOOL_SECONDS = REGISTRY.histogram(
+    "agent_tool_duration_seconds", "Tool execution time", ["tool", "outcome"]
+)
+MODEL_CALLS_PER_TURN = REGISTRY.histogram(
+    "agent_model_calls_per_turn",
+    "Gemini calls made per agent turn",
+    buckets=(0, 1, 2, 3, 4, 6, 8, 12, 16),
+)
+BACKEND_SECONDS = REGISTRY.histogram(
+    "agent_backend_request_duration_seconds",
+    "Backend HTTP request latency by endpoint and status",
+    ["method", "endpoint", "status"],
+)
+SESSIONS = REGISTRY.gauge("agent_sessions", "Sessions currently stored")
+CACHE_HIT_RATIO = REGISTRY.gauge(
+    "agent_cache_hit_ratio", "Hit ratio of in-process caches since start", ["cache"]
+)
+CACHE_ENTRIES = REGISTRY.gauge(
+    "agent_cache_entries", "Entries held by in-process caches", ["cache"]
+)
+COALESCED_GETS = REGISTRY.gauge(
+    "agent_backend_coalesced_gets", "Backend GETs served by joining an identical in-flight GET"
+)
+
+# Second path segments that name a sub-collection rather than a resource ID
+_COLLECTIONS = frozenset({"counts"})
+
+
+def endpoint_label(path: str) -> str:
+    """Collapse the resource ID in a URL path so labels stay low-cardinality (/tickets/:id)."""
+    segments = path.split("?", 1)[0].strip("/").split("/")
+    if len(segments) > 1 and segments[1] not in _COLLECTIONS:
+        segments[1] = ":id"
+    return "/" + "/".join(segments)
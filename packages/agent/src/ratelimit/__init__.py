@@ -0,0 +1,21 @@
+"""Rate limiting and admission control for chat requests."""
+
+from .limiter import (
+    ANONYMOUS_USER_ID,
+    AdmissionController,
+    MemoryRateLimitStore,
+    RateLimitExceededError,
+    SqliteRateLimitStore,
+    create_admission_controller,
+    rate_limit_key,
+)
+
+__all__ = [
+    "ANONYMOUS_USER_ID",
+    "AdmissionController",
+    "MemoryRateLimitStore",
+    "RateLimitExceededError",
+    "SqliteRateLimitStore",
+    "create_admission_controller",
+    "rate_limit_key",
+]
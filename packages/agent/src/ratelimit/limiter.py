@@ -0,0 +1,362 @@
+"""Per-user rate limits and admission control for chat requests.
+
+Every chat request first takes a token from its user's buckets (one per
+minute window, one per day window; anonymous requests are keyed on the
+client address, see ``rate_limit_key``). Requests that pass then wait for one
+of a fixed number of agent-run slots, for at most ``max_wait`` seconds;
+one that gets no slot is given its tokens back, since it never ran.
+Either check failing raises ``RateLimitExceededError`` with a retry hint, which
+the API turns into a 429 with ``Retry-After``.
+
+Bucket counters live in memory (per process) or in a SQLite file, which
+several worker processes can share. The slot limit is always per process.
+"""
+
+import asyncio
+import logging
+import math
+import sqlite3
+import time
+from abc import ABC, abstractmethod
+from collections.abc import AsyncIterator, Callable, Sequence
+from contextlib import asynccontextmanager
+from dataclasses import dataclass
+from typing import TYPE_CHECKING, Optional
+
+if TYPE_CHECKING:
+    from ..config.settings import Settings
+
+logger = logging.getLogger(__name__)
+
+# user_id the web frontend sends for every visitor; not an identity to limit by
+ANONYMOUS_USER_ID = "default_user"
+# Retry hint when every agent slot stayed busy for the whole queue wait
+BUSY_RETRY_AFTER = 1.0
+# Idle bucket rows are swept at most this often (seconds)
+PURGE_INTERVAL = 60.0
+
+
+class RateLimitExceededError(RuntimeError):
+    """Raised when a request is not admitted."""
+
+    def __init__(self, retry_after: float, reason: str):
+        self.retry_after = retry_after
+        self.reason = reason
+        if reason == "busy":
+            message = "Too many requests in progress, try again shortly"
+        else:
+            message = f"Rate limit exceeded, retry in {math.ceil(retry_after)}s"
+        super().__init__(message)
+
+
+def rate_limit_key(
+    user_id: str,
+    client_host: Optional[str],
+    forwarded_for: Optional[str] = None,
+    trust_forwarded_for: bool = False,
+) -> str:
+    """The identity whose buckets a request spends.
+
+    Real user IDs are limited per user. The frontend's placeholder ID is
+    shared by every visitor, so those requests are limited per client
+    address instead: the first ``X-Forwarded-For`` hop when the proxy in
+    front is trusted, else the connecting address.
+    """
+    if user_id != ANONYMOUS_USER_ID:
+        return f"user:{user_id}"
+    address = client_host or "unknown"
+    if trust_forwarded_for and forwarded_for:
+        address = forwarded_for.split(",")[0].strip() or address
+    return f"ip:{address}"
+
+
+@dataclass(frozen=True)
+class Bucket:
+    """A token bucket holding ``capacity`` requests, refilled over ``period`` seconds."""
+
+    name: str
+    capacity: float
+    period: float
+
+    @property
+    def rate(self) -> float:
+        """Tokens added per second."""
+        return self.capacity / self.period
+
+
+def _take(
+    state: dict[str, tuple[float, float]], key: str, buckets: Sequence[Bucket], now: float
+) -> float:
+    """Take one token from every bucket, or none if any is empty.
+
+    ``state`` maps bucket keys to (tokens, updated_at) and is updated in place.
+
+    Returns:
+        0 if admitted, else seconds until every bucket has a token again
+    """
+    levels = {}
+    retry_after = 0.0
+    for bucket in buckets:
+        bucket_key = f"{key}:{bucket.name}"
+        tokens, updated = state.get(bucket_key, (bucket.capacity, now))
+        tokens = min(bucket.capacity, tokens + (now - updated) * bucket.rate)
+        levels[bucket_key] = tokens
+        if tokens < 1:
+            retry_after = max(retry_after, (1 - tokens) / bucket.rate)
+    if retry_after:
+        return retry_after
+    for bucket_key, tokens in levels.items():
+        state[bucket_key] = (tokens - 1, now)
+    return 0.0
+
+
+def _refund(
+    state: dict[str, tuple[float, float]], key: str, buckets: Sequence[Bucket], now: float
+) -> float:
+    """Give back the token ``_take`` took from every bucket (capped at capacity).
+
+    Returns:
+        0, so the update is always stored
+    """
+    for bucket in buckets:
+        bucket_key = f"{key}:{bucket.name}"
+        if bucket_key not in state:
+            continue  # Idle buckets are full
+        tokens, updated = state[bucket_key]
+        tokens = min(bucket.capacity, tokens + (now - updated) * bucket.rate + 1)
+        state[bucket_key] = (tokens, now)
+    return 0.0
+
+
+BucketUpdate = Callable[[dict[str, tuple[float, float]], str, Sequence[Bucket], float], float]
+
+
+class RateLimitStore(ABC):
+    """Where bucket levels are kept."""
+
+    @abstractmethod
+    async def take(self, key: str, buckets: Sequence[Bucket]) -> float:
+        """Take a token from each of the key's buckets (see ``_take``)."""
+
+    @abstractmethod
+    async def refund(self, key: str, buckets: Sequence[Bucket]) -> None:
+        """Return the tokens of a take whose request was not run after all."""
+
+
+class MemoryRateLimitStore(RateLimitStore):
+    """Bucket levels in process memory."""
+
+    def __init__(self, max_keys: int = 10000):
+        self.max_keys = max_keys
+        self._state: dict[str, tuple[float, float]] = {}
+
+    async def take(self, key: str, buckets: Sequence[Bucket]) -> float:
+        now = time.monotonic()
+        if len(self._state) > self.max_keys:
+            self._purge(buckets, now)
+        return _take(self._state, key, buckets, now)
+
+    async def refund(self, key: str, buckets: Sequence[Bucket]) -> None:
+        _refund(self._state, key, buckets, time.monotonic())
+
+    def _purge(self, buckets: Sequence[Bucket], now: float) -> None:
+        """Drop buckets idle for a whole period; they'd be full again anyway."""
+        longest = max(bucket.period for bucket in buckets)
+        self._state = {
+            k: (tokens, updated)
+            for k, (tokens, updated) in self._state.items()
+            if now - updated < longest
+        }
+
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS rate_buckets (
+    key TEXT PRIMARY KEY,
+    tokens REAL NOT NULL,
+    updated REAL NOT NULL
+);
+CREATE INDEX IF NOT EXISTS idx_rate_buckets_updated ON rate_buckets (updated);
+"""
+
+
+class SqliteRateLimitStore(RateLimitStore):
+    """Bucket levels in a SQLite file shared by worker processes.
+
+    Each take is one ``BEGIN IMMEDIATE`` transaction, so concurrent workers
+    can't both spend the last token.
+    """
+
+    def __init__(self, db_path: str):
+        self.db_path = db_path
+        self._last_purge = 0.0
+        conn = self._open()
+        try:
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.executescript(_SCHEMA)
+        finally:
+            conn.close()
+
+    def _open(self) -> sqlite3.Connection:
+        return sqlite3.connect(self.db_path, timeout=10.0, isolation_level=None)
+
+    def _update_blocking(self, key: str, buckets: Sequence[Bucket], update: BucketUpdate) -> float:
+        """Apply ``_take`` or ``_refund`` to the key's stored buckets in one transaction."""
+        now = time.time()  # Wall clock: shared across processes
+        keys = [f"{key}:{bucket.name}" for bucket in buckets]
+        conn = self._open()
+        try:
+            conn.execute("BEGIN IMMEDIATE")
+            try:
+                rows = conn.execute(
+                    f"SELECT key, tokens, updated FROM rate_buckets "
+                    f"WHERE key IN ({','.join('?' * len(keys))})",
+                    keys,
+                ).fetchall()
+                state = {row[0]: (row[1], row[2]) for row in rows}
+                retry_after = update(state, key, buckets, now)
+                if not retry_after:
+                    conn.executemany(
+                        "INSERT OR REPLACE INTO rate_buckets (key, tokens, updated) "
+                        "VALUES (?, ?, ?)",
+                        [(k, *state[k]) for k in keys],
+                    )
+                if now - self._last_purge >= PURGE_INTERVAL:
+                    self._last_purge = now
+                    longest = max(bucket.period for bucket in buckets)
+                    conn.execute("DELETE FROM rate_buckets WHERE updated < ?", (now - longest,))
+                conn.execute("COMMIT")
+            except BaseException:
+                conn.execute("ROLLBACK")
+                raise
+            return retry_after
+        finally:
+            conn.close()
+
+    async def take(self, key: str, buckets: Sequence[Bucket]) -> float:
+        return await asyncio.to_thread(self._update_blocking, key, buckets, _take)
+
+    async def refund(self, key: str, buckets: Sequence[Bucket]) -> None:
+        await asyncio.to_thread(self._update_blocking, key, buckets, _refund)
+
+
+class AdmissionController:
+    """Per-user token buckets plus a cap on concurrent agent runs."""
+
+    def __init__(
+        self,
+        store: RateLimitStore,
+        requests_per_minute: int = 20,
+        requests_per_day: int = 500,
+        max_concurrent: int = 16,
+        max_wait: float = 10.0,
+    ):
+        """Initialize the controller.
+
+        Args:
+            store: Where bucket levels are kept
+            requests_per_minute: Per-user burst limit (0 disables)
+            requests_per_day: Per-user daily limit (0 disables)
+            max_concurrent: Agent runs in flight at once in this process (0 disables)
+            max_wait: Seconds a request may queue for a free slot
+        """
+        self.store = store
+        self.buckets: list[Bucket] = []
+        if requests_per_minute > 0:
+            self.buckets.append(Bucket("minute", requests_per_minute, 60.0))
+        if requests_per_day > 0:
+            self.buckets.append(Bucket("day", requests_per_day, 24 * 3600.0))
+        self.max_concurrent = max_concurrent
+        self.max_wait = max_wait
+        self._slots: Optional[asyncio.Semaphore] = (
+            asyncio.Semaphore(max_concurrent) if max_concurrent > 0 else None
+        )
+        self.admitted = 0
+        self.rate_limited = 0
+        self.busy = 0
+        self.in_flight = 0
+        self.waiting = 0
+
+    async def acquire(self, user_id: str) -> Callable[[], None]:
+        """Admit a request or raise.
+
+        Returns:
+            A function that releases the request's slot (safe to call twice)
+
+        Raises:
+            RateLimitExceededError: If the user is over a limit or no slot freed up in time
+        """
+        if self.buckets:
+            retry_after = await self.store.take(user_id, self.buckets)
+            if retry_after:
+                self.rate_limited += 1
+                raise RateLimitExceededError(retry_after, "rate")
+
+        slots = self._slots
+        if slots is not None:
+            self.waiting += 1
+            try:
+                await asyncio.wait_for(slots.acquire(), timeout=self.max_wait)
+            except BaseException as e:
+                if self.buckets:
+                    # Not run, so it shouldn't count against the user's quota
+                    await self.store.refund(user_id, self.buckets)
+                if isinstance(e, asyncio.TimeoutError):
+                    self.busy += 1
+                    raise RateLimitExceededError(BUSY_RETRY_AFTER, "busy") from None
+                raise
+            finally:
+                self.waiting -= 1
+
+        self.admitted += 1
+        self.in_flight += 1
+        released = False
+
+        def release() -> None:
+            nonlocal released
+            if released:
+                return
+            released = True
+            self.in_flight -= 1
+            if slots is not None:
+                slots.release()
+
+        return release
+
+    @asynccontextmanager
+    async def admit(self, user_id: str) -> AsyncIterator[None]:
+        """Hold an admission for the duration of the block."""
+        release = await self.acquire(user_id)
+        try:
+            yield
+        finally:
+            release()
+
+    def stats(self) -> dict[str, int]:
+        """Admission counters."""
+        return {
+            "admitted": self.admitted,
+            "rate_limited": self.rate_limited,
+            "busy": self.busy,
+            "in_flight": self.in_flight,
+            "waiting": self.waiting,
+        }
+
+
+def create_admission_controller(settings: "Settings") -> AdmissionController:
+    """Build the admission controller selected by ``settings.rate_limit_backend``."""
+    backend = settings.rate_limit_backend.lower()
+    store: RateLimitStore
+    if backend == "sqlite":
+        logger.info(f"Using SQLite rate limit store at {settings.rate_limit_db_path}")
+        store = SqliteRateLimitStore(settings.rate_limit_db_path)
+    elif backend == "memory":
+        store = MemoryRateLimitStore()
+    else:
+        raise ValueError(f"Unknown rate limit backend '{settings.rate_limit_backend}'")
+    return AdmissionController(
+        store,
+        requests_per_minute=settings.requests_per_minute,
+        requests_per_day=settings.requests_per_day,
+        max_concurrent=settings.max_concurrent_chats,
+        max_wait=settings.admission_max_wait_seconds,
+    )
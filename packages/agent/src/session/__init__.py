@@ -0,0 +1,13 @@
+"""Session storage backends."""
+
+from .store import (
+    BoundedInMemorySessionService,
+    SqliteSessionService,
+    create_session_service,
+)
+
+__all__ = [
+    "BoundedInMemorySessionService",
+    "SqliteSessionService",
+    "create_session_service",
+]
@@ -0,0 +1,406 @@
+"""Session storage backends with TTL expiry and size bounds.
+
+Both services implement ADK's ``BaseSessionService`` so they can be handed
+to the ``Runner`` in place of ``InMemorySessionService``:
+
+- ``BoundedInMemorySessionService`` keeps sessions in process memory and
+  evicts the least recently used ones once ``max_sessions`` is reached.
+- ``SqliteSessionService`` persists sessions to a SQLite file so they
+  survive restarts and can be shared by several worker processes.
+"""
+
+import asyncio
+import json
+import logging
+import sqlite3
+import time
+import uuid
+from collections import OrderedDict
+from collections.abc import Iterator
+from contextlib import contextmanager
+from typing import TYPE_CHECKING, Any, Optional
+
+from google.adk.events import Event
+from google.adk.sessions import BaseSessionService, InMemorySessionService, Session
+from google.adk.sessions.base_session_service import GetSessionConfig, ListSessionsResponse
+
+if TYPE_CHECKING:
+    from ..config.settings import Settings
+
+logger = logging.getLogger(__name__)
+
+SessionKey = tuple[str, str, str]
+
+# Expired sessions are swept at most this often (seconds)
+PURGE_INTERVAL = 60.0
+
+
+class BoundedInMemorySessionService(InMemorySessionService):
+    """In-memory sessions with idle expiry and LRU eviction."""
+
+    def __init__(self, max_sessions: int = 1000, ttl_seconds: float = 24 * 3600):
+        super().__init__()
+        self.max_sessions = max_sessions
+        self.ttl_seconds = ttl_seconds
+        # Session key -> last access time, least recently used first
+        self._last_access: OrderedDict[SessionKey, float] = OrderedDict()
+
+    def _touch(self, key: SessionKey) -> None:
+        self._last_access[key] = time.monotonic()
+        self._last_access.move_to_end(key)
+
+    def _is_expired(self, key: SessionKey) -> bool:
+        last_access = self._last_access.get(key)
+        return last_access is not None and time.monotonic() - last_access >= self.ttl_seconds
+
+    async def _evict(self, key: SessionKey) -> None:
+        self._last_access.pop(key, None)
+        app_name, user_id, session_id = key
+        await super().delete_session(app_name=app_name, user_id=user_id, session_id=session_id)
+
+    async def session_count(self) -> int:
+        """Number of live sessions."""
+        return len(self._last_access)
+
+    async def purge_expired(self) -> int:
+        """Delete sessions idle for longer than the TTL.
+
+        Returns:
+            Number of sessions removed
+        """
+        # Access order is oldest first, so expired sessions form a prefix
+        expired = []
+        for key in self._last_access:
+            if not self._is_expired(key):
+                break
+            expired.append(key)
+        for key in expired:
+            await self._evict(key)
+        return len(expired)
+
+    async def create_session(
+        self,
+        *,
+        app_name: str,
+        user_id: str,
+        state: Optional[dict[str, Any]] = None,
+        session_id: Optional[str] = None,
+    ) -> Session:
+        session = await super().create_session(
+            app_name=app_name, user_id=user_id, state=state, session_id=session_id
+        )
+        self._touch((app_name, user_id, session.id))
+
+        await self.purge_expired()
+        while len(self._last_access) > self.max_sessions:
+            oldest = next(iter(self._last_access))
+            logger.debug(f"Evicting least recently used session {oldest[2]}")
+            await self._evict(oldest)
+        return session
+
+    async def get_session(
+        self,
+        *,
+        app_name: str,
+        user_id: str,
+        session_id: str,
+        config: Optional[GetSessionConfig] = None,
+    ) -> Optional[Session]:
+        key = (app_name, user_id, session_id)
+        if self._is_expired(key):
+            await self._evict(key)
+            return None
+        session = await super().get_session(
+            app_name=app_name, user_id=user_id, session_id=session_id, config=config
+        )
+        if session is None:
+            self._last_access.pop(key, None)
+        else:
+            self._touch(key)
+        return session
+
+    async def append_event(self, session: Session, event: Event) -> Event:
+        event = await super().append_event(session, event)
+        self._touch((session.app_name, session.user_id, session.id))
+        return event
+
+    async def delete_session(self, *, app_name: str, user_id: str, session_id: str) -> None:
+        self._last_access.pop((app_name, user_id, session_id), None)
+        await super().delete_session(app_name=app_name, user_id=user_id, session_id=session_id)
+
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS sessions (
+    app_name TEXT NOT NULL,
+    user_id TEXT NOT NULL,
+    id TEXT NOT NULL,
+    state TEXT NOT NULL,
+    update_time REAL NOT NULL,
+    PRIMARY KEY (app_name, user_id, id)
+);
+CREATE INDEX IF NOT EXISTS idx_sessions_update_time ON sessions (update_time);
+CREATE TABLE IF NOT EXISTS events (
+    seq INTEGER PRIMARY KEY AUTOINCREMENT,
+    app_name TEXT NOT NULL,
+    user_id TEXT NOT NULL,
+    session_id TEXT NOT NULL,
+    data TEXT NOT NULL
+);
+CREATE INDEX IF NOT EXISTS idx_events_session ON events (app_name, user_id, session_id, seq);
+"""
+
+
+class SqliteSessionService(BaseSessionService):
+    """Sessions persisted in a SQLite database.
+
+    Events are stored one row each, so appending an event writes a single
+    row instead of re-serializing the whole conversation. The database runs
+    in WAL mode so several worker processes can share one file.
+
+    Session state is stored per session; ADK's ``app:``/``user:`` scoped
+    state is not shared across sessions by this backend.
+    """
+
+    def __init__(
+        self,
+        db_path: str,
+        max_sessions: int = 1000,
+        ttl_seconds: float = 24 * 3600,
+    ):
+        self.db_path = db_path
+        self.max_sessions = max_sessions
+        self.ttl_seconds = ttl_seconds
+        self._last_purge = 0.0
+        with self._connect() as conn:
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.executescript(_SCHEMA)
+
+    @contextmanager
+    def _connect(self) -> Iterator[sqlite3.Connection]:
+        """Open a short-lived connection and commit on success.
+
+        A connection per operation keeps this safe across worker threads.
+        """
+        conn = sqlite3.connect(self.db_path, timeout=10.0)
+        try:
+            with conn:
+                yield conn
+        finally:
+            conn.close()
+
+    async def _run(self, fn: Any, *args: Any) -> Any:
+        """Run a blocking database function off the event loop."""
+        return await asyncio.to_thread(fn, *args)
+
+    # ---------- blocking helpers (run in a worker thread) ----------
+
+    def _insert_session(self, session: Session) -> None:
+        with self._connect() as conn:
+            conn.execute(
+                "INSERT INTO sessions (app_name, user_id, id, state, update_time) "
+                "VALUES (?, ?, ?, ?, ?)",
+                (
+                    session.app_name,
+                    session.user_id,
+                    session.id,
+                    json.dumps(session.state),
+                    session.last_update_time,
+                ),
+            )
+
+    def _load_session(
+        self, app_name: str, user_id: str, session_id: str, config: Optional[GetSessionConfig]
+    ) -> Optional[Session]:
+        with self._connect() as conn:
+            row = conn.execute(
+                "SELECT state, update_time FROM sessions "
+                "WHERE app_name = ? AND user_id = ? AND id = ?",
+                (app_name, user_id, session_id),
+            ).fetchone()
+            if row is None:
+                return None
+            state, update_time = row
+            if time.time() - update_time >= self.ttl_seconds:
+                self._delete_rows(conn, app_name, user_id, session_id)
+                return None
+
+            query = (
+                "SELECT data FROM events WHERE app_name = ? AND user_id = ? AND session_id = ? "
+                "ORDER BY seq"
+            )
+            events = [
+                Event.model_validate_json(data)
+                for (data,) in conn.execute(query, (app_name, user_id, session_id))
+            ]
+
+        if config is not None:
+            if config.after_timestamp:
+                events = [e for e in events if e.timestamp >= config.after_timestamp]
+            if config.num_recent_events:
+                events = events[-config.num_recent_events :]
+
+        return Session(
+            id=session_id,
+            app_name=app_name,
+            user_id=user_id,
+            state=json.loads(state),
+            events=events,
+            last_update_time=update_time,
+        )
+
+    def _store_event(self, session: Session, event: Event) -> None:
+        key = (session.app_name, session.user_id, session.id)
+        with self._connect() as conn:
+            conn.execute(
+                "INSERT INTO events (app_name, user_id, session_id, data) VALUES (?, ?, ?, ?)",
+                (*key, event.model_dump_json(exclude_none=True)),
+            )
+            conn.execute(
+                "UPDATE sessions SET state = ?, update_time = ? "
+                "WHERE app_name = ? AND user_id = ? AND id = ?",
+                (json.dumps(session.state), session.last_update_time, *key),
+            )
+
+    @staticmethod
+    def _delete_rows(
+        conn: sqlite3.Connection, app_name: str, user_id: str, session_id: str
+    ) -> None:
+        conn.execute(
+            "DELETE FROM events WHERE app_name = ? AND user_id = ? AND session_id = ?",
+            (app_name, user_id, session_id),
+        )
+        conn.execute(
+            "DELETE FROM sessions WHERE app_name = ? AND user_id = ? AND id = ?",
+            (app_name, user_id, session_id),
+        )
+
+    def _delete_session(self, app_name: str, user_id: str, session_id: str) -> None:
+        with self._connect() as conn:
+            self._delete_rows(conn, app_name, user_id, session_id)
+
+    def _purge(self) -> int:
+        """Delete expired sessions, then the oldest ones beyond max_sessions."""
+        cutoff = time.time() - self.ttl_seconds
+        with self._connect() as conn:
+            doomed = conn.execute(
+                "SELECT app_name, user_id, id FROM sessions WHERE update_time < ?", (cutoff,)
+            ).fetchall()
+            (count,) = conn.execute("SELECT COUNT(*) FROM sessions").fetchone()
+            excess = count - len(doomed) - self.max_sessions
+            if excess > 0:
+                doomed += conn.execute(
+                    "SELECT app_name, user_id, id FROM sessions WHERE update_time >= ? "
+                    "ORDER BY update_time LIMIT ?",
+                    (cutoff, excess),
+                ).fetchall()
+            for app_name, user_id, session_id in doomed:
+                self._delete_rows(conn, app_name, user_id, session_id)
+        return len(doomed)
+
+    def _count(self) -> int:
+        with self._connect() as conn:
+            (count,) = conn.execute("SELECT COUNT(*) FROM sessions").fetchone()
+        return int(count)
+
+    def _list(self, app_name: str, user_id: Optional[str]) -> list[Session]:
+        query = "SELECT user_id, id, state, update_time FROM sessions WHERE app_name = ?"
+        params: tuple[Any, ...] = (app_name,)
+        if user_id is not None:
+            query += " AND user_id = ?"
+            params += (user_id,)
+        with self._connect() as conn:
+            rows = conn.execute(query, params).fetchall()
+        return [
+            Session(
+                id=sid,
+                app_name=app_name,
+                user_id=uid,
+                state=json.loads(state),
+                events=[],
+                last_update_time=update_time,
+            )
+            for uid, sid, state, update_time in rows
+        ]
+
+    # ---------- BaseSessionService API ----------
+
+    async def session_count(self) -> int:
+        """Number of stored sessions."""
+        return await self._run(self._count)
+
+    async def purge_expired(self) -> int:
+        """Delete expired sessions and enforce max_sessions.
+
+        Returns:
+            Number of sessions removed
+        """
+        self._last_purge = time.monotonic()
+        removed = await self._run(self._purge)
+        if removed:
+            logger.info(f"Purged {removed} expired or excess session(s)")
+        return removed
+
+    async def create_session(
+        self,
+        *,
+        app_name: str,
+        user_id: str,
+        state: Optional[dict[str, Any]] = None,
+        session_id: Optional[str] = None,
+    ) -> Session:
+        session = Session(
+            id=session_id.strip() if session_id and session_id.strip() else str(uuid.uuid4()),
+            app_name=app_name,
+            user_id=user_id,
+            state=state or {},
+            last_update_time=time.time(),
+        )
+        await self._run(self._insert_session, session)
+        if time.monotonic() - self._last_purge >= PURGE_INTERVAL:
+            await self.purge_expired()
+        return session
+
+    async def get_session(
+        self,
+        *,
+        app_name: str,
+        user_id: str,
+        session_id: str,
+        config: Optional[GetSessionConfig] = None,
+    ) -> Optional[Session]:
+        return await self._run(self._load_session, app_name, user_id, session_id, config)
+
+    async def list_sessions(
+        self, *, app_name: str, user_id: Optional[str] = None
+    ) -> ListSessionsResponse:
+        sessions = await self._run(self._list, app_name, user_id)
+        return ListSessionsResponse(sessions=sessions)
+
+    async def delete_session(self, *, app_name: str, user_id: str, session_id: str) -> None:
+        await self._run(self._delete_session, app_name, user_id, session_id)
+
+    async def append_event(self, session: Session, event: Event) -> Event:
+        event = await super().append_event(session, event)
+        if event.partial:
+            return event
+        session.last_update_time = event.timestamp
+        await self._run(self._store_event, session, event)
+        return event
+
+
+def create_session_service(settings: "Settings") -> BaseSessionService:
+    """Build the session service selected by ``settings.session_backend``."""
+    ttl_seconds = settings.session_ttl_hours * 3600
+    backend = settings.session_backend.lower()
+    if backend == "sqlite":
+        logger.info(f"Using SQLite session store at {settings.session_db_path}")
+        return SqliteSessionService(
+            settings.session_db_path,
+            max_sessions=settings.session_max_sessions,
+            ttl_seconds=ttl_seconds,
+        )
+    if backend != "memory":
+        raise ValueError(f"Unknown session backend '{settings.session_backend}'")
+    return BoundedInMemorySessionService(
+        max_sessions=settings.session_max_sessions, ttl_seconds=ttl_seconds
+    )
@@ -0,0 +1,97 @@
+"""Server-Sent Events encoding for /chat/stream.
+
+Each chunk from ``TaskAgentService.chat_stream`` is serialized once into a
+complete SSE frame (bytes), which the response writes as-is. JSON goes
+through orjson when it is installed and the standard library otherwise.
+
+Frames carry sequential ``id`` fields. The ``done`` frame doesn't repeat
+the tool calls and results the client has already received; each entry
+of its ``actions_taken`` points at the ``tool_call`` and ``tool_result``
+frames by id instead.
+"""
+
+import json
+from datetime import date, datetime
+from enum import Enum
+from typing import Any, Optional
+
+from pydantic import BaseModel
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover - optional speedup
+    orjson = None
+
+
+def _default(obj: Any) -> Any:
+    """Encode the few non-JSON types that show up in tool results."""
+    if isinstance(obj, (datetime, date)):
+        return obj.isoformat()
+    if isinstance(obj, Enum):
+        return obj.value
+    if isinstance(obj, BaseModel):
+        return obj.model_dump(mode="json")
+    if isinstance(obj, (set, frozenset, tuple)):
+        return list(obj)
+    raise TypeError(f"Object of type {type(obj).__name__} is not JSON serializable")
+
+
+def dumps(data: Any) -> bytes:
+    """Serialize to compact JSON bytes."""
+    if orjson is not None:
+        # datetimes, enums and dataclasses are handled natively
+        return orjson.dumps(data, default=_default, option=orjson.OPT_NON_STR_KEYS)
+    return json.dumps(
+        data, default=_default, separators=(",", ":"), ensure_ascii=False
+    ).encode()
+
+
+class SSEEncoder:
+    """Turns the chunks of one stream into SSE frames."""
+
+    def __init__(self, sep: bytes = b"\r\n"):
+        self.sep = sep
+        self._next_id = 0
+        self._call_ids: list[int] = []
+        # Results are matched to actions by identity: the recorder puts the
+        # same dict in the tool_result chunk and in the action
+        self._result_ids: dict[int, int] = {}
+
+    def frame(self, event: str, data: Any, event_id: Optional[int] = None) -> bytes:
+        """Build one SSE frame (JSON data never contains raw newlines)."""
+        sep = self.sep
+        head = b""
+        if event_id is not None:
+            head = b"id: " + str(event_id).encode() + sep
+        return head + b"event: " + event.encode() + sep + b"data: " + dumps(data) + sep + sep
+
+    def encode(self, chunk: dict[str, Any]) -> bytes:
+        """Encode a stream chunk, compacting the done event."""
+        event_id = self._next_id
+        self._next_id += 1
+        event = chunk.get("type", "text")
+        if event == "tool_call":
+            self._call_ids.append(event_id)
+        elif event == "tool_result" and chunk.get("result") is not None:
+            self._result_ids[id(chunk["result"])] = event_id
+        elif event == "done":
+            chunk = self._compact_done(chunk)
+        return self.frame(event, chunk, event_id)
+
+    def error(self, message: str) -> bytes:
+        """Encode an error event."""
+        return self.encode({"type": "error", "error": message})
+
+    def _compact_done(self, chunk: dict[str, Any]) -> dict[str, Any]:
+        actions = []
+        for index, action in enumerate(chunk.get("actions_taken") or []):
+            ref: dict[str, Any] = {"tool": action.get("tool")}
+            if index < len(self._call_ids):
+                ref["call_event"] = self._call_ids[index]
+            result_id = self._result_ids.get(id(action.get("result")))
+            if "result" in action and result_id is not None:
+                ref["result_event"] = result_id
+            if "duration_ms" in action:
+                ref["duration_ms"] = action["duration_ms"]
+            actions.append(ref)
+        return {**chunk, "actions_taken": actions}
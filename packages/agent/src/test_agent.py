@@ -14,6 +14,7 @@ import sys
 
 # CRITICAL: Load .env and set GOOGLE_GENAI_API_KEY before any imports
 from dotenv import load_dotenv
+
 load_dotenv()
 
 # Set the Google ADK environment variable
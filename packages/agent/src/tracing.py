@@ -0,0 +1,175 @@
+"""Per-turn trace spans.
+
+A turn traced with ``trace()`` records a tree of timed spans: session
+load, model steps, tool calls, and the backend HTTP requests each tool
+made. The current span travels in a context variable, so ``span()`` can
+be dropped into any layer (the API client included) and is a no-op when
+the turn isn't traced. Tasks started inside a span (parallel tool calls,
+batched requests) inherit it as their parent.
+"""
+
+import itertools
+import json
+import time
+import uuid
+from collections.abc import Iterator
+from contextlib import contextmanager
+from contextvars import ContextVar
+from typing import Any, Optional
+
+_current: ContextVar[Optional["Span"]] = ContextVar("current_span", default=None)
+
+
+class Span:
+    """One timed operation within a trace."""
+
+    __slots__ = ("trace", "span_id", "parent_id", "name", "attributes", "start", "end_time")
+
+    def __init__(
+        self,
+        trace: "Trace",
+        span_id: int,
+        parent_id: Optional[int],
+        name: str,
+        attributes: dict[str, Any],
+    ):
+        self.trace = trace
+        self.span_id = span_id
+        self.parent_id = parent_id
+        self.name = name
+        self.attributes = attributes
+        self.start = time.perf_counter()
+        self.end_time: Optional[float] = None
+
+    def end(self, **attributes: Any) -> None:
+        """Close the span (later calls are ignored)."""
+        if self.end_time is None:
+            self.attributes.update(attributes)
+            self.end_time = time.perf_counter()
+
+    @property
+    def duration_ms(self) -> Optional[float]:
+        if self.end_time is None:
+            return None
+        return round((self.end_time - self.start) * 1000, 2)
+
+
+class Trace:
+    """The spans of one turn, rooted at a span named after the turn."""
+
+    def __init__(self, name: str, **attributes: Any):
+        self.trace_id = uuid.uuid4().hex
+        self.started_at = time.time()
+        self.spans: list[Span] = []
+        # Spans opened by one callback and closed by another (model steps)
+        self.open: dict[str, Span] = {}
+        self._ids = itertools.count(1)
+        self.root = self.start(name, None, attributes)
+
+    def start(self, name: str, parent: Optional[Span], attributes: dict[str, Any]) -> Span:
+        span = Span(
+            self, next(self._ids), parent.span_id if parent else None, name, attributes
+        )
+        self.spans.append(span)
+        return span
+
+    def finish(self) -> None:
+        """Close the root and any span left open (marked ``unfinished``)."""
+        for span in self.spans:
+            if span.end_time is None and span is not self.root:
+                span.end(unfinished=True)
+        self.root.end()
+
+    def waterfall(self) -> dict[str, Any]:
+        """The spans in start order with offsets from the start of the turn."""
+        base = self.root.start
+        depths: dict[Optional[int], int] = {None: -1}
+        spans = []
+        for span in sorted(self.spans, key=lambda s: s.start):
+            depth = depths.get(span.parent_id, 0) + 1
+            depths[span.span_id] = depth
+            spans.append(
+                {
+                    "id": span.span_id,
+                    "parent_id": span.parent_id,
+                    "depth": depth,
+                    "name": span.name,
+                    "start_ms": round((span.start - base) * 1000, 2),
+                    "duration_ms": span.duration_ms,
+                    "attributes": span.attributes,
+                }
+            )
+        return {
+            "trace_id": self.trace_id,
+            "duration_ms": self.root.duration_ms,
+            "spans": spans,
+        }
+
+    def export(self, path: str) -> None:
+        """Append the spans to a JSONL file, one span per line."""
+        waterfall = self.waterfall()
+        with open(path, "a", encoding="utf-8") as f:
+            for span in waterfall["spans"]:
+                record = {
+                    "trace_id": self.trace_id,
+                    "timestamp": round(self.started_at + span["start_ms"] / 1000, 6),
+                    **span,
+                }
+                f.write(json.dumps(record, default=str) + "\n")
+
+
+@contextmanager
+def trace(name: str, enabled: bool = True, **attributes: Any) -> Iterator[Optional[Trace]]:
+    """Trace the block as one turn; yields None when ``enabled`` is false."""
+    if not enabled:
+        yield None
+        return
+    turn = Trace(name, **attributes)
+    token = _current.set(turn.root)
+    try:
+        yield turn
+    finally:
+        turn.finish()
+        try:
+            _current.reset(token)
+        except ValueError:
+            # Closed from another context (an abandoned stream being collected)
+            pass
+
+
+@contextmanager
+def span(name: str, **attributes: Any) -> Iterator[Optional[Span]]:
+    """Time the block as a child of the current span, if the turn is traced."""
+    parent = _current.get()
+    if parent is None:
+        yield None
+        return
+    child = parent.trace.start(name, parent, attributes)
+    token = _current.set(child)
+    try:
+        yield child
+    except BaseException as e:
+        child.attributes["error"] = type(e).__name__
+        raise
+    finally:
+        child.end()
+        _current.reset(token)
+
+
+def begin(key: str, name: str, **attributes: Any) -> None:
+    """Open a span that ``end(key)`` closes, for start/stop callback pairs.
+
+    The span is a child of the current span but does not become current.
+    """
+    parent = _current.get()
+    if parent is not None:
+        parent.trace.open[key] = parent.trace.start(name, parent, attributes)
+
+
+def end(key: str, **attributes: Any) -> None:
+    """Close a span opened with ``begin``."""
+    current = _current.get()
+    if current is not None:
+        opened = current.trace.open.pop(key, None)
+        if opened is not None:
+            opened.end(**attributes)
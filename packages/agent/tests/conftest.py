@@ -0,0 +1,47 @@
+"""Shared fixtures: an APIClient talking to an in-process backend, and an agent on top."""
+
+from collections.abc import Awaitable, Callable, Sequence
+from typing import Any
+
+import httpx
+import pytest
+
+from src.api.client import APIClient
+
+Handler = Callable[[httpx.Request], Awaitable[httpx.Response]]
+
+
+@pytest.fixture
+async def make_client():
+    """Build APIClients whose requests are served by an async handler."""
+    clients: list[APIClient] = []
+
+    def factory(handler: Handler, **kwargs: Any) -> APIClient:
+        client = APIClient("http://backend", transport=httpx.MockTransport(handler), **kwargs)
+        clients.append(client)
+        return client
+
+    yield factory
+    for client in clients:
+        await client.close()
+
+
+@pytest.fixture
+async def make_agent(make_client):
+    """Build TaskAgentServices that answer scripted scenarios against a fake backend."""
+    from benchmarks.fake_llm import ScriptedLlm
+    from src.agent.task_agent import TaskAgentService
+
+    services = []
+
+    def factory(backend: Any, scenarios: Sequence[Any] = ()) -> Any:
+        service = TaskAgentService(
+            model=ScriptedLlm.for_scenarios(list(scenarios)),
+            api_client=make_client(backend.handle),
+        )
+        services.append(service)
+        return service
+
+    yield factory
+    for service in services:
+        await service.close()
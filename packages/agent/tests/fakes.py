@@ -0,0 +1,49 @@
+"""Backend payload builders for tests."""
+
+from datetime import UTC, datetime
+from typing import Any
+
+import httpx
+
+NOW = datetime(2025, 1, 1, tzinfo=UTC).isoformat()
+
+
+def envelope(payload: Any, status: int = 200, **headers: str) -> httpx.Response:
+    """A backend response with the usual ``{"data": ...}`` wrapper."""
+    return httpx.Response(status, json={"data": payload}, headers=headers)
+
+
+def project(key: str, name: str = "", project_id: str = "") -> dict[str, Any]:
+    return {
+        "id": project_id or f"id-{key.lower()}",
+        "name": name or f"Project {key}",
+        "key": key,
+        "description": None,
+        "createdAt": NOW,
+        "updatedAt": NOW,
+    }
+
+
+def ticket(
+    ticket_id: str,
+    title: str,
+    project_id: str = "id-p1",
+    status: str = "TODO",
+    priority: str = "MEDIUM",
+    updated_at: str = NOW,
+    description: str = "",
+) -> dict[str, Any]:
+    return {
+        "id": ticket_id,
+        "title": title,
+        "description": description or None,
+        "status": status,
+        "priority": priority,
+        "position": 1000.0,
+        "projectId": project_id,
+        "assigneeId": None,
+        "source": "MANUAL",
+        "sourceUrl": None,
+        "createdAt": NOW,
+        "updatedAt": updated_at,
+    }
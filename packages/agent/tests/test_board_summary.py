@@ -0,0 +1,100 @@
+"""Board summaries: one grouped count query, per-status fan-out on older backends."""
+
+import uuid
+
+import httpx
+import pytest
+
+from benchmarks.fake_backend import FakeBackend
+
+PROJECTS = 3
+STATUSES = ("TODO", "IN_PROGRESS", "DONE", "BLOCKED")
+
+
+@pytest.fixture
+def backend():
+    backend = FakeBackend(seed=5)
+    backend.seed(projects=PROJECTS, tickets_per_project=10)
+    return backend
+
+
+def strict_ids(backend: FakeBackend):
+    """A current backend: /tickets/counts rejects a malformed projectId with a 400."""
+
+    async def handle(request: httpx.Request) -> httpx.Response:
+        project_id = request.url.params.get("projectId")
+        if request.url.path == "/tickets/counts" and project_id:
+            try:
+                uuid.UUID(project_id)
+            except ValueError:
+                backend.requests["GET /tickets/counts"] += 1
+                return httpx.Response(400, json={"error": "Invalid uuid"})
+        return await backend.handle(request)
+
+    return handle
+
+
+def without_counts(backend: FakeBackend):
+    """An older backend: "counts" is routed to /tickets/{id} and fails UUID validation."""
+
+    async def handle(request: httpx.Request) -> httpx.Response:
+        if request.url.path == "/tickets/counts":
+            backend.requests["GET /tickets/:id"] += 1
+            return httpx.Response(400, json={"error": "Invalid uuid"})
+        return await backend.handle(request)
+
+    return handle
+
+
+def totals(summary: dict) -> int:
+    return sum(p[status] for p in summary["projects"] for status in STATUSES)
+
+
+async def test_summary_uses_one_grouped_count_query(make_client, backend):
+    client = make_client(backend.handle)
+
+    summary = await client.get_board_summary()
+
+    assert summary["total_projects"] == PROJECTS
+    assert totals(summary) == len(backend.tickets)
+    assert backend.requests["GET /tickets/counts"] == 1
+    assert backend.requests["GET /tickets"] == 0
+
+
+async def test_filtered_error_does_not_disable_grouped_counts(make_client, backend):
+    client = make_client(strict_ids(backend))
+
+    assert await client.get_ticket_counts("not-a-uuid") is None
+    backend.requests.clear()
+    await client.get_board_summary()
+
+    assert backend.requests["GET /tickets/counts"] == 1
+    assert backend.requests["GET /tickets"] == 0
+
+
+async def test_summary_falls_back_to_per_status_queries(make_client, backend):
+    client = make_client(without_counts(backend))
+
+    summary = await client.get_board_summary()
+
+    assert totals(summary) == len(backend.tickets)
+    assert backend.requests["GET /tickets"] == PROJECTS * len(STATUSES)
+
+    backend.requests.clear()
+    await client.get_board_summary()
+
+    assert backend.requests["GET /tickets/:id"] == 0  # The missing endpoint isn't probed again
+    assert backend.requests["GET /tickets"] == PROJECTS * len(STATUSES)
+
+
+async def test_route_not_found_disables_grouped_counts_even_when_filtered(make_client, backend):
+    async def handle(request: httpx.Request) -> httpx.Response:
+        if request.url.path == "/tickets/counts":
+            return httpx.Response(404, json={"error": "Not found"})
+        return await backend.handle(request)
+
+    client = make_client(handle)
+    project_id = next(iter(backend.projects))
+
+    assert await client.get_ticket_counts(project_id) is None
+    assert client._grouped_counts_supported is False
@@ -0,0 +1,98 @@
+"""Bulk ticket tools: per-item failures and ordering of moves within a column."""
+
+import httpx
+import pytest
+
+from benchmarks.fake_backend import FakeBackend
+from src.agent.task_agent import _create_tools
+
+
+@pytest.fixture
+def backend():
+    backend = FakeBackend(latency=0.005, seed=1)
+    backend.seed(projects=2, tickets_per_project=6)
+    return backend
+
+
+@pytest.fixture
+def reorders():
+    """Tracks how many reorder requests the backend served at once."""
+    return {"active": 0, "peak": 0}
+
+
+@pytest.fixture
+def tools(make_client, backend, reorders):
+    async def handler(request: httpx.Request) -> httpx.Response:
+        if request.method != "PATCH":
+            return await backend.handle(request)
+        reorders["active"] += 1
+        reorders["peak"] = max(reorders["peak"], reorders["active"])
+        try:
+            return await backend.handle(request)
+        finally:
+            reorders["active"] -= 1
+
+    return {tool.__name__: tool for tool in _create_tools(make_client(handler))}
+
+
+def ticket_ids(backend, key):
+    project_id = next(p["id"] for p in backend.projects.values() if p["key"] == key)
+    return [t["id"] for t in backend.tickets.values() if t["projectId"] == project_id]
+
+
+async def test_bulk_move_sends_moves_into_a_column_one_at_a_time(tools, backend, reorders):
+    ids = ticket_ids(backend, "P1")
+
+    result = await tools["bulk_move_tickets"](new_status="BLOCKED", ticket_ids=ids)
+
+    assert result["success"], result
+    assert reorders["peak"] == 1
+    positions = [backend.tickets[i]["position"] for i in ids]
+    assert len(set(positions)) == len(ids)
+
+
+async def test_moves_into_different_projects_columns_run_concurrently(tools, backend, reorders):
+    first, second = ticket_ids(backend, "P1"), ticket_ids(backend, "P2")
+
+    result = await tools["bulk_move_tickets"](new_status="BLOCKED", ticket_ids=first + second)
+
+    assert result["success"], result
+    assert reorders["peak"] == 2  # One move at a time per project's BLOCKED column
+    for ids in (first, second):
+        positions = [backend.tickets[i]["position"] for i in ids]
+        assert len(set(positions)) == len(ids)
+
+
+async def test_bulk_create_reports_unknown_projects_per_item(tools, backend):
+    result = await tools["bulk_create_tickets"](
+        tickets=[
+            {"title": "Ship it", "project_id": "P1"},
+            {"title": "Lost", "project_id": "NOPE"},
+            {"title": "Default project"},
+        ],
+        project_id="P2",
+    )
+
+    assert not result["success"]
+    assert result["message"] == "Created 2 of 3 ticket(s)"
+    assert [e["item"] for e in result["errors"]] == ["Lost"]
+    assert "Project 'NOPE' not found" in result["errors"][0]["error"]
+
+
+async def test_single_item_tools_report_unknown_references(tools):
+    moved = await tools["move_ticket"](ticket_id="no such ticket anywhere", new_status="DONE")
+    listed = await tools["list_tickets"](project_id="NOPE")
+
+    assert not moved["success"]
+    assert "search_tickets" in moved["error"]
+    assert not listed["success"]
+    assert "list_projects" in listed["error"]
+
+
+async def test_single_item_tools_resolve_project_keys(tools, backend):
+    created = await tools["create_ticket"](title="Keyed", project_id="p2")
+    board = await tools["get_board_summary"](project_id="P2")
+
+    assert created["success"], created
+    assert board["success"], board
+    assert any(t["title"] == "Keyed" for t in backend.tickets.values())
@@ -0,0 +1,186 @@
+"""LRU cache behaviour, ETag revalidation and the ticket cache on mutations."""
+
+import httpx
+import pytest
+
+from benchmarks.fake_backend import FakeBackend
+from src.api.cache import CachedResponse, LRUCache, response_key
+from tests.fakes import envelope, project, ticket
+
+
+def test_lru_evicts_least_recently_used():
+    cache: LRUCache[str, int] = LRUCache(maxsize=2)
+    cache.set("a", 1)
+    cache.set("b", 2)
+    cache.get("a")  # "b" is now the least recently used
+    cache.set("c", 3)
+
+    assert list(cache) == ["a", "c"]
+    assert cache.get("b") is None
+
+
+def test_lru_peek_does_not_count_or_refresh():
+    cache: LRUCache[str, int] = LRUCache(maxsize=2)
+    cache.set("a", 1)
+    cache.set("b", 2)
+
+    assert cache.peek("a") == 1
+    assert "a" in cache
+    cache.set("c", 3)
+
+    assert "a" not in cache
+    assert cache.stats()["hits"] == 0
+    assert cache.stats()["misses"] == 0
+
+
+def test_lru_expires_entries_after_ttl():
+    cache: LRUCache[str, int] = LRUCache(maxsize=4, ttl=30)
+    cache.set("a", 1)
+    written_at, value = cache._data["a"]
+    cache._data["a"] = (written_at - 31, value)
+
+    assert cache.peek("a") is None
+    assert cache.get("a") is None
+    assert len(cache) == 0
+
+
+def test_lru_zero_size_disables_caching_and_tracks_stats():
+    disabled: LRUCache[str, int] = LRUCache(maxsize=0)
+    disabled.set("a", 1)
+    assert disabled.get("a") is None
+
+    cache: LRUCache[str, int] = LRUCache(maxsize=4)
+    cache.set("a", 1)
+    cache.get("a")
+    cache.get("missing")
+    assert cache.stats() == {"size": 1, "maxsize": 4, "hits": 1, "misses": 1, "hit_ratio": 0.5}
+
+
+def test_discard_where_and_response_key():
+    cache: LRUCache[tuple, int] = LRUCache(maxsize=8)
+    cache.set(response_key("/tickets", {"b": 2, "a": 1, "c": None}), 1)
+    cache.set(response_key("/projects"), 2)
+
+    assert response_key("/tickets", {"a": 1, "b": 2}) in cache
+    assert cache.discard_where(lambda key: key[0] == "/tickets") == 1
+    assert len(cache) == 1
+
+
+def test_conditional_headers():
+    cached = CachedResponse(None, etag='"v1"', last_modified="Wed, 01 Jan 2025 00:00:00 GMT")
+    assert cached.conditional_headers() == {
+        "If-None-Match": '"v1"',
+        "If-Modified-Since": "Wed, 01 Jan 2025 00:00:00 GMT",
+    }
+
+
+def etag_backend(payload):
+    """Serves ``payload()`` with an ETag and answers 304 while it is unchanged."""
+    seen: list[httpx.Request] = []
+
+    async def handler(request: httpx.Request) -> httpx.Response:
+        seen.append(request)
+        if request.method != "GET":
+            return envelope(ticket("t1", "Renamed"))
+        data = payload()
+        etag = f'"{hash(str(data)) & 0xFFFF}"'
+        if request.headers.get("If-None-Match") == etag:
+            return httpx.Response(304, headers={"ETag": etag})
+        return envelope(data, ETag=etag)
+
+    return handler, seen
+
+
+async def test_unchanged_resource_is_revalidated_with_304(make_client):
+    handler, seen = etag_backend(lambda: [project("P1")])
+    client = make_client(handler)
+
+    first = await client.list_projects()
+    second = await client.list_projects()
+
+    assert "If-None-Match" not in seen[0].headers
+    assert seen[1].headers["If-None-Match"]
+    assert second is first  # The cached parse is reused on 304
+
+
+async def test_changed_resource_is_parsed_again(make_client):
+    projects = [project("P1")]
+    handler, seen = etag_backend(lambda: list(projects))
+    client = make_client(handler)
+
+    await client.list_projects()
+    projects.append(project("P2"))
+    refreshed = await client.list_projects()
+
+    assert [p.key for p in refreshed] == ["P1", "P2"]
+
+
+async def test_mutation_drops_cached_responses(make_client):
+    handler, seen = etag_backend(lambda: ticket("t1", "Original"))
+    client = make_client(handler, ticket_cache_size=0)
+
+    await client.get_ticket("t1")
+    await client.update_ticket("t1", title="Renamed")
+    await client.get_ticket("t1")
+
+    gets = [r for r in seen if r.method == "GET"]
+    assert "If-None-Match" not in gets[1].headers
+
+
+async def test_ticket_cache_serves_recent_reads(make_client):
+    handler, seen = etag_backend(lambda: ticket("t1", "Original"))
+    client = make_client(handler)
+
+    await client.get_ticket("t1")
+    cached = await client.get_ticket("t1")
+    await client.get_ticket("t1", use_cache=False)
+
+    assert cached.title == "Original"
+    assert len(seen) == 2
+
+
+def recording(backend: FakeBackend):
+    """Serve requests from the fake backend and record them."""
+    seen: list[httpx.Request] = []
+
+    async def handler(request: httpx.Request) -> httpx.Response:
+        seen.append(request)
+        return await backend.handle(request)
+
+    return handler, seen
+
+
+async def test_delete_drops_the_cached_ticket_and_lists(make_client):
+    backend = FakeBackend(seed=8)
+    backend.seed(projects=1, tickets_per_project=3)
+    handler, seen = recording(backend)
+    client = make_client(handler)
+
+    listed = await client.list_tickets()
+    ticket_id = listed.items[0].id
+    await client.get_ticket(ticket_id)  # Served from the listing
+    assert [r.method for r in seen] == ["GET"]
+
+    await client.delete_ticket(ticket_id)
+
+    assert ticket_id not in [t.id for t in (await client.list_tickets()).items]
+    with pytest.raises(httpx.HTTPStatusError):
+        await client.get_ticket(ticket_id)
+    assert [r.method for r in seen] == ["GET", "DELETE", "GET", "GET"]
+
+
+async def test_reorder_replaces_the_cached_ticket(make_client):
+    backend = FakeBackend(seed=8)
+    backend.seed(projects=1, tickets_per_project=3)
+    handler, seen = recording(backend)
+    client = make_client(handler)
+    todo = next(t for t in (await client.list_tickets()).items if t.status != "DONE")
+
+    await client.move_ticket(todo.id, new_status="DONE")
+    seen.clear()
+    moved = await client.get_ticket(todo.id)
+    listed = await client.list_tickets(status="DONE")
+
+    assert moved.status == "DONE"
+    assert todo.id in [t.id for t in listed.items]
+    assert [r.url.path for r in seen] == ["/tickets"]  # The list was refetched, not the ticket
@@ -0,0 +1,63 @@
+"""Backend connection pool: limits from settings, reuse and release on shutdown."""
+
+import httpx
+
+from benchmarks.fake_backend import FakeBackend
+from src import main
+from src.api.client import APIClient
+from src.config.settings import Settings
+
+
+async def test_pool_limits_and_timeouts_come_from_settings():
+    settings = Settings(
+        backend_max_connections=7,
+        backend_max_keepalive_connections=3,
+        backend_keepalive_expiry_seconds=12.0,
+        backend_connect_timeout_seconds=1.5,
+        backend_read_timeout_seconds=9.0,
+    )
+    client = APIClient.from_settings(settings, base_url="http://backend")
+
+    pool = client.client._transport._pool
+    try:
+        assert client.base_url == "http://backend"
+        assert (pool._max_connections, pool._max_keepalive_connections) == (7, 3)
+        assert pool._keepalive_expiry == 12.0
+        assert client.client.timeout == httpx.Timeout(9.0, connect=1.5)
+    finally:
+        await client.close()
+
+
+async def test_requests_share_one_http_client_until_closed(make_client):
+    backend = FakeBackend(seed=5)
+    backend.seed(projects=1, tickets_per_project=1)
+    client = make_client(backend.handle)
+
+    first = client.client
+    await client.list_projects()
+    await client.list_tickets()
+    assert client.client is first
+
+    await client.close()
+    assert first.is_closed and client._client is None
+    await client.list_projects()  # A closed client reopens on demand
+    assert client.client is not first
+
+
+async def test_lifespan_closes_the_agents_backend_client(make_agent, monkeypatch):
+    backend = FakeBackend(seed=5)
+    monkeypatch.setattr(main.settings, "gemini_api_key", "test-key")
+    monkeypatch.setattr(main.settings, "ticket_sync_enabled", True)
+    monkeypatch.setattr(main, "TaskAgentService", lambda: make_agent(backend))
+    # Restored afterwards, so the lifespan's globals don't leak into other tests
+    monkeypatch.setattr(main, "agent_service", None)
+    monkeypatch.setattr(main, "admission", None)
+
+    async with main.lifespan(main.app):
+        service = main.agent_service
+        http = service.api_client.client  # Opened by the startup warm-up
+        sync = service._sync_task
+        assert not http.is_closed and not sync.done()
+
+    assert http.is_closed and service.api_client._client is None
+    assert sync.cancelled() and service._sync_task is None
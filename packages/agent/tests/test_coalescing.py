@@ -0,0 +1,118 @@
+"""Single-flight GETs: identical requests in flight share one backend call."""
+
+import asyncio
+
+import httpx
+import pytest
+
+from tests.fakes import envelope, project
+
+
+class SlowBackend:
+    """Answers /projects after ``release`` is set; counts requests per path."""
+
+    def __init__(self, cleanup_delay: float = 0.0) -> None:
+        self.release = asyncio.Event()
+        self.requests: list[httpx.Request] = []
+        self.cancelled = 0
+        self.cleanup_delay = cleanup_delay
+
+    async def handle(self, request: httpx.Request) -> httpx.Response:
+        self.requests.append(request)
+        try:
+            await self.release.wait()
+        except asyncio.CancelledError:
+            self.cancelled += 1
+            if self.cleanup_delay:
+                await asyncio.sleep(self.cleanup_delay)  # Like closing a connection
+            raise
+        if request.url.path == "/tickets/counts":
+            return envelope([{"projectId": "id-p1", "status": "TODO", "count": 3}])
+        return envelope([project("P1")])
+
+
+async def test_identical_gets_share_one_request(make_client):
+    backend = SlowBackend()
+    client = make_client(backend.handle)
+
+    calls = [asyncio.ensure_future(client.list_projects()) for _ in range(5)]
+    await asyncio.sleep(0.01)
+    backend.release.set()
+    results = await asyncio.gather(*calls)
+
+    assert len(backend.requests) == 1
+    assert all(r is results[0] for r in results)
+    assert client.coalesced_gets == 4
+
+
+async def test_ticket_counts_are_coalesced(make_client):
+    backend = SlowBackend()
+    client = make_client(backend.handle)
+
+    calls = [asyncio.ensure_future(client.get_ticket_counts()) for _ in range(3)]
+    await asyncio.sleep(0.01)
+    backend.release.set()
+    results = await asyncio.gather(*calls)
+
+    assert len(backend.requests) == 1
+    assert results[0][0].count == 3
+
+
+async def test_ticket_counts_detect_a_backend_without_the_endpoint(make_client):
+    async def handler(request: httpx.Request) -> httpx.Response:
+        return envelope(None, status=400)
+
+    client = make_client(handler)
+
+    assert await client.get_ticket_counts() is None
+    assert client._grouped_counts_supported is False
+
+
+async def test_cancelling_one_waiter_keeps_the_request_for_the_others(make_client):
+    backend = SlowBackend()
+    client = make_client(backend.handle)
+
+    first = asyncio.ensure_future(client.list_projects())
+    second = asyncio.ensure_future(client.list_projects())
+    await asyncio.sleep(0.01)
+    first.cancel()
+    await asyncio.sleep(0.01)
+    backend.release.set()
+
+    assert [p.key for p in await second] == ["P1"]
+    assert first.cancelled()
+    assert backend.cancelled == 0
+
+
+async def test_request_is_cancelled_when_its_last_waiter_leaves(make_client):
+    backend = SlowBackend()
+    client = make_client(backend.handle)
+
+    call = asyncio.ensure_future(client.list_projects())
+    await asyncio.sleep(0.01)
+    call.cancel()
+    with pytest.raises(asyncio.CancelledError):
+        await call
+    await asyncio.sleep(0.01)
+
+    assert backend.cancelled == 1
+    assert client._inflight_gets == {}
+
+
+async def test_caller_arriving_while_the_request_is_cancelling_starts_a_new_one(make_client):
+    backend = SlowBackend(cleanup_delay=0.05)
+    client = make_client(backend.handle)
+
+    leaving = asyncio.ensure_future(client.list_projects())
+    await asyncio.sleep(0.01)
+    leaving.cancel()
+    with pytest.raises(asyncio.CancelledError):
+        await leaving
+
+    # The first request is still unwinding; this one must not join it
+    joining = asyncio.ensure_future(client.list_projects())
+    await asyncio.sleep(0.01)
+    backend.release.set()
+
+    assert [p.key for p in await joining] == ["P1"]
+    assert len(backend.requests) == 2
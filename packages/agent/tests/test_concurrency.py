@@ -0,0 +1,95 @@
+"""Bounded gather and per-item batch results."""
+
+import asyncio
+
+import pytest
+
+from src.api.concurrency import gather_bounded, run_batch
+
+
+class Tracker:
+    def __init__(self) -> None:
+        self.running = 0
+        self.peak = 0
+        self.cancelled = 0
+        self.completed = 0
+
+    async def work(self, value: int, delay: float = 0.01, fail: bool = False) -> int:
+        self.running += 1
+        self.peak = max(self.peak, self.running)
+        try:
+            await asyncio.sleep(delay)
+            if fail:
+                raise ValueError(f"item {value} failed")
+            self.completed += 1
+            return value
+        except asyncio.CancelledError:
+            self.cancelled += 1
+            raise
+        finally:
+            self.running -= 1
+
+
+async def test_gather_bounded_limits_concurrency_and_keeps_order():
+    tracker = Tracker()
+
+    results = await gather_bounded(
+        [tracker.work(i, delay=0.01 * (5 - i)) for i in range(5)], limit=2
+    )
+
+    assert results == [0, 1, 2, 3, 4]
+    assert tracker.peak == 2
+
+
+async def test_gather_bounded_handles_empty_input():
+    assert await gather_bounded([], limit=4) == []
+
+
+async def test_gather_bounded_cancels_the_rest_on_failure():
+    tracker = Tracker()
+    aws = [tracker.work(0, delay=0, fail=True)] + [tracker.work(i, delay=1) for i in range(1, 4)]
+
+    with pytest.raises(ValueError):
+        await gather_bounded(aws, limit=2)
+
+    assert tracker.running == 0
+    assert tracker.completed == 0
+    assert 1 <= tracker.cancelled < 3  # Items still waiting for a slot never started
+
+
+async def test_gather_bounded_cancels_work_when_the_caller_is_cancelled():
+    tracker = Tracker()
+    task = asyncio.ensure_future(gather_bounded([tracker.work(i, delay=1) for i in range(4)], 4))
+    await asyncio.sleep(0.01)
+
+    task.cancel()
+    with pytest.raises(asyncio.CancelledError):
+        await task
+
+    assert tracker.running == 0
+    assert tracker.cancelled == 4
+
+
+async def test_run_batch_records_failures_per_item():
+    tracker = Tracker()
+
+    batch = await run_batch(
+        [tracker.work(0), tracker.work(1, fail=True), tracker.work(2)], limit=2
+    )
+
+    assert not batch.ok
+    assert batch.results == [0, None, 2]
+    assert batch.succeeded == [0, 2]
+    assert list(batch.errors) == [1]
+    with pytest.raises(ValueError, match="item 1"):
+        batch.raise_first()
+
+
+async def test_client_batch_uses_the_client_limit(make_client):
+    tracker = Tracker()
+    client = make_client(lambda request: None, max_concurrency=3)
+
+    batch = await client.batch(tracker.work(i) for i in range(9))
+
+    assert batch.ok
+    assert tracker.peak == 3
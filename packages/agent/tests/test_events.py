@@ -0,0 +1,110 @@
+"""Turn recording: call/result pairing by ID and streamed text deduplication."""
+
+from google.adk.events import Event
+from google.genai import types
+
+from src.agent.events import TurnRecorder
+
+
+def event(*parts: types.Part, role: str = "model", partial: bool = False) -> Event:
+    return Event(
+        invocation_id="inv-1",
+        author="agent",
+        content=types.Content(role=role, parts=list(parts)),
+        partial=partial,
+    )
+
+
+def call(name: str, call_id: str | None = None, **args) -> types.Part:
+    return types.Part(function_call=types.FunctionCall(id=call_id, name=name, args=args))
+
+
+def response(name: str, call_id: str | None = None, **result) -> types.Part:
+    return types.Part(
+        function_response=types.FunctionResponse(id=call_id, name=name, response=result)
+    )
+
+
+def text(value: str) -> types.Part:
+    return types.Part(text=value)
+
+
+def test_results_land_on_the_call_with_the_same_id():
+    turn = TurnRecorder()
+    turn.process(
+        event(call("get_ticket", "a", ticket_id="1"), call("get_ticket", "b", ticket_id="2"))
+    )
+
+    chunks = turn.process(
+        event(
+            response("get_ticket", "b", title="Two"),
+            response("get_ticket", "a", title="One"),
+            role="user",
+        )
+    )
+
+    assert [a["args"]["ticket_id"] for a in turn.actions] == ["1", "2"]
+    assert [a["result"]["title"] for a in turn.actions] == ["One", "Two"]
+    assert all(a["duration_ms"] >= 0 for a in turn.actions)
+    assert [c["result"]["title"] for c in chunks] == ["Two", "One"]
+    assert all("duration_ms" in c for c in chunks)
+    assert turn.invocation_id == "inv-1"
+
+
+def test_calls_without_ids_match_results_of_the_same_tool_in_order():
+    turn = TurnRecorder()
+    turn.process(
+        event(call("list_tickets", page=1), call("get_project"), call("list_tickets", page=2))
+    )
+
+    turn.process(
+        event(
+            response("get_project", key="P1"),
+            response("list_tickets", count=1),
+            response("list_tickets", count=2),
+            role="user",
+        )
+    )
+
+    assert [a.get("result") for a in turn.actions] == [{"count": 1}, {"key": "P1"}, {"count": 2}]
+
+
+def test_a_result_without_a_call_is_passed_through():
+    turn = TurnRecorder()
+
+    chunks = turn.process(event(response("get_ticket", "zzz", title="Orphan"), role="user"))
+
+    assert chunks == [{"type": "tool_result", "tool": "get_ticket", "result": {"title": "Orphan"}}]
+    assert turn.actions == []
+
+
+def test_streamed_deltas_are_not_repeated_by_the_complete_event():
+    turn = TurnRecorder()
+
+    deltas = turn.process(event(text("Hello "), partial=True)) + turn.process(
+        event(text("world"), partial=True)
+    )
+    final = turn.process(event(text("Hello world")))
+
+    assert [c["content"] for c in deltas] == ["Hello ", "world"]
+    assert final == []
+    assert turn.text == "Hello world"
+    assert turn.final_text == "Hello world"
+
+
+def test_unstreamed_text_is_sent_once():
+    turn = TurnRecorder()
+    turn.process(event(text("Let me look. "), call("list_projects", "c")))
+    turn.process(event(response("list_projects", "c", count=0), role="user"))
+
+    chunks = turn.process(event(text("No projects yet.")))
+
+    assert chunks == [{"type": "text", "content": "No projects yet."}]
+    assert turn.text == "Let me look. No projects yet."
+    assert turn.final_text == "No projects yet."  # Text next to a tool call isn't final
+
+
+def test_partial_events_never_record_tool_calls():
+    turn = TurnRecorder()
+    assert turn.process(event(call("list_projects", "c"), partial=True)) == []
+    assert turn.actions == []
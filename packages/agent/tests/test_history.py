@@ -0,0 +1,113 @@
+"""History compaction: turn boundaries, tool summaries and token savings."""
+
+from types import SimpleNamespace
+
+from google.adk.models import LlmRequest
+from google.genai import types
+
+from src.agent.history import HistoryCompactor, _split_turns, estimate_tokens
+
+
+def user(text: str) -> types.Content:
+    return types.Content(role="user", parts=[types.Part(text=text)])
+
+
+def model(text: str) -> types.Content:
+    return types.Content(role="model", parts=[types.Part(text=text)])
+
+
+def call(name: str, call_id: str, **args) -> types.Content:
+    function_call = types.FunctionCall(id=call_id, name=name, args=args)
+    return types.Content(role="model", parts=[types.Part(function_call=function_call)])
+
+
+def result(name: str, call_id: str, response: dict) -> types.Content:
+    function_response = types.FunctionResponse(id=call_id, name=name, response=response)
+    return types.Content(role="user", parts=[types.Part(function_response=function_response)])
+
+
+def tool_turn(n: int) -> list[types.Content]:
+    """A turn that lists tickets: the user's question, a call, its result and a reply."""
+    tickets = [{"id": f"t-{n}-{i}", "title": "x" * 200} for i in range(10)]
+    listing = {"success": True, "count": 10, "total": 40, "tickets": tickets}
+    return [
+        user(f"question {n}"),
+        call("list_tickets", f"c-{n}", project_id="P1"),
+        result("list_tickets", f"c-{n}", listing),
+        model(f"answer {n}"),
+    ]
+
+
+def test_tool_results_do_not_start_a_turn():
+    turns = _split_turns(tool_turn(1) + tool_turn(2))
+    assert [len(turn) for turn in turns] == [4, 4]
+    assert turns[1][0].parts[0].text == "question 2"
+
+
+def test_short_histories_are_sent_unchanged():
+    contents = tool_turn(1) + tool_turn(2)
+    assert HistoryCompactor(keep_turns=2).compact(contents) is contents
+
+
+def test_older_turns_collapse_to_text_and_a_tool_summary():
+    recent = tool_turn(2)
+    compacted = HistoryCompactor(keep_turns=1).compact(tool_turn(1) + recent)
+
+    assert compacted[2:] == recent  # Recent turns are sent verbatim
+    assert [c.role for c in compacted[:2]] == ["user", "model"]
+    assert compacted[0].parts[0].text == "question 1"
+    summary = compacted[1].parts[0].text
+    assert summary == '[tools: list_tickets({"project_id": "P1"}) -> 10 item(s) of 40]\nanswer 1'
+
+
+def test_summaries_keep_ids_and_failures():
+    created = {"success": True, "message": "Created", "ticket": {"id": "t-9"}}
+    turn = [
+        user("make one"),
+        call("create_ticket", "a", title="Bug"),
+        result("create_ticket", "a", created),
+        call("move_ticket", "b", ticket_id="t-9"),
+        result("move_ticket", "b", {"success": False, "error": "Ticket not found"}),
+        model("Done " * 100),
+    ]
+
+    compacted = HistoryCompactor(keep_turns=1, summary_chars=20).compact(turn + tool_turn(2))
+
+    summary = compacted[1].parts[0].text
+    assert "-> Created [ticket id=t-9]" in summary
+    assert "-> failed: Ticket not found" in summary
+    assert summary.endswith("…") and len(summary.splitlines()[1]) == 20
+
+
+def test_oldest_turns_are_dropped_over_max_contents():
+    turns = [tool_turn(n) for n in range(5)]
+    contents = [c for turn in turns for c in turn]
+
+    compacted = HistoryCompactor(keep_turns=2, max_contents=10).compact(contents)
+
+    # Two recent turns (8 contents) leave room for one compacted turn (2)
+    assert len(compacted) == 10
+    assert compacted[0].parts[0].text == "question 2"
+    assert compacted[2:] == turns[3] + turns[4]
+
+
+def test_recent_turns_are_kept_even_over_max_contents():
+    contents = tool_turn(1) + tool_turn(2)
+    compacted = HistoryCompactor(keep_turns=2, max_contents=4).compact(contents)
+    assert compacted == contents
+
+
+def test_before_model_records_savings_per_invocation():
+    compactor = HistoryCompactor(keep_turns=1)
+    contents = tool_turn(1) + tool_turn(2) + tool_turn(3)
+    context = SimpleNamespace(invocation_id="inv-1")
+
+    for _ in range(2):  # Two model steps in the same turn
+        request = LlmRequest(contents=list(contents))
+        assert compactor.before_model(context, request) is None
+    saved = estimate_tokens(contents) - estimate_tokens(request.contents)
+
+    assert saved > 0
+    assert compactor.pop_stats("inv-1") == {"tokens_saved": 2 * saved, "model_calls": 2}
+    assert compactor.pop_stats("inv-1") == {"tokens_saved": 0, "model_calls": 0}
+    assert compactor.pop_stats(None) == {"tokens_saved": 0, "model_calls": 0}
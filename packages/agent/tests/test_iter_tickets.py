@@ -0,0 +1,94 @@
+"""Paging through tickets: prefetch, early stop and page-boundary duplicates."""
+
+import asyncio
+
+import httpx
+import pytest
+
+from benchmarks.fake_backend import FakeBackend
+
+
+class PagedBackend:
+    """A seeded fake backend that records the pages asked for and cancelled."""
+
+    def __init__(self, latency: float = 0.0) -> None:
+        self.backend = FakeBackend(latency=latency, seed=2)
+        self.backend.seed(projects=1, tickets_per_project=25)
+        self.pages: list[int] = []
+        self.cancelled = 0
+        self.after_first_page = None
+
+    async def handle(self, request: httpx.Request) -> httpx.Response:
+        self.pages.append(int(request.url.params.get("page", 1)))
+        try:
+            response = await self.backend.handle(request)
+        except asyncio.CancelledError:
+            self.cancelled += 1
+            raise
+        if self.pages == [1] and self.after_first_page is not None:
+            self.after_first_page()
+        return response
+
+
+@pytest.fixture
+def paged():
+    return PagedBackend()
+
+
+async def test_iterates_every_ticket_once_in_list_order(make_client, paged):
+    client = make_client(paged.handle)
+
+    ids = [ticket.id async for ticket in client.iter_tickets(page_size=10)]
+
+    listed = sorted(paged.backend.tickets.values(), key=lambda t: (t["status"], t["position"]))
+    assert ids == [t["id"] for t in listed]
+    assert paged.pages == [1, 2, 3]
+
+
+async def test_next_page_is_requested_while_the_current_one_is_consumed(make_client, paged):
+    client = make_client(paged.handle)
+    tickets = client.iter_tickets(page_size=10)
+
+    await tickets.__anext__()
+    await asyncio.sleep(0.01)
+
+    assert paged.pages == [1, 2]
+    await tickets.aclose()
+
+
+async def test_without_prefetch_pages_are_requested_on_demand(make_client, paged):
+    client = make_client(paged.handle)
+    tickets = client.iter_tickets(page_size=10, prefetch=False)
+
+    await tickets.__anext__()
+    await asyncio.sleep(0.01)
+
+    assert paged.pages == [1]
+    await tickets.aclose()
+
+
+async def test_max_items_stops_and_cancels_the_prefetch(make_client):
+    paged = PagedBackend(latency=0.05)
+    client = make_client(paged.handle)
+
+    ids = []
+    async for ticket in client.iter_tickets(page_size=10, max_items=3):
+        ids.append(ticket.id)
+        await asyncio.sleep(0.01)  # Page 2 is in flight meanwhile
+
+    assert len(ids) == 3
+    assert paged.pages == [1, 2]
+    assert paged.cancelled == 1
+
+
+async def test_a_shifted_page_boundary_does_not_repeat_a_ticket(make_client, paged):
+    # A ticket created at the head of the listing pushes page 1's last ticket onto page 2
+    project_id = next(iter(paged.backend.projects))
+    paged.after_first_page = lambda: paged.backend._add_ticket(
+        {"title": "Created meanwhile", "status": "BLOCKED", "projectId": project_id}
+    )
+    client = make_client(paged.handle)
+
+    ids = [ticket.id async for ticket in client.iter_tickets(page_size=10, prefetch=False)]
+
+    assert len(ids) == len(set(ids)) == 25
@@ -0,0 +1,98 @@
+"""Metrics registry: exposition format, label checks and endpoint labels."""
+
+import pytest
+
+from benchmarks.fake_backend import FakeBackend
+from benchmarks.scenarios import Scenario
+from src.metrics import MODEL_CALLS_PER_TURN, Registry, endpoint_label
+
+
+@pytest.fixture
+def registry():
+    return Registry()
+
+
+def test_counter_and_gauge_render_one_sample_per_label_set(registry):
+    requests = registry.counter("requests_total", "Requests", ["method"])
+    sessions = registry.gauge("sessions", "Sessions")
+    requests.inc(method="GET")
+    requests.inc(2, method="GET")
+    requests.inc(method="POST")
+    sessions.set(3)
+
+    assert registry.render() == (
+        "# HELP requests_total Requests\n"
+        "# TYPE requests_total counter\n"
+        'requests_total{method="GET"} 3\n'
+        'requests_total{method="POST"} 1\n'
+        "# HELP sessions Sessions\n"
+        "# TYPE sessions gauge\n"
+        "sessions 3\n"
+    )
+
+
+def test_histogram_buckets_are_cumulative(registry):
+    latency = registry.histogram("latency_seconds", "Latency", buckets=(0.1, 1.0))
+    for value in (0.05, 0.5, 0.5, 2.0):
+        latency.observe(value)
+
+    lines = registry.render().splitlines()[2:]
+
+    assert lines == [
+        'latency_seconds_bucket{le="0.1"} 1',
+        'latency_seconds_bucket{le="1"} 3',
+        'latency_seconds_bucket{le="+Inf"} 4',
+        "latency_seconds_sum 3.05",
+        "latency_seconds_count 4",
+    ]
+
+
+def test_label_values_are_escaped(registry):
+    registry.gauge("g", "G", ["path"]).set(1, path='a"b\\c\nd')
+    assert 'g{path="a\\"b\\\\c\\nd"} 1' in registry.render()
+
+
+def test_labels_must_match_the_declared_names(registry):
+    counter = registry.counter("c", "C", ["tool"])
+    with pytest.raises(ValueError):
+        counter.inc(outcome="ok")
+    with pytest.raises(ValueError):
+        registry.counter("c", "Again")
+
+
+@pytest.mark.parametrize(
+    ("path", "label"),
+    [
+        ("/projects", "/projects"),
+        ("/tickets/counts?projectId=abc", "/tickets/counts"),
+        ("/tickets/8c1d2e5a-1f0b-4c9e-9d3a-2b7f6e4a1c00", "/tickets/:id"),
+        ("/tickets/not-a-uuid/reorder", "/tickets/:id/reorder"),
+        ("/projects/42", "/projects/:id"),
+    ],
+)
+def test_endpoint_label_collapses_the_resource_id(path, label):
+    assert endpoint_label(path) == label
+
+
+def model_calls_observed() -> tuple[int, float]:
+    """(turns observed, turns observed with zero model calls) so far."""
+    series = MODEL_CALLS_PER_TURN._series.get(())
+    if series is None:
+        return 0, 0
+    counts, _ = series
+    return sum(counts), counts[0]
+
+
+async def test_turns_without_the_model_count_zero_model_calls(make_agent):
+    backend = FakeBackend()
+    backend.seed(projects=1, tickets_per_project=3)
+    reply = "Here is the board."
+    board = Scenario("board", "How is the board?", ((("get_board_summary", {}),),), reply)
+    service = make_agent(backend, [board])
+    turns, zero = model_calls_observed()
+
+    await service.chat("show the board", "u")  # Fast path
+    await service.chat("show the board", "u")  # Cached reply
+    await service.chat(board.message, "u")  # Tool step, then the reply
+
+    assert model_calls_observed() == (turns + 3, zero + 2)
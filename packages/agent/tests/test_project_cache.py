@@ -0,0 +1,100 @@
+"""Project catalog cache: TTL, single-flight refresh and invalidation."""
+
+import asyncio
+
+import httpx
+
+from tests.fakes import envelope, project
+
+
+def counting_backend(delay: float = 0.0):
+    calls = {"projects": 0}
+
+    async def handler(request: httpx.Request) -> httpx.Response:
+        if request.url.path == "/projects":
+            calls["projects"] += 1
+            if delay:
+                await asyncio.sleep(delay)
+            return envelope([project("P1"), project("P2")])
+        return envelope(None, status=404)
+
+    return handler, calls
+
+
+async def test_projects_are_served_from_cache_while_fresh(make_client):
+    handler, calls = counting_backend()
+    client = make_client(handler)
+
+    first = await client.get_cached_projects()
+    second = await client.get_cached_projects()
+
+    assert [p.key for p in first] == ["P1", "P2"]
+    assert second is first
+    assert calls["projects"] == 1
+
+
+async def test_stale_cache_is_refetched(make_client):
+    handler, calls = counting_backend()
+    client = make_client(handler, project_cache_ttl=60.0)
+
+    await client.get_cached_projects()
+    client._projects_fetched_at -= 61.0
+    await client.get_cached_projects()
+
+    assert calls["projects"] == 2
+
+
+async def test_concurrent_callers_share_one_refresh(make_client):
+    handler, calls = counting_backend(delay=0.01)
+    client = make_client(handler)
+
+    results = await asyncio.gather(*(client.get_cached_projects() for _ in range(10)))
+
+    assert calls["projects"] == 1
+    assert all(r == results[0] for r in results)
+
+
+async def test_force_refresh_and_invalidate_bypass_the_cache(make_client):
+    handler, calls = counting_backend()
+    client = make_client(handler)
+
+    await client.get_cached_projects()
+    await client.get_cached_projects(force_refresh=True)
+    assert calls["projects"] == 2
+
+    client.invalidate_project_cache()
+    await client.get_cached_projects()
+    assert calls["projects"] == 3
+
+
+async def test_refresh_racing_an_invalidation_is_not_stored(make_client):
+    handler, calls = counting_backend(delay=0.01)
+    client = make_client(handler)
+
+    refresh = asyncio.ensure_future(client.get_cached_projects())
+    await asyncio.sleep(0)
+    client.invalidate_project_cache()
+    await refresh
+
+    assert client._projects is None
+    await client.get_cached_projects()
+    assert calls["projects"] == 2
+
+
+async def test_zero_ttl_disables_caching(make_client):
+    handler, calls = counting_backend()
+    client = make_client(handler, project_cache_ttl=0)
+
+    await client.get_cached_projects()
+    await client.get_cached_projects()
+
+    assert calls["projects"] == 2
+
+
+async def test_project_lookup_uses_the_cached_index(make_client):
+    handler, calls = counting_backend()
+    client = make_client(handler)
+
+    assert (await client.get_project_by_key("p2")).key == "P2"
+    assert (await client.get_project_by_name("Project P1")).key == "P1"
+    assert calls["projects"] == 1
@@ -0,0 +1,82 @@
+"""Project resolution: key > exact name > prefix > substring, and ambiguity."""
+
+import httpx
+import pytest
+
+from src.agent.task_agent import _create_tools
+from src.api.project_index import AmbiguousProjectError, ProjectIndex
+from src.api.schemas import Project
+from tests.fakes import envelope, project
+
+
+def index(*names: str) -> ProjectIndex:
+    return ProjectIndex(
+        Project.model_validate(project(f"P{i}", name)) for i, name in enumerate(names, 1)
+    )
+
+
+def test_keys_win_over_names():
+    projects = index("P2 migration", "Other")
+    assert projects.resolve(" p2 ").name == "Other"
+    assert projects.get_by_key("p1").name == "P2 migration"
+
+
+def test_exact_name_beats_a_prefix_match():
+    assert index("Web App", "Web").resolve("WEB").name == "Web"
+
+
+def test_prefix_beats_a_substring_match():
+    projects = index("Automobile", "Mobile  Client")
+    assert projects.resolve("mobile").name == "Mobile  Client"
+    assert projects.resolve("mobile client").key == "P2"  # Whitespace is normalized
+
+
+def test_ambiguous_prefix_lists_every_candidate():
+    projects = index("Web App", "Web Site", "Backend")
+
+    with pytest.raises(AmbiguousProjectError) as error:
+        projects.resolve("web")
+
+    assert [p.name for p in error.value.candidates] == ["Web App", "Web Site"]
+    assert "'Web App' (P1), 'Web Site' (P2)" in str(error.value)
+    assert error.value.query == "web"
+
+
+def test_ambiguous_substring_is_reported_when_no_prefix_matches():
+    assert index("Public API", "Internal API", "APIs").resolve("api").name == "APIs"
+
+    with pytest.raises(AmbiguousProjectError) as error:
+        index("Public API", "Internal API").resolve("api")
+    assert [p.name for p in error.value.candidates] == ["Internal API", "Public API"]
+
+
+def test_short_substrings_fall_back_to_a_scan():
+    projects = index("Billing", "QA tools")
+    assert projects.resolve("li").name == "Billing"
+    assert projects.find_by_substring("O") == [projects.get_by_key("P2")]
+
+
+def test_long_candidate_lists_are_cut_short():
+    projects = index(*(f"Team {n}" for n in range(8)))
+
+    with pytest.raises(AmbiguousProjectError, match="and 3 more"):
+        projects.resolve("team")
+
+
+def test_nothing_matches():
+    projects = index("Web")
+    assert projects.resolve("mobile") is None
+    assert projects.resolve("   ") is None
+
+
+async def test_tools_report_ambiguous_project_names(make_client):
+    async def handler(request: httpx.Request) -> httpx.Response:
+        if request.url.path == "/projects":
+            return envelope([project("WA", "Web App"), project("WS", "Web Site")])
+        return envelope([])
+
+    tools = {tool.__name__: tool for tool in _create_tools(make_client(handler))}
+    result = await tools["list_tickets"](project_id="web")
+
+    assert result["success"] is False
+    assert "ambiguous" in result["error"] and "(WA)" in result["error"]
@@ -0,0 +1,101 @@
+"""Tool result projection: per-tool fields, truncation and tabular lists."""
+
+import pytest
+
+from benchmarks.fake_backend import FakeBackend
+from src.agent.projection import ResultProjector
+from src.agent.task_agent import _create_tools
+from src.api.schemas import Project, Ticket
+from tests.fakes import project, ticket
+
+LONG = "word " * 100
+
+
+@pytest.fixture
+def tickets():
+    return [
+        Ticket.model_validate(ticket("t-1", "Login fails", description=LONG)),
+        Ticket.model_validate(ticket("t-2", "Export hangs", status="DONE")),
+    ]
+
+
+def test_unknown_mode_is_rejected():
+    with pytest.raises(ValueError):
+        ResultProjector(mode="terse")
+
+
+def test_each_tool_gets_its_own_fields(tickets):
+    projector = ResultProjector()
+
+    assert projector.ticket("move_ticket", tickets[1]) == {
+        "id": "t-2",
+        "title": "Export hangs",
+        "status": "DONE",
+    }
+    assert set(projector.ticket("some_new_tool", tickets[1])) == {
+        "id", "title", "status", "priority", "project_id"
+    }
+
+
+def test_get_ticket_returns_the_full_ticket_as_json(tickets):
+    full = ResultProjector().ticket("get_ticket", tickets[0])
+
+    assert full["description"] == tickets[0].description  # Not truncated
+    assert isinstance(full["created_at"], str)
+    assert "position" in full
+
+
+def test_descriptions_are_truncated(tickets):
+    search = ResultProjector(description_chars=20).ticket("search_tickets", tickets[0])
+    assert len(search["description"]) == 20 and search["description"].endswith("…")
+
+    untruncated = ResultProjector(description_chars=0).ticket("search_tickets", tickets[0])
+    assert untruncated["description"] == LONG
+
+
+def test_lists_are_columns_and_rows(tickets):
+    listed = ResultProjector().tickets("list_tickets", tickets)
+
+    assert listed["columns"] == ["id", "title", "status", "priority", "project_id"]
+    assert listed["rows"][1] == ["t-2", "Export hangs", "DONE", "MEDIUM", "id-p1"]
+    assert ResultProjector(tabular=False).tickets("list_tickets", tickets)[0]["id"] == "t-1"
+    # Full tickets have no fixed columns
+    assert isinstance(ResultProjector().tickets("get_ticket", tickets), list)
+
+
+def test_field_overrides_replace_a_tools_whitelist(tickets):
+    projector = ResultProjector(ticket_fields={"list_tickets": ["id", "priority"]})
+    rows = projector.tickets("list_tickets", tickets)["rows"]
+    assert rows == [["t-1", "MEDIUM"], ["t-2", "MEDIUM"]]
+
+
+def test_full_mode_returns_the_complete_model_dump(tickets):
+    projector = ResultProjector(mode="full")
+
+    assert projector.ticket("move_ticket", tickets[0]) == tickets[0].model_dump()
+    assert projector.tickets("list_tickets", tickets) == [t.model_dump() for t in tickets]
+
+
+def test_projects_are_tabular_without_timestamps():
+    projects = [Project.model_validate(project("P1")), Project.model_validate(project("P2"))]
+
+    listed = ResultProjector().projects(projects)
+
+    assert listed == {
+        "columns": ["id", "name", "key", "description"],
+        "rows": [["id-p1", "Project P1", "P1", None], ["id-p2", "Project P2", "P2", None]],
+    }
+
+
+async def test_tools_return_projected_payloads(make_client):
+    backend = FakeBackend(seed=4)
+    backend.seed(projects=1, tickets_per_project=5)
+    tools = {tool.__name__: tool for tool in _create_tools(make_client(backend.handle))}
+
+    listed = await tools["list_tickets"](project_id="P1")
+    ticket_id = listed["tickets"]["rows"][0][0]
+    moved = await tools["move_ticket"](ticket_id=ticket_id, new_status="DONE")
+
+    assert listed["tickets"]["columns"][0] == "id"
+    assert len(listed["tickets"]["rows"]) == 5
+    assert set(moved["ticket"]) == {"id", "title", "status"}
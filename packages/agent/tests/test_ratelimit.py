@@ -0,0 +1,164 @@
+"""Token buckets, admission control and slot release by the chat endpoints."""
+
+import asyncio
+
+import httpx
+import pytest
+
+from src import main
+from src.ratelimit.limiter import (
+    AdmissionController,
+    Bucket,
+    MemoryRateLimitStore,
+    RateLimitExceededError,
+    SqliteRateLimitStore,
+    _refund,
+    _take,
+    rate_limit_key,
+)
+
+MINUTE = Bucket("minute", 2, 60.0)
+DAY = Bucket("day", 3, 86400.0)
+
+
+def test_take_spends_tokens_until_a_bucket_is_empty():
+    state: dict = {}
+    assert _take(state, "u", [MINUTE, DAY], now=0.0) == 0
+    assert _take(state, "u", [MINUTE, DAY], now=0.0) == 0
+
+    retry_after = _take(state, "u", [MINUTE, DAY], now=0.0)
+
+    assert retry_after == pytest.approx(30.0)  # One token refills every 30s
+    assert state["u:day"][0] == 1  # A refused request takes nothing
+
+
+def test_buckets_refill_over_time():
+    state: dict = {}
+    for _ in range(2):
+        _take(state, "u", [MINUTE], now=0.0)
+
+    assert _take(state, "u", [MINUTE], now=29.0) > 0
+    assert _take(state, "u", [MINUTE], now=30.0) == 0
+
+
+def test_refund_returns_a_token_without_exceeding_capacity():
+    state: dict = {}
+    _take(state, "u", [MINUTE], now=0.0)
+    _refund(state, "u", [MINUTE], now=0.0)
+    assert state["u:minute"][0] == 2
+
+    _refund(state, "u", [MINUTE], now=0.0)
+    assert state["u:minute"][0] == 2
+
+
+def test_limits_are_on_by_default():
+    admission = AdmissionController(MemoryRateLimitStore())
+    assert [b.name for b in admission.buckets] == ["minute", "day"]
+
+
+def test_anonymous_requests_are_keyed_on_the_client_address():
+    assert rate_limit_key("alice", "10.0.0.1") == "user:alice"
+    assert rate_limit_key("default_user", "10.0.0.1") == "ip:10.0.0.1"
+    # X-Forwarded-For counts only when the proxy in front is trusted
+    assert rate_limit_key("default_user", "10.0.0.1", "203.0.113.7") == "ip:10.0.0.1"
+    assert (
+        rate_limit_key("default_user", "10.0.0.1", "203.0.113.7, 10.0.0.1", True)
+        == "ip:203.0.113.7"
+    )
+    assert rate_limit_key("default_user", None) == "ip:unknown"
+
+
+async def test_users_have_separate_buckets():
+    admission = AdmissionController(MemoryRateLimitStore(), requests_per_minute=1)
+    (await admission.acquire("alice"))()
+
+    with pytest.raises(RateLimitExceededError) as error:
+        await admission.acquire("alice")
+    (await admission.acquire("bob"))()
+
+    assert error.value.reason == "rate"
+    assert admission.stats()["rate_limited"] == 1
+
+
+async def test_busy_rejection_does_not_spend_the_users_quota():
+    admission = AdmissionController(
+        MemoryRateLimitStore(), requests_per_minute=2, max_concurrent=1, max_wait=0.01
+    )
+    release = await admission.acquire("alice")
+
+    with pytest.raises(RateLimitExceededError) as error:
+        await admission.acquire("alice")
+    release()
+
+    assert error.value.reason == "busy"
+    (await admission.acquire("alice"))()  # Still has the token the busy request got back
+
+
+async def test_queued_request_gets_the_next_free_slot():
+    admission = AdmissionController(MemoryRateLimitStore(), max_concurrent=1, max_wait=1.0)
+    release = await admission.acquire("alice")
+    waiter = asyncio.ensure_future(admission.acquire("bob"))
+    await asyncio.sleep(0.01)
+    assert admission.stats()["waiting"] == 1
+
+    release()
+    release()  # Releasing twice frees only one slot
+    (await waiter)()
+
+    assert admission.stats()["in_flight"] == 0
+    assert admission._slots._value == 1
+
+
+async def test_sqlite_store_is_shared_between_instances(tmp_path):
+    path = str(tmp_path / "ratelimit.db")
+    first, second = SqliteRateLimitStore(path), SqliteRateLimitStore(path)
+
+    assert await first.take("u", [MINUTE]) == 0
+    assert await second.take("u", [MINUTE]) == 0
+    assert await first.take("u", [MINUTE]) > 0
+
+    await second.refund("u", [MINUTE])
+    assert await first.take("u", [MINUTE]) == 0
+
+
+class FakeAgent:
+    async def chat_stream(self, message, user_id, session_id=None, debug_timing=False):
+        yield {"type": "text", "content": "Hi"}
+        yield {"type": "done", "session_id": "s", "full_response": "Hi", "actions_taken": []}
+
+
+@pytest.fixture
+def app(monkeypatch):
+    admission = AdmissionController(
+        MemoryRateLimitStore(), requests_per_minute=1, max_concurrent=1, max_wait=0.01
+    )
+    monkeypatch.setattr(main, "agent_service", FakeAgent())
+    monkeypatch.setattr(main, "admission", admission)
+    transport = httpx.ASGITransport(app=main.app)
+    return httpx.AsyncClient(transport=transport, base_url="http://agent"), admission
+
+
+async def test_stream_releases_its_slot_and_answers_429_over_the_limit(app):
+    http, admission = app
+    async with http:
+        first = await http.post("/chat/stream", json={"message": "hi", "user_id": "u"})
+        second = await http.post("/chat/stream", json={"message": "hi", "user_id": "u"})
+
+    assert first.status_code == 200
+    assert "event: done" in first.text
+    assert admission.stats()["in_flight"] == 0
+    assert second.status_code == 429
+    assert int(second.headers["Retry-After"]) >= 1
+
+
+async def test_anonymous_visitors_behind_the_proxy_have_separate_buckets(app, monkeypatch):
+    http, _ = app
+    monkeypatch.setattr(main.settings, "rate_limit_trust_forwarded_for", True)
+    message = {"message": "hi"}  # The frontend's placeholder user_id
+
+    async with http:
+        first = await http.post("/chat/stream", json=message, headers={"X-Forwarded-For": "a"})
+        other = await http.post("/chat/stream", json=message, headers={"X-Forwarded-For": "b"})
+        again = await http.post("/chat/stream", json=message, headers={"X-Forwarded-For": "a"})
+
+    assert (first.status_code, other.status_code, again.status_code) == (200, 200, 429)
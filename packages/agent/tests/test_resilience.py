@@ -0,0 +1,163 @@
+"""Retry policy, Retry-After handling and circuit breaker state changes."""
+
+import time
+from dataclasses import dataclass, field
+
+import httpx
+import pytest
+
+from src.api.resilience import CircuitBreaker, CircuitOpenError, RetryPolicy, parse_retry_after
+from tests.fakes import envelope
+
+
+@dataclass
+class RecordingPolicy(RetryPolicy):
+    """Records the delays the client would wait, without waiting."""
+
+    delays: list[float] = field(default_factory=list)
+
+    def backoff(self, attempt, retry_after=None):
+        self.delays.append(super().backoff(attempt, retry_after))
+        return 0.0
+
+
+def scripted(*responses):
+    """Handler returning the given responses (or raising exceptions) in order."""
+    queue = list(responses)
+    requests: list[httpx.Request] = []
+
+    async def handler(request: httpx.Request) -> httpx.Response:
+        requests.append(request)
+        outcome = queue.pop(0)
+        if isinstance(outcome, Exception):
+            raise outcome
+        return outcome
+
+    return handler, requests
+
+
+def test_backoff_is_capped_and_jittered():
+    policy = RetryPolicy(base_delay=0.1, max_delay=0.3)
+    assert all(0 <= policy.backoff(1) <= 0.1 for _ in range(50))
+    assert all(0 <= policy.backoff(6) <= 0.3 for _ in range(50))
+
+
+def test_backoff_waits_at_least_retry_after():
+    assert RetryPolicy(max_delay=0.5).backoff(1, retry_after=3.0) == 3.0
+
+
+def test_parse_retry_after():
+    assert parse_retry_after("7") == 7.0
+    assert parse_retry_after(None) is None
+    assert parse_retry_after("soon") is None
+    assert parse_retry_after("Wed, 21 Oct 2015 07:28:00 GMT") == 0.0
+
+
+async def test_get_is_retried_on_transient_status(make_client):
+    handler, requests = scripted(envelope(None, status=503), envelope([]))
+    policy = RecordingPolicy()
+    client = make_client(handler, retry_policy=policy)
+
+    assert await client.list_projects() == []
+    assert len(requests) == 2
+    assert len(policy.delays) == 1
+
+
+async def test_429_waits_for_retry_after(make_client):
+    handler, requests = scripted(
+        httpx.Response(429, headers={"Retry-After": "2"}), envelope([])
+    )
+    policy = RecordingPolicy(max_delay=0.1)
+    client = make_client(handler, retry_policy=policy)
+
+    await client.list_projects()
+
+    assert policy.delays == [2.0]
+
+
+async def test_long_retry_after_is_not_retried(make_client):
+    handler, requests = scripted(httpx.Response(429, headers={"Retry-After": "120"}))
+    policy = RecordingPolicy()
+    client = make_client(handler, retry_policy=policy)
+
+    with pytest.raises(httpx.HTTPStatusError):
+        await client.list_projects()
+    assert len(requests) == 1
+    assert policy.delays == []
+
+
+async def test_post_is_only_retried_when_the_connection_failed(make_client):
+    handler, requests = scripted(httpx.ConnectError("refused"), envelope(None, status=503))
+    client = make_client(handler, retry_policy=RecordingPolicy())
+
+    response = await client._request("POST", "/tickets", json={})
+
+    assert response.status_code == 503
+    assert len(requests) == 2
+
+
+async def test_retries_stop_after_max_attempts(make_client):
+    handler, requests = scripted(*[httpx.ReadTimeout("slow")] * 3)
+    client = make_client(handler, retry_policy=RecordingPolicy(max_attempts=3))
+
+    with pytest.raises(httpx.ReadTimeout):
+        await client.list_projects()
+    assert len(requests) == 3
+
+
+def test_breaker_opens_after_threshold_and_fails_fast():
+    breaker = CircuitBreaker(failure_threshold=2, reset_timeout=30)
+    breaker.before_request()
+    breaker.record_failure()
+    assert breaker.state == CircuitBreaker.CLOSED
+
+    breaker.record_failure()
+    assert breaker.state == CircuitBreaker.OPEN
+    with pytest.raises(CircuitOpenError):
+        breaker.before_request()
+    assert breaker.snapshot()["retry_in_seconds"] > 0
+
+
+def test_breaker_lets_one_probe_through_after_reset_timeout():
+    breaker = CircuitBreaker(failure_threshold=1, reset_timeout=30)
+    breaker.record_failure()
+    breaker.opened_at = time.monotonic() - 31
+
+    breaker.before_request()
+    assert breaker.state == CircuitBreaker.HALF_OPEN
+    with pytest.raises(CircuitOpenError):
+        breaker.before_request()  # Probe already in flight
+
+    breaker.record_success()
+    assert breaker.state == CircuitBreaker.CLOSED
+    assert breaker.consecutive_failures == 0
+
+
+def test_failed_probe_reopens_the_circuit():
+    breaker = CircuitBreaker(failure_threshold=3, reset_timeout=30)
+    for _ in range(3):
+        breaker.record_failure()
+    breaker.opened_at = time.monotonic() - 31
+
+    breaker.before_request()
+    breaker.record_failure()
+
+    assert breaker.state == CircuitBreaker.OPEN
+    with pytest.raises(CircuitOpenError):
+        breaker.before_request()
+
+
+async def test_client_opens_the_circuit_on_server_errors(make_client):
+    handler, requests = scripted(*[envelope(None, status=500)] * 2)
+    client = make_client(
+        handler,
+        retry_policy=RetryPolicy(max_attempts=1),
+        circuit_breaker=CircuitBreaker(failure_threshold=2),
+    )
+
+    for _ in range(2):
+        with pytest.raises(httpx.HTTPStatusError):
+            await client.list_projects()
+    with pytest.raises(CircuitOpenError):
+        await client.list_projects()
+    assert len(requests) == 2
@@ -0,0 +1,67 @@
+"""Reply cache: cacheability, session scoping and invalidation by data version."""
+
+import pytest
+
+from src.agent.response_cache import AgentResponseCache, normalize_message
+
+VERSIONS = {"projects": 0, "tickets": 0}
+
+
+def turn(tool: str = "list_projects", success: bool = True, response: str = "Two projects"):
+    return {
+        "response": response,
+        "actions_taken": [{"tool": tool, "args": {}, "result": {"success": success}}],
+    }
+
+
+def test_normalize_message_drops_filler_and_rejects_references():
+    assert normalize_message("What projects do I have?") == normalize_message("list my projects")
+    assert normalize_message("What's in it?") is None
+    assert normalize_message("   ") is None
+
+
+def test_reply_is_reused_in_the_same_session():
+    cache = AgentResponseCache()
+    assert cache.put("u", "s1", "list my projects", turn(), VERSIONS)
+
+    cached = cache.get("u", "s1", "What projects do I have?", VERSIONS)
+
+    assert cached is not None
+    assert cached.response == "Two projects"
+
+
+def test_reply_is_not_shared_across_sessions_or_users():
+    cache = AgentResponseCache()
+    cache.put("u", "s1", "list my projects", turn(), VERSIONS)
+
+    assert cache.get("u", "s2", "list my projects", VERSIONS) is None
+    assert cache.get("other", "s1", "list my projects", VERSIONS) is None
+
+
+@pytest.mark.parametrize(
+    "result",
+    [
+        turn(tool="move_ticket"),
+        turn(success=False),
+        turn(response=""),
+        {"response": "Hello!", "actions_taken": []},
+    ],
+)
+def test_only_successful_read_only_turns_are_cached(result):
+    cache = AgentResponseCache()
+    assert not cache.put("u", "s", "list my projects", result, VERSIONS)
+
+
+def test_mutation_of_a_read_resource_makes_the_reply_stale():
+    cache = AgentResponseCache()
+    cache.put("u", "s", "list my projects", turn(), VERSIONS)
+
+    assert cache.get("u", "s", "list my projects", {"projects": 0, "tickets": 5}) is not None
+    assert cache.get("u", "s", "list my projects", {"projects": 1, "tickets": 5}) is None
+    assert cache.stats()["size"] == 0
+
+
+def test_zero_size_disables_the_cache():
+    cache = AgentResponseCache(maxsize=0)
+    cache.put("u", "s", "list my projects", turn(), VERSIONS)
+    assert cache.get("u", "s", "list my projects", VERSIONS) is None
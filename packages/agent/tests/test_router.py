@@ -0,0 +1,123 @@
+"""Fast-path command routing, in particular when a move may skip the agent."""
+
+from urllib.parse import parse_qs
+
+import httpx
+import pytest
+
+from src.agent.router import FastPathRouter
+from tests.fakes import envelope, ticket
+
+TICKETS = [
+    ticket("t-1", "Fix login bug"),
+    ticket("t-2", "Fix login bug on mobile"),
+    ticket("t-3", "Update docs"),
+    ticket("t-4", "Update docs"),
+]
+
+
+async def tickets_handler(request: httpx.Request) -> httpx.Response:
+    query = {k: v[-1] for k, v in parse_qs(request.url.query.decode()).items()}
+    needle = query.get("search", "").lower()
+    items = [t for t in TICKETS if needle in t["title"].lower()]
+    return envelope({"items": items, "total": len(items), "page": 1, "pageSize": 100})
+
+
+class Tools:
+    """Stand-ins for the agent's tool functions that record their calls."""
+
+    def __init__(self) -> None:
+        self.calls: list[tuple[str, dict]] = []
+
+        async def move_ticket(ticket_id: str, new_status: str) -> dict:
+            self.calls.append(("move_ticket", {"ticket_id": ticket_id, "new_status": new_status}))
+            return {"success": True, "message": f"Moved '{ticket_id}' to {new_status}"}
+
+        async def list_projects() -> dict:
+            self.calls.append(("list_projects", {}))
+            return {"success": True, "projects": [{"name": "Web", "key": "WEB"}]}
+
+        async def get_board_summary(project_id: str = "") -> dict:
+            self.calls.append(("get_board_summary", {"project_id": project_id}))
+            return {"success": True, "projects": []}
+
+        self.functions = [move_ticket, list_projects, get_board_summary]
+
+
+@pytest.fixture
+def tools():
+    return Tools()
+
+
+@pytest.fixture
+def router(make_client, tools):
+    return FastPathRouter(tools.functions, make_client(tickets_handler))
+
+
+@pytest.mark.parametrize(
+    "message, tool, args",
+    [
+        ("list my projects", "list_projects", {}),
+        ("Please show me the board.", "get_board_summary", {}),
+        ("board summary for web", "get_board_summary", {"project_id": "web"}),
+        (
+            "move 'Fix Login Bug' to in progress",
+            "move_ticket",
+            {"ticket_id": "Fix Login Bug", "new_status": "IN_PROGRESS"},
+        ),
+    ],
+)
+def test_match_recognises_commands(message, tool, args):
+    route = FastPathRouter([]).match(message)
+    assert route is not None
+    assert (route.tool, route.args) == (tool, args)
+
+
+def test_match_ignores_other_messages():
+    assert FastPathRouter([]).match("why is the board so full?") is None
+
+
+async def test_move_with_pronoun_goes_to_the_agent(router, tools):
+    assert await router.handle("move it to done") is None
+    assert await router.handle("move that one to done") is None
+    assert tools.calls == []
+
+
+async def test_move_with_partial_title_goes_to_the_agent(router, tools):
+    # "login" matches two tickets and neither title exactly
+    assert await router.handle("move login to done") is None
+    assert tools.calls == []
+
+
+async def test_move_with_duplicate_title_goes_to_the_agent(router, tools):
+    assert await router.handle("move update docs to done") is None
+    assert tools.calls == []
+
+
+async def test_move_with_unique_exact_title_uses_the_ticket_id(router, tools):
+    reply = await router.handle("move fix login bug to done")
+
+    assert reply is not None
+    assert tools.calls == [("move_ticket", {"ticket_id": "t-1", "new_status": "DONE"})]
+    assert router.stats()["hits"] == 1
+
+
+async def test_move_with_quoted_title_is_passed_through(router, tools):
+    reply = await router.handle('move "Fix login bug on mobile" to blocked')
+
+    assert reply is not None
+    assert tools.calls == [
+        ("move_ticket", {"ticket_id": "Fix login bug on mobile", "new_status": "BLOCKED"})
+    ]
+
+
+async def test_unquoted_move_needs_a_client_to_check_the_title(tools):
+    router = FastPathRouter(tools.functions)
+
+    assert await router.handle("move fix login bug to done") is None
+    assert tools.calls == []
+
+
+async def test_disabled_router_never_answers(make_client, tools):
+    router = FastPathRouter(tools.functions, make_client(tickets_handler), enabled=False)
+    assert await router.handle("list projects") is None
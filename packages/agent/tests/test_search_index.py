@@ -0,0 +1,127 @@
+"""BM25 ranking of the local ticket index and confident title lookups."""
+
+from urllib.parse import parse_qs
+
+import httpx
+import pytest
+
+from src.api.schemas import Ticket
+from src.api.search_index import AmbiguousTicketError, TicketSearchIndex, tokenize
+from tests.fakes import envelope, ticket
+
+TICKETS = [
+    ticket("t-1", "Fix login redirect", description="Users land on a blank page"),
+    ticket("t-2", "Checkout times out", description="Payment provider is slow on login"),
+    ticket("t-3", "Add dark mode", project_id="id-p2"),
+    ticket("t-4", "Speed up search", description="search search search"),
+    ticket("t-5", "Update onboarding docs"),
+    ticket("t-6", "Update billing docs"),
+]
+
+
+@pytest.fixture
+def index():
+    index = TicketSearchIndex()
+    index.add_many(Ticket.model_validate(t) for t in TICKETS)
+    return index
+
+
+def ids(results):
+    return [ticket.id for ticket, _ in results]
+
+
+def test_tokenize():
+    assert tokenize("Fix: Login-redirect (v2)") == ["fix", "login", "redirect", "v2"]
+    assert tokenize(None) == []
+
+
+def test_title_matches_rank_above_description_matches(index):
+    assert ids(index.search("login")) == ["t-1", "t-2"]
+
+
+def test_prefixes_and_typos_are_tolerated(index):
+    assert ids(index.search("checkou"))[0] == "t-2"
+    assert ids(index.search("redirct"))[0] == "t-1"
+
+
+def test_search_can_be_limited_to_a_project(index):
+    assert ids(index.search("dark mode", project_id="id-p2")) == ["t-3"]
+    assert index.search("dark mode", project_id="id-p1") == []
+
+
+def test_updates_and_removals_are_reflected(index):
+    index.add(Ticket.model_validate(ticket("t-1", "Fix logout redirect")))
+    index.remove("t-2")
+
+    assert index.search("login") == []
+    assert ids(index.search("logout")) == ["t-1"]
+    assert len(index) == 5
+
+
+def test_find_by_title_prefers_exact_matches(index):
+    assert index.find_by_title("fix  LOGIN redirect").id == "t-1"
+
+
+def test_find_by_title_accepts_a_clear_winner(index):
+    assert index.find_by_title("checkout timeout").id == "t-2"
+
+
+def test_find_by_title_rejects_close_contenders(index):
+    assert index.find_by_title("update docs") is None
+
+
+def test_find_by_title_rejects_weak_matches(index):
+    assert index.find_by_title("blank") is None  # Only in a description
+    assert index.find_by_title("nothing like it") is None
+
+
+def test_find_by_title_reports_duplicate_titles(index):
+    index.add(Ticket.model_validate(ticket("t-7", "Add dark mode")))
+
+    with pytest.raises(AmbiguousTicketError, match="t-3"):
+        index.find_by_title("add dark mode")
+
+
+def backend(requests: list[httpx.Request]):
+    async def handler(request: httpx.Request) -> httpx.Response:
+        requests.append(request)
+        query = {k: v[-1] for k, v in parse_qs(request.url.query.decode()).items()}
+        needle = query.get("search", "").lower()
+        items = [
+            t
+            for t in TICKETS
+            if needle in t["title"].lower() or needle in (t["description"] or "").lower()
+        ]
+        return envelope({"items": items, "total": len(items), "page": 1, "pageSize": 100})
+
+    return handler
+
+
+async def test_client_asks_the_backend_when_the_index_is_not_confident(make_client):
+    requests: list[httpx.Request] = []
+    client = make_client(backend(requests), search_index=True)
+    await client.get_search_index()
+    requests.clear()
+
+    found = await client.find_ticket_by_title("boarding")
+
+    assert found.id == "t-5"
+    assert len(requests) == 1  # The index's fuzzy hit was too weak to trust on its own
+
+
+async def test_client_uses_a_confident_index_hit(make_client):
+    requests: list[httpx.Request] = []
+    client = make_client(backend(requests), search_index=True)
+    await client.get_search_index()
+    requests.clear()
+
+    assert (await client.find_ticket_by_title("Fix login redirect")).id == "t-1"
+    assert requests == []
+
+
+async def test_client_reports_ambiguous_partial_titles(make_client):
+    client = make_client(backend([]))
+
+    with pytest.raises(AmbiguousTicketError):
+        await client.find_ticket_by_title("docs")
+    assert await client.find_ticket_by_title("no such ticket") is None
@@ -0,0 +1,119 @@
+"""Session stores: in-memory LRU/TTL bounds and SQLite persistence."""
+
+import time
+
+import pytest
+from google.adk.events import Event, EventActions
+from google.adk.sessions.base_session_service import GetSessionConfig
+from google.genai import types
+
+from src.session.store import BoundedInMemorySessionService, SqliteSessionService
+
+APP = "task_assistant"
+
+
+def message(text: str, author: str = "user", **state_delta) -> Event:
+    role = "user" if author == "user" else "model"
+    return Event(
+        invocation_id="inv",
+        author=author,
+        content=types.Content(role=role, parts=[types.Part(text=text)]),
+        actions=EventActions(state_delta=state_delta),
+    )
+
+
+async def test_memory_store_evicts_least_recently_used():
+    store = BoundedInMemorySessionService(max_sessions=2)
+    for session_id in ("a", "b"):
+        await store.create_session(app_name=APP, user_id="u", session_id=session_id)
+    await store.get_session(app_name=APP, user_id="u", session_id="a")
+    await store.create_session(app_name=APP, user_id="u", session_id="c")
+
+    assert await store.session_count() == 2
+    assert await store.get_session(app_name=APP, user_id="u", session_id="b") is None
+    assert await store.get_session(app_name=APP, user_id="u", session_id="a") is not None
+
+
+async def test_memory_store_expires_idle_sessions():
+    store = BoundedInMemorySessionService(ttl_seconds=60)
+    await store.create_session(app_name=APP, user_id="u", session_id="old")
+    await store.create_session(app_name=APP, user_id="u", session_id="new")
+    store._last_access[(APP, "u", "old")] = time.monotonic() - 61
+
+    assert await store.get_session(app_name=APP, user_id="u", session_id="old") is None
+    assert await store.purge_expired() == 0
+    assert await store.session_count() == 1
+
+
+async def test_memory_store_append_keeps_session_alive():
+    store = BoundedInMemorySessionService(ttl_seconds=60)
+    session = await store.create_session(app_name=APP, user_id="u", session_id="s")
+    store._last_access[(APP, "u", "s")] = time.monotonic() - 59
+
+    await store.append_event(session, message("hello"))
+
+    assert await store.purge_expired() == 0
+    loaded = await store.get_session(app_name=APP, user_id="u", session_id="s")
+    assert [e.content.parts[0].text for e in loaded.events] == ["hello"]
+
+
+@pytest.fixture
+def db_path(tmp_path):
+    return str(tmp_path / "sessions.db")
+
+
+async def test_sqlite_store_persists_events_and_state(db_path):
+    store = SqliteSessionService(db_path)
+    session = await store.create_session(app_name=APP, user_id="u", state={"theme": "dark"})
+    await store.append_event(session, message("hi"))
+    await store.append_event(session, message("hello", author="agent", project="P1"))
+
+    reopened = SqliteSessionService(db_path)
+    loaded = await reopened.get_session(app_name=APP, user_id="u", session_id=session.id)
+
+    assert [e.content.parts[0].text for e in loaded.events] == ["hi", "hello"]
+    assert loaded.state == {"theme": "dark", "project": "P1"}
+    assert await reopened.session_count() == 1
+
+
+async def test_sqlite_store_limits_recent_events(db_path):
+    store = SqliteSessionService(db_path)
+    session = await store.create_session(app_name=APP, user_id="u")
+    for text in ("one", "two", "three"):
+        await store.append_event(session, message(text))
+
+    loaded = await store.get_session(
+        app_name=APP,
+        user_id="u",
+        session_id=session.id,
+        config=GetSessionConfig(num_recent_events=2),
+    )
+
+    assert [e.content.parts[0].text for e in loaded.events] == ["two", "three"]
+
+
+async def test_sqlite_store_expires_and_bounds_sessions(db_path):
+    store = SqliteSessionService(db_path, max_sessions=2, ttl_seconds=60)
+    for session_id in ("a", "b", "c"):
+        await store.create_session(app_name=APP, user_id="u", session_id=session_id)
+    with store._connect() as conn:
+        conn.execute("UPDATE sessions SET update_time = update_time - 120 WHERE id = 'a'")
+
+    assert await store.get_session(app_name=APP, user_id="u", session_id="a") is None
+    await store.create_session(app_name=APP, user_id="u", session_id="d")
+    assert await store.purge_expired() == 1  # "b" is the oldest beyond max_sessions
+
+    remaining = await store.list_sessions(app_name=APP, user_id="u")
+    assert sorted(s.id for s in remaining.sessions) == ["c", "d"]
+    assert await store.session_count() == 2
+
+
+async def test_sqlite_store_delete_session(db_path):
+    store = SqliteSessionService(db_path)
+    session = await store.create_session(app_name=APP, user_id="u")
+    await store.append_event(session, message("hi"))
+
+    await store.delete_session(app_name=APP, user_id="u", session_id=session.id)
+
+    assert await store.get_session(app_name=APP, user_id="u", session_id=session.id) is None
+    assert await store.session_count() == 0
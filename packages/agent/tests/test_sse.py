@@ -0,0 +1,87 @@
+"""SSE frames: exact bytes, sequential ids and the compact done event."""
+
+import json
+from datetime import UTC, datetime
+
+import pytest
+
+from src import sse
+from src.api.schemas import Project, TicketStatus
+from src.sse import SSEEncoder, dumps
+from tests.fakes import project
+
+
+@pytest.fixture(autouse=True, params=["orjson", "json"])
+def encoding(request, monkeypatch):
+    """Run every test with orjson (when installed) and with the stdlib fallback."""
+    if request.param == "json":
+        monkeypatch.setattr(sse, "orjson", None)
+    elif sse.orjson is None:
+        pytest.skip("orjson is not installed")
+    return request.param
+
+
+def data_of(frame: bytes) -> dict:
+    line = next(line for line in frame.split(b"\r\n") if line.startswith(b"data: "))
+    return json.loads(line[len(b"data: ") :])
+
+
+def test_frame_bytes():
+    encoder = SSEEncoder()
+
+    assert encoder.frame("text", {"content": "hi"}, 3) == (
+        b'id: 3\r\nevent: text\r\ndata: {"content":"hi"}\r\n\r\n'
+    )
+    assert encoder.frame("ping", {}) == b"event: ping\r\ndata: {}\r\n\r\n"
+
+
+def test_newlines_stay_escaped_and_text_stays_utf8():
+    frame = SSEEncoder(sep=b"\n").encode({"type": "text", "content": "line one\nlíne two"})
+
+    assert frame.count(b"\n") == 4  # id, event and data lines, then the blank line
+    assert "líne".encode() in frame
+    assert data_of(frame.replace(b"\n", b"\r\n"))["content"] == "line one\nlíne two"
+
+
+def test_frames_get_sequential_ids():
+    encoder = SSEEncoder()
+    frames = [encoder.encode({"type": "text", "content": str(i)}) for i in range(3)]
+    frames.append(encoder.error("boom"))
+
+    assert [f.split(b"\r\n")[0] for f in frames] == [b"id: 0", b"id: 1", b"id: 2", b"id: 3"]
+    assert b"event: error" in frames[3]
+
+
+def test_done_points_at_earlier_frames_instead_of_repeating_them():
+    encoder = SSEEncoder()
+    result = {"success": True, "tickets": [{"id": "t-1"}] * 50}
+    unanswered = {"tool": "get_ticket", "args": {"ticket_id": "x"}}
+    action = {"tool": "list_tickets", "args": {}, "result": result, "duration_ms": 12.5}
+
+    encoder.encode({"type": "tool_call", "tool": "list_tickets", "args": {}})
+    encoder.encode({"type": "tool_result", "tool": "list_tickets", "result": result})
+    encoder.encode({"type": "tool_call", **unanswered})
+    done = encoder.encode({"type": "done", "actions_taken": [action, unanswered]})
+
+    assert data_of(done)["actions_taken"] == [
+        {"tool": "list_tickets", "call_event": 0, "result_event": 1, "duration_ms": 12.5},
+        {"tool": "get_ticket", "call_event": 2},
+    ]
+    assert b"t-1" not in done
+
+
+def test_dumps_handles_tool_result_types():
+    created = datetime(2025, 1, 2, 3, 4, 5, tzinfo=UTC)
+    payload = {
+        "at": created,
+        "status": TicketStatus.DONE,
+        "project": Project.model_validate(project("P1")),
+        "tags": {"a"},
+    }
+
+    decoded = json.loads(dumps(payload))
+
+    assert decoded["at"].startswith("2025-01-02T03:04:05")
+    assert decoded["status"] == "DONE"
+    assert decoded["project"]["key"] == "P1"
+    assert decoded["tags"] == ["a"]
@@ -0,0 +1,137 @@
+"""Ticket replica: watermark-based incremental sync and full reconciliation."""
+
+import httpx
+import pytest
+
+from benchmarks.fake_backend import FakeBackend
+from src.api.schemas import Ticket
+from src.api.sync import TicketReplica
+from tests.fakes import ticket
+
+
+@pytest.fixture
+def backend():
+    backend = FakeBackend(seed=3)
+    backend.seed(projects=2, tickets_per_project=60)
+    return backend
+
+
+@pytest.fixture
+def client(make_client, backend):
+    return make_client(backend.handle)
+
+
+def touch(backend: FakeBackend, ticket_id: str, **changes) -> None:
+    """Change a ticket on the backend, as another client would."""
+    backend.tickets[ticket_id].update(changes, updatedAt=backend._now())
+
+
+async def test_first_sync_is_a_full_pass(client, backend):
+    result = await client.sync_tickets()
+
+    assert result.full
+    assert len(result.changed) == len(backend.tickets) == len(client.replica)
+    assert client.replica.ready
+
+
+async def test_incremental_sync_reads_only_recent_changes(client, backend):
+    await client.sync_tickets()
+    ticket_id = next(iter(backend.tickets))
+    touch(backend, ticket_id, title="Renamed elsewhere")
+    backend.requests.clear()
+
+    result = await client.sync_tickets()
+
+    assert not result.full
+    assert [t.id for t in result.changed] == [ticket_id]
+    assert client.replica.tickets[ticket_id].title == "Renamed elsewhere"
+    assert backend.requests["GET /tickets"] == 1
+
+
+def last_in_board_order(backend: FakeBackend) -> str:
+    """The ticket the backend lists last: it orders by status and position first."""
+    return max(backend.tickets.values(), key=lambda t: (t["status"], t["position"]))["id"]
+
+
+async def test_incremental_sync_finds_changes_late_in_board_order(client, backend):
+    await client.sync_tickets()
+    ticket_id = last_in_board_order(backend)
+    touch(backend, ticket_id, title="Renamed elsewhere")
+
+    result = await client.sync_tickets()
+
+    assert [t.id for t in result.changed] == [ticket_id]
+    assert client.replica.tickets[ticket_id].title == "Renamed elsewhere"
+
+
+async def test_incremental_sync_without_updated_since_support(make_client, backend):
+    async def handle(request: httpx.Request) -> httpx.Response:
+        # A backend from before the filter: the parameter is ignored
+        url = request.url.copy_remove_param("updatedSince")
+        return await backend.handle(httpx.Request(request.method, url, headers=request.headers))
+
+    client = make_client(handle)
+    await client.sync_tickets()
+    ticket_id = last_in_board_order(backend)
+    touch(backend, ticket_id, title="Renamed elsewhere")
+
+    result = await client.sync_tickets()
+
+    assert not result.full
+    assert [t.id for t in result.changed] == [ticket_id]
+    assert client.replica.tickets[ticket_id].title == "Renamed elsewhere"
+
+
+async def test_incremental_sync_with_no_changes_changes_nothing(client):
+    await client.sync_tickets()
+    version = client.data_versions["tickets"]
+
+    result = await client.sync_tickets()
+
+    assert result.changed == [] and result.deleted == []
+    assert client.data_versions["tickets"] == version
+
+
+async def test_reconciliation_finds_deleted_tickets(client, backend):
+    await client.sync_tickets()
+    ticket_id = next(iter(backend.tickets))
+    del backend.tickets[ticket_id]
+
+    assert (await client.sync_tickets()).deleted == []  # Incremental passes can't see deletes
+    result = await client.sync_tickets(full=True)
+
+    assert result.full
+    assert result.deleted == [ticket_id]
+    assert ticket_id not in client.replica.tickets
+
+
+async def test_reconcile_interval_forces_a_full_pass(client):
+    await client.sync_tickets()
+    assert (await client.sync_tickets(reconcile_interval=0)).full
+
+
+def test_replica_ignores_older_copies_and_advances_the_watermark():
+    replica = TicketReplica()
+    newer = Ticket.model_validate(ticket("t-1", "New", updated_at="2025-01-02T00:00:00Z"))
+    older = Ticket.model_validate(ticket("t-1", "Old", updated_at="2025-01-01T00:00:00Z"))
+
+    assert replica.apply_incremental([newer]).changed == [newer]
+    assert replica.apply_incremental([older]).changed == []
+    assert replica.tickets["t-1"].title == "New"
+    assert replica.watermark == newer.updated_at
+    assert not replica.ready
+
+
+def test_reconciliation_keeps_tickets_changed_while_listing():
+    replica = TicketReplica()
+    old = Ticket.model_validate(ticket("t-1", "Old", updated_at="2025-01-01T00:00:00Z"))
+    fresh = Ticket.model_validate(ticket("t-2", "Fresh", updated_at="2025-01-03T00:00:00Z"))
+    listed = Ticket.model_validate(ticket("t-3", "Listed", updated_at="2025-01-02T00:00:00Z"))
+    replica.apply_incremental([old, fresh])
+
+    # The listing started at a watermark of Jan 2 and missed both t-1 and t-2
+    result = replica.reconcile([listed], reconciled_at=1.0, since=listed.updated_at)
+
+    assert result.deleted == ["t-1"]
+    assert set(replica.tickets) == {"t-2", "t-3"}
+    assert replica.ready
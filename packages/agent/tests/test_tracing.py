@@ -0,0 +1,115 @@
+"""Trace spans: nesting, task inheritance, begin/end pairs and JSONL export."""
+
+import asyncio
+import json
+
+import pytest
+
+from benchmarks.fake_backend import FakeBackend
+from benchmarks.scenarios import Scenario
+from src import tracing
+
+
+def by_name(waterfall: dict) -> dict[str, dict]:
+    return {span["name"]: span for span in waterfall["spans"]}
+
+
+def test_spans_are_no_ops_outside_a_trace():
+    with tracing.span("http") as span:
+        assert span is None
+    tracing.begin("model", "model")
+    tracing.end("model")
+    with tracing.trace("chat", enabled=False) as trace:
+        assert trace is None
+
+
+def test_spans_nest_under_the_current_span():
+    with tracing.trace("chat", user="u") as trace:
+        with tracing.span("tool:list_tickets", tool="list_tickets"):
+            with tracing.span("http", method="GET") as http:
+                http.attributes["status"] = 200
+        with tracing.span("session.save"):
+            pass
+
+    spans = by_name(trace.waterfall())
+
+    assert spans["chat"]["parent_id"] is None and spans["chat"]["depth"] == 0
+    assert spans["tool:list_tickets"]["parent_id"] == spans["chat"]["id"]
+    assert spans["http"]["parent_id"] == spans["tool:list_tickets"]["id"]
+    assert spans["http"]["depth"] == 2
+    assert spans["http"]["attributes"] == {"method": "GET", "status": 200}
+    assert spans["session.save"]["depth"] == 1
+    assert all(span["duration_ms"] is not None for span in spans.values())
+
+
+async def test_tasks_inherit_the_span_they_were_started_in():
+    async def request(n: int) -> None:
+        with tracing.span("http", n=n):
+            await asyncio.sleep(0)
+
+    with tracing.trace("chat") as trace:
+        with tracing.span("tool:bulk_move_tickets") as tool:
+            await asyncio.gather(request(1), request(2))
+
+    https = [s for s in trace.waterfall()["spans"] if s["name"] == "http"]
+    assert [s["parent_id"] for s in https] == [tool.span_id, tool.span_id]
+
+
+def test_a_failing_block_marks_its_span():
+    with tracing.trace("chat") as trace:
+        with pytest.raises(KeyError):
+            with tracing.span("tool:get_ticket"):
+                raise KeyError("t-1")
+
+    assert by_name(trace.waterfall())["tool:get_ticket"]["attributes"] == {"error": "KeyError"}
+
+
+def test_begin_and_end_pair_a_span_across_callbacks():
+    with tracing.trace("chat") as trace:
+        tracing.begin("model", "model", model="m")
+        with tracing.span("session.load") as load:
+            pass
+        tracing.end("model", prompt_tokens=10)
+        tracing.begin("model", "model", model="m")  # Never ended
+
+    models = [s for s in trace.spans if s.name == "model"]
+    assert load.parent_id == trace.root.span_id  # begin() doesn't make the span current
+    assert models[0].attributes == {"model": "m", "prompt_tokens": 10}
+    assert models[1].attributes == {"model": "m", "unfinished": True}
+    assert all(s.end_time is not None for s in trace.spans)
+
+
+def test_export_appends_one_json_line_per_span(tmp_path):
+    path = tmp_path / "traces.jsonl"
+    for _ in range(2):
+        with tracing.trace("chat") as trace:
+            with tracing.span("http"):
+                pass
+        trace.export(str(path))
+
+    records = [json.loads(line) for line in path.read_text().splitlines()]
+
+    assert [r["name"] for r in records] == ["chat", "http", "chat", "http"]
+    assert records[0]["trace_id"] == records[1]["trace_id"] != records[2]["trace_id"]
+    assert records[1]["timestamp"] >= records[0]["timestamp"]
+    assert {"id", "parent_id", "depth", "start_ms", "duration_ms", "attributes"} <= set(records[0])
+
+
+async def test_chat_returns_the_turns_waterfall(make_agent):
+    backend = FakeBackend(seed=6)
+    backend.seed(projects=1, tickets_per_project=3)
+    board = Scenario("board", "How is it going?", ((("get_board_summary", {}),),), "Fine.")
+    service = make_agent(backend, [board])
+
+    result = await service.chat(board.message, "u", debug_timing=True)
+    untraced = await service.chat("Anything else?", "u")
+
+    spans = result["trace"]["spans"]
+    names = [s["name"] for s in spans]
+    ids = {s["id"]: s for s in spans}
+    assert names[0] == "chat" and "session.load" in names
+    assert names.count("model") == 2  # The tool step and the reply
+    tool = next(s for s in spans if s["name"] == "tool:get_board_summary")
+    https = [s for s in spans if s["name"] == "http"]
+    assert https and all(ids[s["parent_id"]]["name"] == tool["name"] for s in https)
+    assert "trace" not in untraced
@@ -127,6 +127,23 @@ describe("Tickets API", () => {
       expect(response.body.data.items[0].description).toContain("searchable");
     });
 
+    it("should filter by updatedSince", async () => {
+      const ticket = await prisma.ticket.findFirstOrThrow({ where: { title: "Second ticket" } });
+      const since = new Date(Date.now() + 1000);
+      await prisma.ticket.update({
+        where: { id: ticket.id },
+        data: { title: "Second ticket renamed", updatedAt: since },
+      });
+
+      const response = await request(app)
+        .get("/tickets")
+        .query({ updatedSince: since.toISOString() });
+
+      expect(response.status).toBe(200);
+      expect(response.body.data.total).toBe(1);
+      expect(response.body.data.items[0].id).toBe(ticket.id);
+    });
+
     it("should combine multiple filters", async () => {
       const response = await request(app)
         .get("/tickets")
@@ -209,6 +226,55 @@ describe("Tickets API", () => {
     });
   });
 
+  describe("GET /tickets/counts", () => {
+    let projectId: string;
+
+    beforeEach(async () => {
+      await prisma.ticket.deleteMany();
+      await prisma.project.deleteMany();
+      const project = await createProject();
+      projectId = project.id;
+      await prisma.ticket.createMany({
+        data: [
+          { title: "Todo one", projectId, status: "TODO" },
+          { title: "Todo two", projectId, status: "TODO" },
+          { title: "Blocked one", projectId, status: "BLOCKED" },
+        ],
+      });
+    });
+
+    it("should count tickets grouped by project and status", async () => {
+      const response = await request(app).get("/tickets/counts");
+
+      expect(response.status).toBe(200);
+      expect(response.body.data).toEqual(
+        expect.arrayContaining([
+          { projectId, status: "TODO", count: 2 },
+          { projectId, status: "BLOCKED", count: 1 },
+        ])
+      );
+      expect(response.body.data.length).toBe(2);
+    });
+
+    it("should filter counts by projectId", async () => {
+      const other = await createProject();
+      const response = await request(app)
+        .get("/tickets/counts")
+        .query({ projectId: other.id });
+
+      expect(response.status).toBe(200);
+      expect(response.body.data).toEqual([]);
+    });
+
+    it("should return 400 for invalid projectId", async () => {
+      const response = await request(app)
+        .get("/tickets/counts")
+        .query({ projectId: "not-a-uuid" });
+
+      expect(response.status).toBe(400);
+    });
+  });
+
   describe("POST /tickets", () => {
     let projectId: string;
 
@@ -8,6 +8,12 @@ export const getAll = async (req: Request, res: Response) => {
   res.json({ data: tickets });
 };
 
+export const getCounts = async (req: Request, res: Response) => {
+  const { projectId } = req.query as { projectId?: string };
+  const counts = await TicketService.countByStatus(projectId);
+  res.json({ data: counts });
+};
+
 export const getById = async (req: Request, res: Response) => {
   const { id } = req.params;
   const ticket = await TicketService.getById(id);
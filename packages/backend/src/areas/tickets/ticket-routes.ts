@@ -132,6 +132,48 @@ ticketsRouter.get(
   TicketController.getAll
 );
 
+/**
+ * @swagger
+ * /tickets/counts:
+ *   get:
+ *     summary: Count tickets grouped by project and status
+ *     tags: [Tickets]
+ *     parameters:
+ *       - in: query
+ *         name: projectId
+ *         schema:
+ *           type: string
+ *           format: uuid
+ *         required: false
+ *     responses:
+ *       200:
+ *         description: Ticket counts per project and status
+ *         content:
+ *           application/json:
+ *             schema:
+ *               type: array
+ *               items:
+ *                 type: object
+ *                 properties:
+ *                   projectId:
+ *                     type: string
+ *                     format: uuid
+ *                   status:
+ *                     type: string
+ *                     enum: ["TODO", "IN_PROGRESS", "DONE", "BLOCKED"]
+ *                   count:
+ *                     type: integer
+ */
+ticketsRouter.get(
+  "/counts",
+  validate(
+    z.object({
+      query: z.object({ projectId: z.string().uuid().optional() }),
+    })
+  ),
+  TicketController.getCounts
+);
+
 /**
  * @swagger
  * /tickets:
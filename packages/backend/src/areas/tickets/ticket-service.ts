@@ -17,6 +17,7 @@ export const getAll = async (filters: TicketFilterInput) => {
     priority,
     assigneeId,
     search,
+    updatedSince,
     sortBy,
     sortOrder,
     page,
@@ -33,6 +34,7 @@ export const getAll = async (filters: TicketFilterInput) => {
     ...(status && { status }),
     ...(priority && { priority }),
     ...(assigneeId && { assigneeId }),
+    ...(updatedSince && { updatedAt: { gte: updatedSince } }),
     ...(search && {
       OR: [
         {
@@ -66,6 +68,9 @@ export const getAll = async (filters: TicketFilterInput) => {
     if (assigneeId) {
       whereClauses.push(Prisma.sql`"assigneeId" = ${assigneeId}`);
     }
+    if (updatedSince) {
+      whereClauses.push(Prisma.sql`"updatedAt" >= ${updatedSince}`);
+    }
     if (search) {
       const pattern = `%${search}%`;
       whereClauses.push(
@@ -132,6 +137,20 @@ export const getAll = async (filters: TicketFilterInput) => {
   };
 };
 
+export const countByStatus = async (projectId?: string) => {
+  const groups = await prisma.ticket.groupBy({
+    by: ["projectId", "status"],
+    where: projectId ? { projectId } : undefined,
+    _count: { _all: true },
+  });
+
+  return groups.map((group) => ({
+    projectId: group.projectId,
+    status: group.status,
+    count: group._count._all,
+  }));
+};
+
 export const getById = async (id: string) => {
   const ticket = await prisma.ticket.findUnique({
     where: { id },
@@ -6,9 +6,16 @@ export async function POST(request: NextRequest) {
   try {
     const body = await request.json();
 
+    // The agent rate-limits anonymous users by client address
+    const headers: Record<string, string> = { "Content-Type": "application/json" };
+    const forwardedFor = request.headers.get("x-forwarded-for");
+    if (forwardedFor) {
+      headers["X-Forwarded-For"] = forwardedFor;
+    }
+
     const response = await fetch(`${AGENT_URL}/chat/stream`, {
       method: "POST",
-      headers: { "Content-Type": "application/json" },
+      headers,
       body: JSON.stringify({
         message: body.message,
         user_id: body.userId || "default_user",
@@ -2,6 +2,7 @@ export type AgentEventType =
   | "text"
   | "tool_call"
   | "tool_result"
+  | "trace"
   | "done"
   | "error";
 
@@ -22,13 +23,32 @@ export interface AgentToolResultEvent {
   result: Record<string, unknown>;
 }
 
+// Sent before "done" when the request set debug_timing
+export interface AgentTraceEvent {
+  type: "trace";
+  trace_id: string;
+  duration_ms: number | null;
+  spans: Array<{
+    id: number;
+    parent_id: number | null;
+    depth: number;
+    name: string;
+    start_ms: number;
+    duration_ms: number | null;
+    attributes: Record<string, unknown>;
+  }>;
+}
+
 export interface AgentDoneEvent {
   type: "done";
   full_response: string;
   session_id: string;
+  // References to the tool_call / tool_result events by SSE id
   actions_taken: Array<{
     tool: string;
-    args: Record<string, unknown>;
+    call_event?: number;
+    result_event?: number;
+    duration_ms?: number;
   }>;
 }
 
@@ -41,6 +61,7 @@ export type AgentEvent =
   | AgentTextEvent
   | AgentToolCallEvent
   | AgentToolResultEvent
+  | AgentTraceEvent
   | AgentDoneEvent
   | AgentErrorEvent;
 
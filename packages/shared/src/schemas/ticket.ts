@@ -66,6 +66,7 @@ export const TicketFilterSchema = z.object({
   priority: TicketPriority.optional(),
   assigneeId: z.string().uuid().optional(),
   search: z.string().trim().min(1).optional(),
+  updatedSince: z.coerce.date().optional(),
   sortBy: TicketSortBy.default("createdAt"),
   sortOrder: TicketSortOrder.default("desc"),
   page: numberFromQuery("page", 1),